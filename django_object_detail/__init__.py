@@ -1,4 +1,11 @@
-from django_object_detail.config import BadgeConfig, LinkConfig, PropertyConfig, PropertyGroupConfig, x
-
 __version__ = "0.2.0"
-__all__ = ["BadgeConfig", "LinkConfig", "PropertyConfig", "PropertyGroupConfig", "x"]
+__all__ = ["BadgeConfig", "CacheConfig", "LinkConfig", "PropertyConfig", "PropertyGroupConfig", "x"]
+
+
+def __getattr__(name):
+    # The config models import Pydantic, so they are loaded on first access instead of with the app
+    if name in __all__:
+        from django_object_detail import config
+
+        return getattr(config, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
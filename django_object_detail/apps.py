@@ -1,7 +1,13 @@
 from django.apps import AppConfig
+from django.core import checks
 
 
 class DjangoObjectDetailConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "django_object_detail"
     verbose_name = "Django Object Detail"
+
+    def ready(self):
+        from django_object_detail.checks import check_property_configs
+
+        checks.register(check_property_configs)
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+import weakref
+from typing import TYPE_CHECKING, Any, Callable
+
+from django.core.cache import caches
+from django.db import models
+
+from django_object_detail.conf import get_cache_alias
+from django_object_detail.instrumentation import current_recording
+
+if TYPE_CHECKING:
+    from django_object_detail.config import PropertyConfig
+
+KEY_PREFIX = "object_detail"
+
+_POLL_INTERVAL = 0.05
+
+_locks: weakref.WeakValueDictionary[str, threading.Lock] = weakref.WeakValueDictionary()
+_locks_guard = threading.Lock()
+
+
+def _variant(instance: models.Model, config: PropertyConfig, view=None) -> str | None:
+    """Hash of what besides the path determines the value, or None when nothing does.
+
+    That is the ``filter``/``order_by``/``limit`` of the relation and, for
+    view-method properties, the view class.
+    """
+    from django_object_detail.resolvers import relation_query
+
+    parts = []
+    query = relation_query(type(instance), config)
+    if query is not None:
+        parts.append(query.digest)
+    segment = config.path.split("__")[0]
+    if view is not None and not (segment in instance.__dict__ or hasattr(type(instance), segment)):
+        parts.append(f"{type(view).__module__}.{type(view).__qualname__}")
+    if not parts:
+        return None
+    return hashlib.md5(repr(parts).encode(), usedforsecurity=False).hexdigest()[:8]
+
+
+def cache_key(instance: models.Model, config: PropertyConfig, view=None) -> str | None:
+    """Build the cache key for a property of an instance.
+
+    Keys have the form ``object_detail:<model>:<pk>:<path>``, with the result of
+    ``key_fn`` in place of the pk and a ``:<variant>`` suffix (see
+    ``_variant``) when relation options or the view class affect the value.
+    Returns None when no key can be built (unsaved instance without ``key_fn``).
+    """
+    if config.cache.key_fn is not None:
+        ident = config.cache.key_fn(instance)
+    elif instance.pk is None:
+        return None
+    else:
+        ident = instance.pk
+    key = f"{KEY_PREFIX}:{instance._meta.label_lower}:{ident}:{config.path}"
+    variant = _variant(instance, config, view)
+    return f"{key}:{variant}" if variant is not None else key
+
+
+def _local_lock(key: str) -> threading.Lock:
+    with _locks_guard:
+        lock = _locks.get(key)
+        if lock is None:
+            lock = threading.Lock()
+            _locks[key] = lock
+        return lock
+
+
+def get_or_compute(instance: models.Model, config: PropertyConfig, compute: Callable[[], Any], view=None) -> Any:
+    """Return the cached value for a property, computing it on a miss.
+
+    A cold key is computed once: threads of this process wait on a local
+    lock, other processes wait on a lock entry added to the cache, and both
+    re-read the value once the computing caller has stored it.
+    """
+    key = cache_key(instance, config, view)
+    if key is None:
+        return compute()
+
+    recording = current_recording()
+    if recording is not None:
+        compute = recording.track_cache(instance, config, compute)
+
+    cache = caches[config.cache.alias or get_cache_alias()]
+    # Values are stored wrapped in a tuple so that a cached None is a hit
+    hit = cache.get(key)
+    if hit is not None:
+        return hit[0]
+
+    with _local_lock(key):
+        hit = cache.get(key)
+        if hit is not None:
+            return hit[0]
+
+        lock_key = f"{key}:lock"
+        lock_timeout = config.cache.lock_timeout
+        if cache.add(lock_key, True, timeout=lock_timeout):
+            try:
+                value = compute()
+                cache.set(key, (value,), timeout=config.cache.timeout)
+            finally:
+                cache.delete(lock_key)
+            return value
+
+        # Another process is computing the value; wait for it, then give up
+        deadline = time.monotonic() + lock_timeout
+        while time.monotonic() < deadline:
+            time.sleep(_POLL_INTERVAL)
+            hit = cache.get(key)
+            if hit is not None:
+                return hit[0]
+        return compute()
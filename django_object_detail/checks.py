@@ -0,0 +1,26 @@
+import sys
+
+from django.core import checks
+from django.urls import get_resolver
+
+
+def check_property_configs(app_configs=None, **kwargs):
+    """Validate the configs built with ``x()``, which are not validated when they are created."""
+    try:
+        # Importing the URLconf imports the views and the configs they declare
+        get_resolver().url_patterns
+    except Exception:
+        # Reported by Django's own URL checks
+        return []
+    config = sys.modules.get("django_object_detail.config")
+    if config is None:
+        # No config was built, and Pydantic need not be imported to find that out
+        return []
+    return [
+        checks.Error(
+            f"Invalid property config {prop.path!r}: {error}",
+            hint="Fix the arguments passed to x() for this property.",
+            id="django_object_detail.E001",
+        )
+        for prop, error in config.validate_pending()
+    ]
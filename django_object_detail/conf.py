@@ -35,6 +35,10 @@ def get_layout_pack():
     return getattr(settings, "OBJECT_DETAIL_TEMPLATE_PACK_LAYOUT", "split-card")
 
 
+def get_list_layout_pack():
+    return getattr(settings, "OBJECT_DETAIL_TEMPLATE_PACK_LIST_LAYOUT", "table-list")
+
+
 def get_types_pack():
     return getattr(settings, "OBJECT_DETAIL_TEMPLATE_PACK_TYPES", "default")
 
@@ -89,6 +93,70 @@ def build_icon_class(icon_name):
     return f"{base} {prefix}-{icon_name}"
 
 
+def get_lazy_groups():
+    return getattr(settings, "OBJECT_DETAIL_LAZY_GROUPS", True)
+
+
+def get_concurrent_view_methods():
+    return getattr(settings, "OBJECT_DETAIL_CONCURRENT_VIEW_METHODS", False)
+
+
+def get_concurrent_max_workers():
+    return getattr(settings, "OBJECT_DETAIL_CONCURRENT_MAX_WORKERS", 8)
+
+
+def get_concurrent_timeout():
+    return getattr(settings, "OBJECT_DETAIL_CONCURRENT_TIMEOUT", None)
+
+
+def get_cache_alias():
+    return getattr(settings, "OBJECT_DETAIL_CACHE_ALIAS", "default")
+
+
+def get_config_cache_size():
+    return getattr(settings, "OBJECT_DETAIL_CONFIG_CACHE_SIZE", 128)
+
+
+def get_hide_empty():
+    return getattr(settings, "OBJECT_DETAIL_HIDE_EMPTY", False)
+
+
+def get_stream_chunk_size():
+    return getattr(settings, "OBJECT_DETAIL_STREAM_CHUNK_SIZE", 2000)
+
+
+def get_skeleton_render():
+    return getattr(settings, "OBJECT_DETAIL_SKELETON_RENDER", False)
+
+
+def get_skeleton_cache_size():
+    return getattr(settings, "OBJECT_DETAIL_SKELETON_CACHE_SIZE", 256)
+
+
+def get_metrics_enabled():
+    return getattr(settings, "OBJECT_DETAIL_METRICS", False)
+
+
+def get_metrics_window():
+    return getattr(settings, "OBJECT_DETAIL_METRICS_WINDOW", 600)
+
+
+def get_metrics_max_series():
+    return getattr(settings, "OBJECT_DETAIL_METRICS_MAX_SERIES", 2000)
+
+
+def get_metrics_publish_interval():
+    return getattr(settings, "OBJECT_DETAIL_METRICS_PUBLISH_INTERVAL", 60)
+
+
+def get_read_database():
+    return getattr(settings, "OBJECT_DETAIL_READ_DATABASE", None)
+
+
+def get_read_after_write_seconds():
+    return getattr(settings, "OBJECT_DETAIL_READ_AFTER_WRITE_SECONDS", 10)
+
+
 def get_property_text_newline():
     return getattr(settings, "OBJECT_DETAIL_PROPERTY_TEXT_NEWLINE", "linebreaksbr")
 
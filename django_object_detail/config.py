@@ -1,11 +1,24 @@
 from __future__ import annotations
 
+import threading
+import weakref
+from collections import OrderedDict
 from typing import Annotated, Any, Optional
 
 from django.utils.functional import Promise
-from pydantic import BaseModel, ConfigDict, field_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    NonNegativeInt,
+    PositiveInt,
+    ValidationError,
+    field_validator,
+    model_validator,
+)
 from pydantic.functional_validators import PlainValidator
 
+from django_object_detail.conf import get_config_cache_size
+
 
 def _validate_lazy_str(v: Any) -> str | Promise:
     """Accept plain strings and Django lazy translation strings without coercion."""
@@ -20,6 +33,8 @@ LazyStr = Annotated[str, PlainValidator(_validate_lazy_str)]
 class LinkConfig(BaseModel):
     """Configuration for linking a property value to a URL."""
 
+    model_config = ConfigDict(defer_build=True)
+
     url: str
     args: Optional[list[str]] = None
     kwargs: Optional[dict[str, str]] = None
@@ -28,7 +43,7 @@ class LinkConfig(BaseModel):
 class BadgeConfig(BaseModel):
     """Configuration for rendering a property value as a Bootstrap badge."""
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    model_config = ConfigDict(arbitrary_types_allowed=True, defer_build=True)
 
     color: Optional[str] = None
     color_map: Optional[dict] = None
@@ -37,9 +52,22 @@ class BadgeConfig(BaseModel):
     pill: bool = False
 
 
+class CacheConfig(BaseModel):
+    """Configuration for caching a resolved property value in the Django cache."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True, defer_build=True)
+
+    timeout: Optional[float] = 300
+    key_fn: Optional[Any] = None
+    alias: Optional[str] = None
+    lock_timeout: float = 10
+
+
 class PropertyConfig(BaseModel):
     """Configuration for a single property to display."""
 
+    model_config = ConfigDict(defer_build=True)
+
     path: str
     title: Optional[LazyStr] = None
     detail: Optional[LazyStr] = None
@@ -47,6 +75,18 @@ class PropertyConfig(BaseModel):
     template: Optional[str] = None
     link: Optional[LinkConfig] = None
     badge: Optional[BadgeConfig] = None
+    concurrent: Optional[bool] = None
+    timeout: Optional[float] = None
+    fallback: Any = None
+    cache: Optional[CacheConfig] = None
+    nested: Optional[list[PropertyConfig]] = None
+    filter: Optional[dict[str, Any]] = None
+    order_by: Optional[list[str]] = None
+    limit: Optional[NonNegativeInt] = None
+    hide_empty: Optional[bool] = None
+    visible_if: Optional[list[Any]] = None
+    stream: bool = False
+    chunk_size: Optional[PositiveInt] = None
 
     @field_validator("link", mode="before")
     @classmethod
@@ -62,36 +102,217 @@ class PropertyConfig(BaseModel):
             return BadgeConfig(color=v)
         return v
 
+    @field_validator("nested", mode="before")
+    @classmethod
+    def normalize_nested(cls, v):
+        if v is None:
+            return v
+        return _normalize_properties(v)
+
+    @field_validator("order_by", mode="before")
+    @classmethod
+    def normalize_order_by(cls, v):
+        if isinstance(v, str):
+            return [v]
+        return v
+
+    @field_validator("visible_if", mode="before")
+    @classmethod
+    def normalize_visible_if(cls, v):
+        return _normalize_visible_if(v)
+
+    @field_validator("cache", mode="before")
+    @classmethod
+    def normalize_cache(cls, v):
+        if v is True:
+            return CacheConfig()
+        if v is False:
+            return None
+        if isinstance(v, (int, float)):
+            return CacheConfig(timeout=v)
+        return v
+
+    @model_validator(mode="after")
+    def check_stream(self):
+        if self.stream and (self.nested or self.cache is not None):
+            raise ValueError(f"Property {self.path!r}: stream cannot be combined with nested or cache")
+        return self
+
 
 class PropertyGroupConfig(BaseModel):
     """Configuration for a group of properties."""
 
+    model_config = ConfigDict(defer_build=True)
+
     title: LazyStr
     description: Optional[LazyStr] = None
     icon: Optional[str] = None
+    lazy: bool = False
+    hide_empty: Optional[bool] = None
+    visible_if: Optional[list[Any]] = None
     properties: list[PropertyConfig]
 
     @field_validator("properties", mode="before")
     @classmethod
     def normalize_properties(cls, v: list) -> list:
-        result = []
-        for item in v:
-            if isinstance(item, str):
-                result.append(PropertyConfig(path=item))
-            elif isinstance(item, PropertyConfig):
-                result.append(item)
-            elif isinstance(item, dict):
-                result.append(PropertyConfig(**item))
-            else:
-                raise ValueError(f"Invalid property config: {item!r}")
-        return result
+        return _normalize_properties(v)
+
+    @field_validator("visible_if", mode="before")
+    @classmethod
+    def normalize_visible_if(cls, v):
+        return _normalize_visible_if(v)
+
+
+def _normalize_visible_if(v: Any) -> list | None:
+    """Accept a permission string, a ``callable(request, obj)`` or a list of them."""
+    if v is None:
+        return v
+    checks = v if isinstance(v, (list, tuple)) else [v]
+    for check in checks:
+        if not isinstance(check, str) and not callable(check):
+            raise ValueError(f"Expected a permission string or callable in visible_if, got {check!r}")
+    return list(checks)
+
+
+def _normalize_properties(v: list) -> list:
+    result = []
+    for item in v:
+        if isinstance(item, str):
+            result.append(PropertyConfig(path=item))
+        elif isinstance(item, PropertyConfig):
+            _validate_pending(item)
+            result.append(item)
+        elif isinstance(item, dict):
+            result.append(PropertyConfig(**item))
+        else:
+            raise ValueError(f"Invalid property config: {item!r}")
+    return result
+
+
+# Configs built by x() that were not validated yet, by id
+_pending: weakref.WeakValueDictionary[int, PropertyConfig] = weakref.WeakValueDictionary()
+
+
+def _construct(model: type[BaseModel], value: Any, shorthand: str) -> Any:
+    """Build a sub-config from its shorthand or a dict without validation."""
+    if isinstance(value, str):
+        return model.model_construct(**{shorthand: value})
+    if isinstance(value, dict):
+        return model.model_construct(**value)
+    return value
+
+
+def _construct_cache(value: Any) -> Any:
+    if value is True:
+        return CacheConfig.model_construct()
+    if value is False:
+        return None
+    if isinstance(value, (int, float)):
+        return CacheConfig.model_construct(timeout=value)
+    return _construct(CacheConfig, value, "timeout")
+
+
+def _construct_properties(v: list) -> list:
+    """Like ``_normalize_properties`` for trusted input: entries are built by ``x()``."""
+    result = []
+    for item in v:
+        if isinstance(item, str):
+            result.append(x(item))
+        elif isinstance(item, dict):
+            result.append(x(**item))
+        else:
+            result.append(item)
+    return result
+
+
+_SHORTHANDS = {
+    "link": lambda v: _construct(LinkConfig, v, "url"),
+    "badge": lambda v: _construct(BadgeConfig, v, "color"),
+    "cache": _construct_cache,
+    "nested": lambda v: _construct_properties(v) if v is not None else v,
+    "order_by": lambda v: [v] if isinstance(v, str) else v,
+    "visible_if": _normalize_visible_if,
+}
 
 
 def x(path: str, **kwargs) -> PropertyConfig:
-    """Convenience constructor for PropertyConfig."""
-    return PropertyConfig(path=path, **kwargs)
+    """Convenience constructor for PropertyConfig.
+
+    Configs are usually written once in view modules, so ``x()`` only expands
+    the shorthands (``link="url-name"``, ``cache=600``, ...) and skips
+    validation, keeping Pydantic's schema build out of import time. The config
+    is validated when it is first parsed into a group, by ``validate_pending()``
+    or by the ``django_object_detail.E001`` system check.
+    """
+    for name, expand in _SHORTHANDS.items():
+        if name in kwargs:
+            kwargs[name] = expand(kwargs[name])
+    config = PropertyConfig.model_construct(path=path, **kwargs)
+    _pending[id(config)] = config
+    return config
+
+
+def _validate_pending(config: PropertyConfig) -> None:
+    """Validate ``config`` in place if it was built by ``x()`` and not validated yet."""
+    if _pending.get(id(config)) is not config:
+        return
+    data = {}
+    for name in config.model_fields_set:
+        value = getattr(config, name)
+        if isinstance(value, (LinkConfig, BadgeConfig, CacheConfig)):
+            # Built without validation as well; validate them from their fields
+            value = {field: getattr(value, field) for field in value.model_fields_set}
+        data[name] = value
+    validated = PropertyConfig(**data)
+    config.__dict__.update(validated.__dict__)
+    _pending.pop(id(config), None)
+
+
+def validate_pending() -> list[tuple[PropertyConfig, ValidationError]]:
+    """Validate every config built by ``x()`` that was not validated yet.
+
+    Returns the invalid configs with their errors; they stay pending.
+    """
+    errors = []
+    for config in list(_pending.values()):
+        try:
+            _validate_pending(config)
+        except ValidationError as e:
+            errors.append((config, e))
+    return errors
 
 
 def parse_property_display(raw: list[dict]) -> list[PropertyGroupConfig]:
     """Parse a raw property_display list into PropertyGroupConfig objects."""
     return [PropertyGroupConfig(**group) for group in raw]
+
+
+_parsed_cache: OrderedDict[int, tuple[list, list[PropertyGroupConfig]]] = OrderedDict()
+_parsed_cache_lock = threading.Lock()
+
+
+def parse_property_display_cached(raw: list[dict] | list[PropertyGroupConfig]) -> list[PropertyGroupConfig]:
+    """Parse a raw property_display list, reusing earlier results for the same list.
+
+    Results are kept in a bounded LRU keyed by the identity of ``raw``; the raw
+    list is held alongside so its id cannot be reused while cached. Lists that
+    are mutated in place after their first use are not re-parsed.
+    """
+    if raw and isinstance(raw[0], PropertyGroupConfig):
+        return raw
+
+    key = id(raw)
+    with _parsed_cache_lock:
+        entry = _parsed_cache.get(key)
+        if entry is not None and entry[0] is raw:
+            _parsed_cache.move_to_end(key)
+            return entry[1]
+
+    parsed = parse_property_display(raw)
+
+    with _parsed_cache_lock:
+        _parsed_cache[key] = (raw, parsed)
+        _parsed_cache.move_to_end(key)
+        while len(_parsed_cache) > get_config_cache_size():
+            _parsed_cache.popitem(last=False)
+    return parsed
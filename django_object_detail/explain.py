@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import re
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+
+from django.db import connections, models
+from django.test.utils import CaptureQueriesContext
+
+from django_object_detail.config import PropertyGroupConfig
+from django_object_detail.plan import LookupPlan, plan_lookups, plan_property, property_configs
+from django_object_detail.resolvers import resolve_property
+
+_SQL_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+
+
+def normalize_sql(sql: str) -> str:
+    """Replace literals in ``sql`` so that queries differing only in parameters compare equal."""
+    return _SQL_LITERALS.sub("?", sql)
+
+
+@dataclass
+class PropertyReport:
+    """Queries issued while resolving one property of a single object."""
+
+    path: str
+    queries: list[str] = field(default_factory=list)
+    time: float = 0.0
+    items: int = 0
+    planned_queries: int = 0
+    plan: LookupPlan = field(default_factory=LookupPlan)
+
+    @property
+    def repeated(self) -> list[tuple[str, int]]:
+        """Query patterns issued more than once, with their counts."""
+        counts = Counter(normalize_sql(sql) for sql in self.queries)
+        return [(pattern, n) for pattern, n in counts.items() if n > 1]
+
+    @property
+    def n_plus_one(self) -> bool:
+        """Whether rendering this property for every row of a list queries per row.
+
+        Lists load their rows with the relation plan, so only the queries left
+        once the plan is applied are issued per row.
+        """
+        return self.planned_queries > 0
+
+
+@dataclass
+class ExplainReport:
+    model: type[models.Model]
+    pk: object
+    properties: list[PropertyReport]
+    plan: LookupPlan
+
+    @property
+    def total_queries(self) -> int:
+        return sum(len(p.queries) for p in self.properties)
+
+    @property
+    def total_planned_queries(self) -> int:
+        return sum(p.planned_queries for p in self.properties)
+
+
+def _count_items(value) -> int:
+    if value is None:
+        return 0
+    if isinstance(value, list):
+        return len(value)
+    return 1
+
+
+def explain(
+    model: type[models.Model], pk, groups: list[PropertyGroupConfig], view=None, using: str | None = None
+) -> ExplainReport:
+    """Resolve every property of ``groups`` for one object under query capture.
+
+    Each property is resolved against a freshly loaded instance, so queries
+    are attributed to the property that issues them. Each property is then
+    resolved again against an instance loaded with its planned lookups, to
+    show how many queries remain once the plan is applied.
+    """
+    manager = model._default_manager.using(using) if using else model._default_manager
+    connection = connections[using or manager.db]
+
+    reports = []
+    for prop in property_configs(groups):
+        instance = manager.get(pk=pk)
+        report = PropertyReport(path=prop.path, plan=plan_property(model, prop))
+
+        with CaptureQueriesContext(connection) as captured:
+            start = time.perf_counter()
+            resolved = resolve_property(instance, prop, view=view)
+            report.time = time.perf_counter() - start
+        report.queries = [q["sql"] for q in captured.captured_queries]
+        report.items = _count_items(resolved.value)
+
+        instance = report.plan.apply(manager.filter(pk=pk)).get()
+        with CaptureQueriesContext(connection) as captured:
+            resolve_property(instance, prop, view=view)
+        report.planned_queries = len(captured.captured_queries)
+
+        reports.append(report)
+
+    return ExplainReport(model=model, pk=pk, properties=reports, plan=plan_lookups(model, groups))
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import csv
+import datetime
+import json
+import tempfile
+from collections.abc import Iterator
+from typing import Any
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.http import FileResponse, StreamingHttpResponse
+from django.utils import timezone
+from django.utils.functional import Promise
+from django.utils.http import content_disposition_header
+
+from django_object_detail.config import PropertyGroupConfig, parse_property_display_cached
+from django_object_detail.plan import plan_lookups, property_configs
+from django_object_detail.resolvers import ResolvedProperty, StreamedValue, resolve_all, resolve_header, visible_groups
+
+DEFAULT_CHUNK_SIZE = 2000
+
+CONTENT_TYPES = {
+    "csv": "text/csv",
+    "jsonl": "application/jsonl",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+
+def export_columns(model: type[models.Model], groups: list[PropertyGroupConfig]) -> list[tuple[str, str]]:
+    """Return ``(path, label)`` for every property, in display order."""
+    return [(prop.path, str(resolve_header(model, prop)[0])) for prop in property_configs(groups)]
+
+
+def export_value(prop: ResolvedProperty) -> Any:
+    """Reduce a resolved property to a JSON-compatible value for export."""
+    if prop.badge_label is not None:
+        return str(prop.badge_label)
+    return _primitive(prop.value)
+
+
+def _primitive(value: Any) -> Any:
+    if isinstance(value, (models.Model, Promise)):
+        return str(value)
+    if isinstance(value, (list, tuple, StreamedValue)):
+        return [_primitive(item) for item in value]
+    return value
+
+
+def export_groups(groups: list[PropertyGroupConfig] | list[dict], view=None, request=None) -> list[PropertyGroupConfig]:
+    """Parse ``groups`` without the groups and properties whose ``visible_if`` fails for ``request``.
+
+    ``request`` defaults to ``view.request``. The checks run once for the
+    whole export, with ``obj=None``; without a request, permission checks fail.
+    """
+    if request is None:
+        request = getattr(view, "request", None)
+    return visible_groups(parse_property_display_cached(groups), request, None)
+
+
+def iter_export_rows(
+    queryset: models.QuerySet,
+    groups: list[PropertyGroupConfig] | list[dict],
+    view=None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    request=None,
+) -> Iterator[list[Any]]:
+    """Yield one list of export values per object of ``queryset``.
+
+    The queryset is iterated in chunks with the planned ``select_related``
+    applied and ``prefetch_related`` run once per chunk, so memory use does
+    not grow with the size of the queryset. Properties hidden by
+    ``visible_if`` are left out (see ``export_groups``).
+    """
+    return _iter_rows(queryset, export_groups(groups, view, request), view, chunk_size)
+
+
+def _iter_rows(queryset, groups: list[PropertyGroupConfig], view, chunk_size: int) -> Iterator[list[Any]]:
+    queryset = plan_lookups(queryset.model, groups).apply(queryset)
+    for instance in queryset.iterator(chunk_size=chunk_size):
+        yield [
+            export_value(prop)
+            for group in resolve_all(instance, groups, view=view, aligned=True)
+            for prop in group.properties
+        ]
+
+
+class _Echo:
+    """File-like object whose ``write`` returns the value instead of storing it."""
+
+    def write(self, value):
+        return value
+
+
+def _csv_cell(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        return ", ".join(str(_csv_cell(item)) for item in value)
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    return value
+
+
+def stream_csv(queryset, groups, view=None, chunk_size: int = DEFAULT_CHUNK_SIZE, request=None) -> Iterator[str]:
+    """Yield CSV lines: a header row of labels, then one row per object."""
+    groups = export_groups(groups, view, request)
+    writer = csv.writer(_Echo())
+    yield writer.writerow([label for _, label in export_columns(queryset.model, groups)])
+    for row in _iter_rows(queryset, groups, view, chunk_size):
+        yield writer.writerow([_csv_cell(value) for value in row])
+
+
+def stream_jsonl(queryset, groups, view=None, chunk_size: int = DEFAULT_CHUNK_SIZE, request=None) -> Iterator[str]:
+    """Yield one JSON object per line, keyed by property path."""
+    groups = export_groups(groups, view, request)
+    paths = [path for path, _ in export_columns(queryset.model, groups)]
+    for row in _iter_rows(queryset, groups, view, chunk_size):
+        yield json.dumps(dict(zip(paths, row)), cls=DjangoJSONEncoder) + "\n"
+
+
+def _xlsx_cell(value: Any) -> Any:
+    if isinstance(value, list):
+        return ", ".join(str(_xlsx_cell(item)) for item in value)
+    if isinstance(value, datetime.datetime) and timezone.is_aware(value):
+        # Excel has no time zones
+        return timezone.make_naive(value)
+    return value
+
+
+def write_xlsx(file, queryset, groups, view=None, chunk_size: int = DEFAULT_CHUNK_SIZE, request=None) -> None:
+    """Write an XLSX workbook to ``file`` using openpyxl's write-only mode."""
+    try:
+        from openpyxl import Workbook
+    except ImportError:
+        raise ImproperlyConfigured(
+            "XLSX export requires openpyxl. Install it with: pip install django-object-detail[xlsx]"
+        )
+
+    groups = export_groups(groups, view, request)
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.append([label for _, label in export_columns(queryset.model, groups)])
+    for row in _iter_rows(queryset, groups, view, chunk_size):
+        sheet.append([_xlsx_cell(value) for value in row])
+    workbook.save(file)
+
+
+def export_response(
+    queryset: models.QuerySet,
+    groups: list[PropertyGroupConfig] | list[dict],
+    format: str = "csv",
+    filename: str | None = None,
+    view=None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    request=None,
+):
+    """Return a response exporting ``queryset`` as ``csv``, ``jsonl`` or ``xlsx``.
+
+    CSV and JSONL are streamed row by row. XLSX cannot be streamed; the
+    workbook is written to a temporary file first and then served from it.
+    Properties hidden from ``request`` (default ``view.request``) by
+    ``visible_if`` are left out.
+    """
+    if format not in CONTENT_TYPES:
+        raise ValueError(f"Unknown export format {format!r}, expected one of {', '.join(CONTENT_TYPES)}")
+    filename = filename or f"{queryset.model._meta.model_name}.{format}"
+
+    if format == "xlsx":
+        file = tempfile.TemporaryFile()
+        write_xlsx(file, queryset, groups, view=view, chunk_size=chunk_size, request=request)
+        file.seek(0)
+        return FileResponse(file, as_attachment=True, filename=filename, content_type=CONTENT_TYPES["xlsx"])
+
+    stream = stream_csv if format == "csv" else stream_jsonl
+    response = StreamingHttpResponse(
+        stream(queryset, groups, view=view, chunk_size=chunk_size, request=request),
+        content_type=CONTENT_TYPES[format],
+    )
+    response["Content-Disposition"] = content_disposition_header(True, filename)
+    return response
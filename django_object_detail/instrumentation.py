@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import time
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from django.db import connections
+
+_recording: ContextVar[Recording | None] = ContextVar("object_detail_recording", default=None)
+
+
+@dataclass
+class PropertyRecord:
+    path: str
+    resolve_ms: float = 0.0
+    queries: int = 0
+    cache: str | None = None
+    render_ms: float = 0.0
+    template: str | None = None
+
+
+@dataclass
+class GroupRecord:
+    title: str
+    resolve_ms: float = 0.0
+    render_ms: float = 0.0
+    properties: list[PropertyRecord] = field(default_factory=list)
+
+
+@dataclass
+class CallRecord:
+    """One ``{% render_object_detail %}`` call."""
+
+    view: str | None
+    config: list[tuple[str, list[str]]]
+    total_ms: float = 0.0
+    groups: list[GroupRecord] = field(default_factory=list)
+    skeleton: bool = False
+
+
+class Recording:
+    """Timings, query counts, templates and cache results of the object detail calls of one request.
+
+    Resolved groups and properties are recorded by identity as they are built
+    and picked up by the render call that displays them. Queries are counted
+    on the connections of the recording thread; view methods run in the
+    concurrent pool are timed but their queries are not counted.
+    """
+
+    def __init__(self):
+        self.queries = 0
+        self.calls: list[CallRecord] = []
+        self._groups: dict[int, GroupRecord] = {}
+        self._properties: dict[int, PropertyRecord] = {}
+        self._cache: dict[tuple[int, str], str] = {}
+        # Keeps recorded objects alive so their ids are not reused during the request
+        self._keep: list[Any] = []
+
+    def _count_query(self, execute, sql, params, many, context):
+        self.queries += 1
+        return execute(sql, params, many, context)
+
+    def mark(self) -> tuple[float, int]:
+        return time.perf_counter(), self.queries
+
+    def track_cache(self, instance, config, compute: Callable[[], Any]) -> Callable[[], Any]:
+        """Return ``compute`` wrapped so that calling it records a cache miss."""
+        key = (id(instance), config.path)
+        self._cache[key] = "hit"
+
+        def tracked():
+            self._cache[key] = "miss"
+            return compute()
+
+        return tracked
+
+    def property_resolved(self, instance, prop, start: tuple[float, int]) -> None:
+        started, queries = start
+        record = PropertyRecord(
+            path=prop.path,
+            resolve_ms=(time.perf_counter() - started) * 1000,
+            queries=self.queries - queries,
+            cache=self._cache.pop((id(instance), prop.path), None),
+        )
+        self._properties[id(prop)] = record
+        self._keep.append(prop)
+
+    def group_resolved(self, group, start: tuple[float, int]) -> None:
+        record = self.group_record(group)
+        record.resolve_ms += (time.perf_counter() - start[0]) * 1000
+
+    def property_record(self, prop) -> PropertyRecord:
+        record = self._properties.get(id(prop))
+        if record is None:
+            # Built elsewhere (snapshots, deserialized or hand-made groups)
+            record = self._properties[id(prop)] = PropertyRecord(path=prop.path)
+            self._keep.append(prop)
+        return record
+
+    def group_record(self, group) -> GroupRecord:
+        record = self._groups.get(id(group))
+        if record is None:
+            record = self._groups[id(group)] = GroupRecord(title=str(group.title))
+            self._keep.append(group)
+        # Concurrent properties are filled in after their group was resolved
+        record.properties = [self.property_record(prop) for prop in group.properties if prop is not None]
+        return record
+
+    def property_rendered(self, prop, template: str | None, start: tuple[float, int]) -> None:
+        record = self.property_record(prop)
+        record.render_ms += (time.perf_counter() - start[0]) * 1000
+        record.template = template
+
+    def group_rendered(self, group, start: tuple[float, int]) -> None:
+        self.group_record(group).render_ms += (time.perf_counter() - start[0]) * 1000
+
+    def call_rendered(self, view, groups, start: tuple[float, int], skeleton: bool = False) -> None:
+        groups = groups or []
+        self.calls.append(
+            CallRecord(
+                view=type(view).__qualname__ if view is not None else None,
+                config=[(str(group.title), [prop.path for prop in group.properties]) for group in groups],
+                total_ms=(time.perf_counter() - start[0]) * 1000,
+                groups=[self.group_record(group) for group in groups],
+                skeleton=skeleton,
+            )
+        )
+
+
+def current_recording() -> Recording | None:
+    """Return the active recording, if any. Instrumented code does nothing else when there is none."""
+    return _recording.get()
+
+
+@contextmanager
+def record():
+    """Record the object detail calls made inside the block, counting queries on every connection.
+
+    Inside an active recording, the block shares that recording.
+    """
+    current = _recording.get()
+    if current is not None:
+        yield current
+        return
+    recording = Recording()
+    token = _recording.set(recording)
+    try:
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(recording._count_query))
+            yield recording
+    finally:
+        _recording.reset(token)
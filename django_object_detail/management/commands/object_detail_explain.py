@@ -0,0 +1,137 @@
+import json
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.test import RequestFactory
+from django.utils.module_loading import import_string
+
+from django_object_detail.config import parse_property_display_cached
+from django_object_detail.explain import explain
+from django_object_detail.plan import format_lookup
+
+
+class Command(BaseCommand):
+    help = (
+        "Resolve a property_display for one object under query capture and report, "
+        "per property, the SQL issued and the select_related/prefetch_related/only "
+        "setup that avoids it."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "target",
+            help="Dotted path to a view using ObjectDetailMixin, or a model label (app_label.Model) with --config.",
+        )
+        parser.add_argument(
+            "pk", nargs="?", help="Primary key of the sample object, passed to a view as its pk_url_kwarg."
+        )
+        parser.add_argument("--config", help="Dotted path to a property_display list (required with a model label).")
+        parser.add_argument(
+            "--kwarg",
+            action="append",
+            default=[],
+            metavar="NAME=VALUE",
+            help="URL keyword argument passed to the view, e.g. --kwarg slug=dune. Can be repeated.",
+        )
+        parser.add_argument("--database", help="Database alias to query.")
+        parser.add_argument("--json", action="store_true", help="Print the report as JSON.")
+
+    def handle(self, *args, **options):
+        model, pk, groups, view = self._load_target(
+            options["target"], options["pk"], options["config"], self._parse_kwargs(options["kwarg"])
+        )
+        report = explain(model, pk, groups, view=view, using=options["database"])
+
+        if options["json"]:
+            self.stdout.write(json.dumps(self._as_dict(report), indent=2))
+            return
+
+        self.stdout.write(f"{model._meta.label} pk={report.pk}\n")
+        for prop in report.properties:
+            flags = []
+            if prop.n_plus_one:
+                flags.append("N+1 on lists")
+            if prop.repeated:
+                flags.append("repeated queries")
+            suffix = f"  [{', '.join(flags)}]" if flags else ""
+            self.stdout.write(
+                f"{prop.path}: {len(prop.queries)} queries, {prop.time * 1000:.1f} ms, "
+                f"{prop.items} items, {prop.planned_queries} with plan{suffix}"
+            )
+            if options["verbosity"] >= 2:
+                for sql in prop.queries:
+                    self.stdout.write(f"    {sql}")
+
+        self.stdout.write(
+            f"\nTotal: {report.total_queries} queries, {report.total_planned_queries} with plan\n"
+        )
+        self.stdout.write("Suggested queryset:")
+        self.stdout.write(f"    select_related({', '.join(map(repr, report.plan.select_related))})")
+        self.stdout.write(f"    prefetch_related({', '.join(map(format_lookup, report.plan.prefetch_related))})")
+        if report.plan.only is None:
+            self.stdout.write("    only(): not applicable, some properties need full instances")
+        else:
+            self.stdout.write(f"    only({', '.join(map(repr, report.plan.only))})")
+
+    def _parse_kwargs(self, values):
+        kwargs = {}
+        for value in values:
+            name, sep, arg = value.partition("=")
+            if not sep or not name:
+                raise CommandError(f"Invalid --kwarg {value!r}, expected NAME=VALUE.")
+            kwargs[name] = arg
+        return kwargs
+
+    def _load_target(self, target, pk, config, kwargs):
+        if config is not None:
+            try:
+                model = apps.get_model(target)
+            except (LookupError, ValueError) as e:
+                raise CommandError(f"Unknown model {target!r}: {e}")
+            if pk is None:
+                raise CommandError("pk is required with --config.")
+            groups = parse_property_display_cached(import_string(config))
+            return model, pk, groups, None
+
+        try:
+            view_class = import_string(target)
+        except ImportError as e:
+            raise CommandError(f"Cannot import view {target!r}: {e}")
+        if not hasattr(view_class, "get_property_display"):
+            raise CommandError(f"{target!r} does not use ObjectDetailMixin.")
+
+        if pk is not None:
+            kwargs = {getattr(view_class, "pk_url_kwarg", "pk"): pk, **kwargs}
+        if not kwargs:
+            raise CommandError("Pass the pk or the view's URL keyword arguments with --kwarg.")
+        view = view_class()
+        view.setup(RequestFactory().get("/"), **kwargs)
+        view.object = view.get_object()
+        instance = view.get_object_for_detail()
+        return type(instance), instance.pk, view.get_property_display(), view
+
+    def _as_dict(self, report):
+        return {
+            "model": report.model._meta.label,
+            "pk": report.pk,
+            "properties": [
+                {
+                    "path": prop.path,
+                    "queries": prop.queries,
+                    "time_ms": round(prop.time * 1000, 3),
+                    "items": prop.items,
+                    "planned_queries": prop.planned_queries,
+                    "n_plus_one": prop.n_plus_one,
+                    "repeated": [{"sql": sql, "count": n} for sql, n in prop.repeated],
+                }
+                for prop in report.properties
+            ],
+            "plan": {
+                "select_related": report.plan.select_related,
+                "prefetch_related": [
+                    lookup if isinstance(lookup, str) else format_lookup(lookup)
+                    for lookup in report.plan.prefetch_related
+                ],
+                "only": report.plan.only,
+            },
+        }
@@ -0,0 +1,48 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from django_object_detail.metrics import collect_published, summarize
+
+
+class Command(BaseCommand):
+    help = (
+        "Show the resolve/render time and query histograms published to the cache by processes "
+        "running with OBJECT_DETAIL_METRICS enabled."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--view", help="Only show views whose dotted path contains this text.")
+        parser.add_argument("--paths", action="store_true", help="Include a row per property path.")
+        parser.add_argument("--json", action="store_true", help="Output the summary as JSON.")
+
+    def handle(self, *args, **options):
+        histograms, processes = collect_published()
+        rows = [
+            row
+            for row in summarize(histograms)
+            if (options["paths"] or row["path"] is None) and (not options["view"] or options["view"] in row["view"])
+        ]
+
+        if options["json"]:
+            self.stdout.write(json.dumps({"processes": processes, "series": rows}, indent=2))
+            return
+
+        if not processes:
+            self.stdout.write("No metrics published. Enable OBJECT_DETAIL_METRICS and use a cache shared by all processes.")
+            return
+
+        self.stdout.write(f"Processes: {', '.join(processes)}")
+        current = None
+        for row in rows:
+            if row["view"] != current:
+                current = row["view"]
+                self.stdout.write("")
+                self.stdout.write(self.style.MIGRATE_HEADING(current))
+                self.stdout.write(
+                    f"  {'path':<40} {'metric':<11} {'count':>7} {'mean':>9} {'p50':>9} {'p90':>9} {'p99':>9} {'max':>9}"
+                )
+            self.stdout.write(
+                f"  {row['path'] or '(view)':<40} {row['metric']:<11} {row['count']:>7} {row['mean']:>9.2f} "
+                f"{row['p50']:>9.2f} {row['p90']:>9.2f} {row['p99']:>9.2f} {row['max']:>9.2f}"
+            )
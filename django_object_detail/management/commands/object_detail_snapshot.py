@@ -0,0 +1,35 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+
+from django_object_detail.snapshot import get_snapshot_spec, refresh_snapshots, registered_snapshot_models
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the stored detail snapshots of models registered with register_snapshot(), "
+        "resolving rows in batches with their relations loaded in bulk."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "models", nargs="*", help="Models as app_label.ModelName (default: every registered model)."
+        )
+        parser.add_argument("--batch-size", type=int, default=500, help="Rows resolved and written per batch.")
+
+    def handle(self, *args, **options):
+        if options["models"]:
+            targets = []
+            for label in options["models"]:
+                try:
+                    model = apps.get_model(label)
+                except (LookupError, ValueError) as e:
+                    raise CommandError(f"Unknown model {label!r}: {e}")
+                if get_snapshot_spec(model) is None:
+                    raise CommandError(f"{label!r} has no registered snapshot.")
+                targets.append(model)
+        else:
+            targets = registered_snapshot_models()
+
+        for model in targets:
+            count = refresh_snapshots(model, batch_size=options["batch_size"])
+            self.stdout.write(f"{model._meta.label}: {count} snapshots refreshed")
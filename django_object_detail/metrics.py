@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import math
+import os
+import socket
+import threading
+import time
+from typing import Any
+
+from django.core.cache import caches
+
+from django_object_detail.conf import (
+    get_cache_alias,
+    get_metrics_max_series,
+    get_metrics_publish_interval,
+    get_metrics_window,
+)
+
+# Bucket i holds values in [_BASE * _GROWTH**i, _BASE * _GROWTH**(i + 1)): about 9% relative error
+_BASE = 0.001
+_GROWTH = 2**0.25
+_MAX_BUCKET = 160
+_SLOTS = 10
+
+METRICS = ("resolve_ms", "render_ms", "queries")
+
+CACHE_PREFIX = "object_detail:metrics"
+
+
+def _bucket(value: float) -> int:
+    if value < _BASE:
+        return -1
+    return min(int(math.log(value / _BASE, _GROWTH)), _MAX_BUCKET)
+
+
+def _bucket_value(index: int) -> float:
+    """Representative value of a bucket (its geometric midpoint)."""
+    if index < 0:
+        return 0.0
+    return _BASE * _GROWTH ** (index + 0.5)
+
+
+class Histogram:
+    """Log-bucketed histogram with a fixed number of buckets, mergeable across processes."""
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self):
+        self.counts: dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, value: float) -> None:
+        index = _bucket(value)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other: Histogram) -> None:
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def quantile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(_bucket_value(index), self.max)
+        return self.max
+
+    def to_dict(self) -> dict:
+        return {
+            "counts": {str(i): c for i, c in self.counts.items()},
+            "count": self.count,
+            "total": self.total,
+            "max": self.max,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Histogram:
+        histogram = cls()
+        histogram.counts = {int(i): c for i, c in data["counts"].items()}
+        histogram.count = data["count"]
+        histogram.total = data["total"]
+        histogram.max = data["max"]
+        return histogram
+
+
+class RollingHistogram:
+    """Histogram over the last ``window`` seconds, kept as ``_SLOTS`` rotating sub-histograms."""
+
+    __slots__ = ("slot_seconds", "slots")
+
+    def __init__(self, window: float):
+        self.slot_seconds = window / _SLOTS
+        self.slots: list[tuple[int, Histogram] | None] = [None] * _SLOTS
+
+    def add(self, value: float, now: float | None = None) -> None:
+        epoch = int((time.time() if now is None else now) / self.slot_seconds)
+        slot = self.slots[epoch % _SLOTS]
+        if slot is None or slot[0] != epoch:
+            slot = self.slots[epoch % _SLOTS] = (epoch, Histogram())
+        slot[1].add(value)
+
+    def snapshot(self, now: float | None = None) -> Histogram:
+        epoch = int((time.time() if now is None else now) / self.slot_seconds)
+        merged = Histogram()
+        for slot in self.slots:
+            if slot is not None and epoch - slot[0] < _SLOTS:
+                merged.merge(slot[1])
+        return merged
+
+
+SeriesKey = tuple[str, str | None, str]
+
+
+class MetricsRegistry:
+    """Rolling histograms per (view, property path or None, metric) of this process.
+
+    At most ``OBJECT_DETAIL_METRICS_MAX_SERIES`` series are kept; observations
+    of further series are dropped.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._series: dict[SeriesKey, RollingHistogram] = {}
+        self._published = time.monotonic()
+        self.process = f"{socket.gethostname()}:{os.getpid()}"
+
+    def observe(self, view: str, path: str | None, metric: str, value: float) -> None:
+        key = (view, path, metric)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                if len(self._series) >= get_metrics_max_series():
+                    return
+                series = self._series[key] = RollingHistogram(get_metrics_window())
+            series.add(value)
+
+    def histograms(self) -> dict[SeriesKey, Histogram]:
+        with self._lock:
+            return {key: series.snapshot() for key, series in self._series.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+    def maybe_publish(self) -> None:
+        """Publish to the cache when ``OBJECT_DETAIL_METRICS_PUBLISH_INTERVAL`` has passed."""
+        interval = get_metrics_publish_interval()
+        if interval is None or time.monotonic() - self._published < interval:
+            return
+        self._published = time.monotonic()
+        publish(self)
+
+
+registry = MetricsRegistry()
+
+
+def view_label(view) -> str:
+    if view is None:
+        return "<template>"
+    cls = type(view)
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def observe_resolution(view, groups, recording, elapsed_ms: float, queries: int) -> None:
+    """Record the resolve time and queries of a view and of each resolved property path."""
+    label = view_label(view)
+    registry.observe(label, None, "resolve_ms", elapsed_ms)
+    registry.observe(label, None, "queries", queries)
+    for group in groups:
+        for prop in group.properties:
+            record = recording.property_record(prop)
+            registry.observe(label, prop.path, "resolve_ms", record.resolve_ms)
+            registry.observe(label, prop.path, "queries", record.queries)
+    registry.maybe_publish()
+
+
+def observe_render(view, elapsed_ms: float) -> None:
+    registry.observe(view_label(view), None, "render_ms", elapsed_ms)
+
+
+def _dump(histograms: dict[SeriesKey, Histogram]) -> list[dict]:
+    return [
+        {"view": view, "path": path, "metric": metric, **histogram.to_dict()}
+        for (view, path, metric), histogram in histograms.items()
+    ]
+
+
+def _load(data: list[dict]) -> dict[SeriesKey, Histogram]:
+    return {(item["view"], item["path"], item["metric"]): Histogram.from_dict(item) for item in data}
+
+
+def publish(metrics: MetricsRegistry | None = None) -> None:
+    """Store the histograms of this process in the cache for ``collect_published()``."""
+    metrics = metrics or registry
+    cache = caches[get_cache_alias()]
+    timeout = get_metrics_window() * 2
+    cache.set(f"{CACHE_PREFIX}:{metrics.process}", _dump(metrics.histograms()), timeout=timeout)
+    # Read-modify-write: a process lost in a race is added again on its next publish
+    index = cache.get(f"{CACHE_PREFIX}:index") or {}
+    index[metrics.process] = time.time()
+    cache.set(f"{CACHE_PREFIX}:index", index, timeout=timeout)
+
+
+def collect_published() -> tuple[dict[SeriesKey, Histogram], list[str]]:
+    """Merge the histograms published by every process; returns them with the process names."""
+    cache = caches[get_cache_alias()]
+    index = cache.get(f"{CACHE_PREFIX}:index") or {}
+    merged: dict[SeriesKey, Histogram] = {}
+    processes = []
+    for process in sorted(index):
+        data = cache.get(f"{CACHE_PREFIX}:{process}")
+        if data is None:
+            continue
+        processes.append(process)
+        for key, histogram in _load(data).items():
+            merged.setdefault(key, Histogram()).merge(histogram)
+    return merged, processes
+
+
+def summarize(histograms: dict[SeriesKey, Histogram]) -> list[dict[str, Any]]:
+    """Return count, mean, p50/p90/p99 and max of every series, views first, then their paths."""
+    rows = []
+    for (view, path, metric), histogram in histograms.items():
+        if not histogram.count:
+            continue
+        rows.append(
+            {
+                "view": view,
+                "path": path,
+                "metric": metric,
+                "count": histogram.count,
+                "mean": histogram.total / histogram.count,
+                "p50": histogram.quantile(0.5),
+                "p90": histogram.quantile(0.9),
+                "p99": histogram.quantile(0.99),
+                "max": histogram.max,
+            }
+        )
+    rows.sort(key=lambda row: (row["view"], row["path"] is not None, row["path"] or "", METRICS.index(row["metric"])))
+    return rows
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from dataclasses import asdict
+
+from debug_toolbar.panels import Panel
+from django.utils.translation import gettext_lazy as _
+from django.utils.translation import ngettext
+
+from django_object_detail.instrumentation import record
+
+
+class ObjectDetailPanel(Panel):
+    """django-debug-toolbar panel listing the ``{% render_object_detail %}`` calls of a request.
+
+    Add ``"django_object_detail.panels.ObjectDetailPanel"`` to ``DEBUG_TOOLBAR_PANELS``.
+    """
+
+    title = _("Object detail")
+    template = "django_object_detail/debug_toolbar/panel.html"
+
+    @property
+    def nav_subtitle(self):
+        calls = self.get_stats().get("calls", [])
+        total = sum(call["total_ms"] for call in calls)
+        return ngettext("%(count)d call in %(time).1f ms", "%(count)d calls in %(time).1f ms", len(calls)) % {
+            "count": len(calls),
+            "time": total,
+        }
+
+    def process_request(self, request):
+        with record() as recording:
+            response = super().process_request(request)
+        self._recording = recording
+        return response
+
+    def generate_stats(self, request, response):
+        recording = getattr(self, "_recording", None)
+        calls = [asdict(call) for call in recording.calls] if recording is not None else []
+        for call in calls:
+            for group in call["groups"]:
+                group["queries"] = sum(prop["queries"] for prop in group["properties"])
+        self.record_stats({"calls": calls})
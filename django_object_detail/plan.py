@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from django.db import models
+
+from django_object_detail.config import PropertyConfig, PropertyGroupConfig
+from django_object_detail.resolvers import (
+    get_property_meta,
+    is_generic_foreign_key,
+    is_generic_relation,
+    relation_query,
+    stream_index,
+)
+
+
+@dataclass
+class LookupPlan:
+    """ORM lookups that load everything a property_display needs up front.
+
+    ``only`` is None when a property needs the full instance (methods,
+    properties, view callables), because their field accesses are unknown.
+    """
+
+    select_related: list[str] = field(default_factory=list)
+    prefetch_related: list[str | models.Prefetch] = field(default_factory=list)
+    only: list[str] | None = field(default_factory=list)
+
+    def apply(self, queryset: models.QuerySet) -> models.QuerySet:
+        """Return ``queryset`` with the planned lookups applied."""
+        if self.select_related:
+            queryset = queryset.select_related(*self.select_related)
+        if self.prefetch_related:
+            queryset = queryset.prefetch_related(*self.prefetch_related)
+        if self.only is not None:
+            queryset = queryset.only(*self.only)
+        return queryset
+
+
+def _is_single_relation(field_obj) -> bool:
+    return isinstance(field_obj, (models.ForeignKey, models.OneToOneField, models.OneToOneRel))
+
+
+def _is_many_relation(field_obj) -> bool:
+    return isinstance(
+        field_obj, (models.ManyToManyField, models.ManyToManyRel, models.ManyToOneRel)
+    ) or is_generic_relation(field_obj)
+
+
+def plan_path(model: type[models.Model], path: str) -> LookupPlan:
+    """Plan the lookups for a single property path."""
+    meta = get_property_meta(model, path)
+    plan = LookupPlan()
+
+    relations: list[str] = []
+    select: str | None = None
+    many = False
+    for segment, field_obj in zip(meta.segments, meta.fields):
+        if _is_single_relation(field_obj):
+            relations.append(segment)
+            if not many:
+                select = "__".join(relations)
+        elif _is_many_relation(field_obj):
+            relations.append(segment)
+            many = True
+        elif is_generic_foreign_key(field_obj):
+            # Cannot be joined; prefetching loads the targets with one query per content type
+            relations.append(segment)
+            many = True
+            break
+        elif field_obj.is_relation:
+            # Relations the planner does not know how to join
+            break
+
+    if select:
+        plan.select_related.append(select)
+    if many:
+        plan.prefetch_related.append("__".join(relations))
+
+    if len(meta.fields) < len(meta.segments) or many or isinstance(meta.fields[-1], models.OneToOneRel):
+        # Methods and many-valued paths may touch any column of the instance
+        plan.only = None
+    else:
+        plan.only = [path]
+    return plan
+
+
+def plan_property(model: type[models.Model], prop: PropertyConfig) -> LookupPlan:
+    """Plan the lookups for ``prop``, including the lookups of its nested properties.
+
+    Nested lookups are prefixed with the property path and prefetched, so the
+    related objects of every row are resolved with one query per relation.
+
+    Streamed relations are read in chunks while rendering, so only the
+    single-valued part of their path before the many-valued hop is planned.
+    """
+    meta = get_property_meta(model, prop.path)
+    if prop.stream:
+        index = stream_index(model, prop)
+        plan = plan_path(model, "__".join(meta.segments[:index])) if index else LookupPlan()
+        plan.only = None
+        return plan
+
+    plan = plan_path(model, prop.path)
+    prefix = prop.path
+
+    query = relation_query(model, prop)
+    if query is not None:
+        # The filtered hop is loaded into its own attribute; lookups past it go through that attribute
+        segments = list(meta.segments)
+        segments[query.index] = query.attr
+        prefix = "__".join(segments)
+        lookups = [query.prefetch()]
+        for name in plan.prefetch_related:
+            rest = name[len(query.lookup) + 2 :]
+            if rest:
+                lookups.append(f"{lookups[0].prefetch_to}__{rest}")
+        plan.prefetch_related = lookups
+
+    if not prop.nested:
+        return plan
+
+    related_model = meta.fields[-1].related_model if len(meta.fields) == len(meta.segments) else None
+    if related_model is None:
+        return plan
+
+    plan.only = None
+    for sub in prop.nested:
+        sub_plan = plan_property(related_model, sub)
+        for lookup in sub_plan.select_related + sub_plan.prefetch_related:
+            lookup = _prefix_lookup(prefix, lookup)
+            if lookup not in plan.prefetch_related:
+                plan.prefetch_related.append(lookup)
+    return plan
+
+
+def _prefix_lookup(prefix: str, lookup: str | models.Prefetch) -> str | models.Prefetch:
+    if isinstance(lookup, models.Prefetch):
+        return models.Prefetch(
+            f"{prefix}__{lookup.prefetch_through}", queryset=lookup.queryset, to_attr=lookup.to_attr
+        )
+    return f"{prefix}__{lookup}"
+
+
+def lookup_name(lookup: str | models.Prefetch) -> str:
+    """Return the path under which ``lookup`` stores its objects."""
+    return lookup.prefetch_to if isinstance(lookup, models.Prefetch) else lookup
+
+
+def format_lookup(lookup: str | models.Prefetch) -> str:
+    """Return a readable representation of a ``prefetch_related`` lookup."""
+    if isinstance(lookup, models.Prefetch):
+        return f"Prefetch({lookup.prefetch_through!r}, queryset=..., to_attr={lookup.to_attr!r})"
+    return repr(lookup)
+
+
+def is_flat(model: type[models.Model], prop: PropertyConfig) -> bool:
+    """Whether ``prop`` is a plain column of ``model`` or of a single-valued relation chain.
+
+    Flat properties can be read with ``values_list()`` without loading instances.
+    """
+    if prop.cache is not None or prop.nested or prop.stream or relation_query(model, prop) is not None:
+        return False
+    meta = get_property_meta(model, prop.path)
+    if not meta.fields or len(meta.fields) != len(meta.segments):
+        return False
+    *relations, last = meta.fields
+    return all(_is_single_relation(f) for f in relations) and last.concrete and not last.is_relation
+
+
+def plan_lookups(model: type[models.Model], groups: list[PropertyGroupConfig]) -> LookupPlan:
+    """Merge the lookup plans of every property in ``groups``."""
+    merged = LookupPlan()
+    for group in groups:
+        for prop in group.properties:
+            _merge(merged, plan_property(model, prop))
+
+    merged.select_related = _drop_prefixes(merged.select_related)
+    merged.prefetch_related = _drop_prefixes(merged.prefetch_related)
+    if merged.only is not None:
+        # A related object displayed as a whole needs all of its columns
+        merged.only = [name for name in merged.only if not any(name.startswith(f"{o}__") for o in merged.only)]
+    return merged
+
+
+def _merge(target: LookupPlan, plan: LookupPlan) -> None:
+    for name in plan.select_related:
+        if name not in target.select_related:
+            target.select_related.append(name)
+    for name in plan.prefetch_related:
+        if name not in target.prefetch_related:
+            target.prefetch_related.append(name)
+    if target.only is not None:
+        if plan.only is None:
+            target.only = None
+        else:
+            target.only.extend(name for name in plan.only if name not in target.only)
+
+
+def _drop_prefixes(lookups: list) -> list:
+    """Drop lookups that are covered by a longer lookup (``a`` by ``a__b``).
+
+    ``Prefetch`` objects are always kept, since their queryset is not implied
+    by a longer lookup.
+    """
+    names = [lookup_name(lookup) for lookup in lookups]
+    return [
+        lookup
+        for lookup, name in zip(lookups, names)
+        if isinstance(lookup, models.Prefetch) or not any(other.startswith(f"{name}__") for other in names)
+    ]
+
+
+def property_configs(groups: list[PropertyGroupConfig]) -> list[PropertyConfig]:
+    """Flatten the properties of ``groups`` in display order."""
+    return [prop for group in groups for prop in group.properties]
@@ -0,0 +1,20 @@
+"""pytest plugin providing the ``detail_query_budget`` fixture.
+
+Registered through the ``pytest11`` entry point; requires pytest-django.
+"""
+
+import pytest
+
+from django_object_detail.testing import assert_detail_queries
+
+
+@pytest.fixture
+def detail_query_budget(db):
+    """Return ``assert_detail_queries(view_class, obj, max_queries, ...)``.
+
+    ::
+
+        def test_book_detail(detail_query_budget, book):
+            detail_query_budget(BookDetailView, book, 3)
+    """
+    return assert_detail_queries
@@ -1,16 +1,43 @@
 from __future__ import annotations
 
+import contextvars
+import hashlib
+import threading
+import time
+import weakref
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from dataclasses import dataclass, field
-from typing import Any
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, Any
 
-from django.core.exceptions import FieldDoesNotExist
-from django.db import models
+from django.apps import apps
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
+from django.db import connections, models
 from django.urls import NoReverseMatch, reverse
+from django.utils import translation
 
-from django_object_detail.config import BadgeConfig, LinkConfig, PropertyConfig, PropertyGroupConfig
+from django_object_detail.cache import get_or_compute
+from django_object_detail.conf import (
+    get_concurrent_max_workers,
+    get_concurrent_timeout,
+    get_concurrent_view_methods,
+    get_hide_empty,
+    get_stream_chunk_size,
+)
+from django_object_detail.instrumentation import current_recording
+
+if TYPE_CHECKING:
+    # The config models import Pydantic; resolving only reads their attributes
+    from django_object_detail.config import BadgeConfig, LinkConfig, PropertyConfig, PropertyGroupConfig
 
 _MISSING = object()
 
+_executor: ThreadPoolExecutor | None = None
+_executor_workers: int | None = None
+_executor_lock = threading.Lock()
+
 FIELD_TYPE_MAP: dict[type[models.Field], str] = {
     models.CharField: "char",
     models.SlugField: "char",
@@ -53,6 +80,7 @@ class ResolvedProperty:
     link_url: str | None = None
     badge_css: str | None = None
     badge_label: str | None = None
+    nested: list[list[ResolvedProperty]] | None = None
 
 
 @dataclass
@@ -61,6 +89,65 @@ class ResolvedGroup:
     description: str | None = None
     icon: str | None = None
     properties: list[ResolvedProperty] = field(default_factory=list)
+    lazy: bool = False
+    fragment_url: str | None = None
+
+
+@dataclass
+class ResolvedColumn:
+    path: str
+    label: str
+    detail: str | None = None
+
+
+@dataclass
+class ResolvedRow:
+    properties: list[ResolvedProperty]
+    pk: Any = None
+    url: str | None = None
+
+
+@dataclass
+class ResolvedTable:
+    columns: list[ResolvedColumn] = field(default_factory=list)
+    rows: list[ResolvedRow] = field(default_factory=list)
+
+
+@dataclass
+class ComparedProperty:
+    path: str
+    label: str
+    values: list[ResolvedProperty]
+    detail: str | None = None
+    differs: bool = False
+
+
+@dataclass
+class ComparedGroup:
+    title: str
+    description: str | None = None
+    icon: str | None = None
+    properties: list[ComparedProperty] = field(default_factory=list)
+
+
+@lru_cache(maxsize=None)
+def _generic_field_classes() -> tuple[type, type] | None:
+    """Return ``(GenericForeignKey, GenericRelation)``, or None without contenttypes."""
+    if not apps.is_installed("django.contrib.contenttypes"):
+        return None
+    from django.contrib.contenttypes.fields import GenericForeignKey, GenericRelation
+
+    return GenericForeignKey, GenericRelation
+
+
+def is_generic_foreign_key(field_obj) -> bool:
+    classes = _generic_field_classes()
+    return classes is not None and isinstance(field_obj, classes[0])
+
+
+def is_generic_relation(field_obj) -> bool:
+    classes = _generic_field_classes()
+    return classes is not None and isinstance(field_obj, classes[1])
 
 
 def _get_field_type(field_obj: models.Field) -> str:
@@ -123,40 +210,243 @@ def resolve_property(instance: models.Model, config: PropertyConfig, view=None)
     Walks the _meta chain for metadata (label, detail, type)
     and the instance chain for the runtime value.
     """
-    segments = config.path.split("__")
+    segments, label, detail, field_type, is_many = _walk_meta(type(instance), config)
+    value = _resolve_runtime_value(instance, config, segments, is_many, view)
+    return _build_property(config, label, detail, field_type, is_many, value, view=view)
+
+
+def _resolve_runtime_value(
+    instance: models.Model, config: PropertyConfig, segments: list[str], is_many: bool, view=None
+) -> Any:
+    """Resolve the value from the instance, falling back to the view.
+
+    Goes through the value cache when the property has a ``cache`` option.
+    """
+    if config.cache is not None:
+        return get_or_compute(
+            instance,
+            config,
+            partial(_resolve_runtime_value_uncached, instance, config, segments, is_many, view),
+            view=view,
+        )
+    return _resolve_runtime_value_uncached(instance, config, segments, is_many, view)
+
+
+def _resolve_runtime_value_uncached(
+    instance: models.Model, config: PropertyConfig, segments: list[str], is_many: bool, view=None
+) -> Any:
+    if config.stream:
+        return _stream_value(instance, config, segments)
+    value = _resolve_value(instance, segments, is_many, relation_query(type(instance), config))
+
+    if value is _MISSING:
+        view_method = _get_view_method(view, config)
+        value = view_method(instance) if view_method is not None else None
+
+    return value
+
+
+@dataclass(frozen=True)
+class RelationQuery:
+    """Filter, ordering and limit applied to the first many-valued hop of a property path.
+
+    ``attr`` is the ``to_attr`` under which a planned ``Prefetch`` stores the
+    related objects, so resolution can read them instead of querying again.
+    ``digest`` is a hash of the options, part of ``attr`` and of cache keys.
+    """
+
+    index: int
+    lookup: str
+    attr: str
+    model: type[models.Model]
+    filter: dict | None = None
+    order_by: tuple[str, ...] | None = None
+    limit: int | None = None
+    digest: str = ""
+
+    def apply(self, queryset: models.QuerySet) -> models.QuerySet:
+        """Return ``queryset`` filtered, ordered and sliced."""
+        if self.filter:
+            queryset = queryset.filter(**self.filter)
+        if self.order_by:
+            queryset = queryset.order_by(*self.order_by)
+        if self.limit is not None:
+            queryset = queryset[: self.limit]
+        return queryset
+
+    def prefetch(self) -> models.Prefetch:
+        """Return the ``Prefetch`` loading the hop for many instances at once."""
+        return models.Prefetch(self.lookup, queryset=self.apply(self.model._default_manager.all()), to_attr=self.attr)
+
+
+def relation_query(model: type[models.Model], config: PropertyConfig) -> RelationQuery | None:
+    """Return the ``RelationQuery`` of ``config``, or None when it has no ``filter``/``order_by``/``limit``."""
+    if config.filter is None and config.order_by is None and config.limit is None:
+        return None
+
+    meta = get_property_meta(model, config.path)
+    for index, field_obj in enumerate(meta.fields):
+        if field_obj.many_to_many or field_obj.one_to_many:
+            segments = meta.segments[: index + 1]
+            options = (sorted(config.filter.items()) if config.filter else None, config.order_by, config.limit)
+            digest = hashlib.md5(repr(options).encode(), usedforsecurity=False).hexdigest()[:8]
+            return RelationQuery(
+                index=index,
+                lookup="__".join(segments),
+                attr=f"_od_{'_'.join(segments)}_{digest}",
+                model=field_obj.related_model,
+                filter=config.filter,
+                order_by=tuple(config.order_by) if config.order_by else None,
+                limit=config.limit,
+                digest=digest,
+            )
+    raise ImproperlyConfigured(
+        f"Property {config.path!r}: filter, order_by and limit need a many-valued relation in the path."
+    )
+
+
+class StreamedValue:
+    """Related objects of a ``stream`` property, read from the database in chunks while iterated.
+
+    Iterating runs ``queryset.iterator(chunk_size=...)`` and walks the rest of
+    the property path on each object, so only one chunk of the relation is in
+    memory at a time. Every iteration runs the query again.
+    """
+
+    def __init__(self, queryset: models.QuerySet, segments: list[str], chunk_size: int):
+        self.queryset = queryset
+        self.segments = segments
+        self.chunk_size = chunk_size
+
+    def __iter__(self) -> Iterator[Any]:
+        for obj in self.queryset.iterator(chunk_size=self.chunk_size):
+            if not self.segments:
+                yield obj
+                continue
+            value = _resolve_value(obj, self.segments, is_many=True)
+            if value is not _MISSING:
+                yield from value
+
+    def __bool__(self) -> bool:
+        return self.queryset.exists()
+
+    def chunks(self) -> Iterator[list[Any]]:
+        """Yield the values in lists of at most ``chunk_size`` items."""
+        chunk = []
+        for item in self:
+            chunk.append(item)
+            if len(chunk) >= self.chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def __repr__(self) -> str:
+        return f"<StreamedValue {self.queryset.model.__name__} chunk_size={self.chunk_size}>"
+
+
+def stream_index(model: type[models.Model], config: PropertyConfig) -> int:
+    """Return the index of the many-valued hop that a ``stream`` property iterates."""
+    meta = get_property_meta(model, config.path)
+    for index, field_obj in enumerate(meta.fields):
+        if field_obj.many_to_many or field_obj.one_to_many:
+            return index
+    raise ImproperlyConfigured(f"Property {config.path!r}: stream needs a many-valued relation in the path.")
+
+
+def _stream_value(instance: models.Model, config: PropertyConfig, segments: list[str]) -> StreamedValue | list:
+    """Walk to the many-valued hop of ``config`` and wrap its queryset without evaluating it."""
+    index = stream_index(type(instance), config)
+    obj = instance
+    for segment in segments[:index]:
+        obj = getattr(obj, segment, None)
+        if obj is None:
+            return []
+    queryset = getattr(obj, segments[index]).all()
+    rest = segments[index + 1 :]
+    if rest:
+        from django_object_detail.plan import plan_path
+
+        # Join or prefetch the rest of the path per chunk instead of one query per streamed object
+        plan = plan_path(queryset.model, "__".join(rest))
+        plan.only = None
+        queryset = plan.apply(queryset)
+    query = relation_query(type(instance), config)
+    if query is not None:
+        queryset = query.apply(queryset)
+    return StreamedValue(queryset, segments[index + 1 :], config.chunk_size or get_stream_chunk_size())
+
+
+def _has_attribute(instance: models.Model, name: str) -> bool:
+    """Check for an attribute without evaluating properties or related descriptors."""
+    return name in instance.__dict__ or hasattr(type(instance), name)
+
+
+@dataclass(frozen=True)
+class PropertyMeta:
+    """Model metadata for a property path, shared by every instance of the model.
+
+    ``verbose_name`` and ``help_text`` are kept as declared (possibly lazy);
+    the translated label and detail are cached per language by ``_header()``.
+    """
+
+    segments: tuple[str, ...]
+    fields: tuple[models.Field, ...]
+    verbose_name: Any = None
+    help_text: Any = None
+    fallback_label: str = ""
+    type: str = "default"
+    is_many: bool = False
+
+
+@lru_cache(maxsize=2048)
+def get_property_meta(model: type[models.Model], path: str) -> PropertyMeta:
+    """Walk _meta for ``path`` on ``model`` and cache the result."""
+    segments = tuple(path.split("__"))
 
-    # Walk _meta to gather field metadata
-    label = config.path
-    detail = None
+    fields = []
+    verbose_name = None
+    help_text = None
+    fallback_label = path
     field_type = "default"
     is_many = False
-    current_model = type(instance)
+    current_model = model
 
     for i, segment in enumerate(segments):
         try:
             field_obj = current_model._meta.get_field(segment)
         except FieldDoesNotExist:
             # Could be a method/property — no further metadata to extract
-            label = segment.replace("_", " ").title()
+            verbose_name = None
+            fallback_label = segment.replace("_", " ").title()
             break
         else:
-            # Extract metadata from the field
-            verbose = getattr(field_obj, "verbose_name", None)
-            if verbose:
-                v = str(verbose)
-                label = v[0].upper() + v[1:]
-            else:
-                label = segment.replace("_", " ").title()
+            fields.append(field_obj)
+            verbose_name = getattr(field_obj, "verbose_name", None)
+            fallback_label = segment.replace("_", " ").title()
 
-            help_text = getattr(field_obj, "help_text", None)
-            if help_text:
-                detail = str(help_text)
+            if getattr(field_obj, "help_text", None):
+                help_text = field_obj.help_text
 
             field_type = _get_field_type(field_obj)
 
+            if is_generic_foreign_key(field_obj):
+                field_type = "foreignkey"
+                if i < len(segments) - 1:
+                    # The target model varies per instance, so later segments have no metadata
+                    verbose_name = None
+                    help_text = None
+                    fallback_label = segments[-1].replace("_", " ").title()
+                    field_type = "default"
+                break
+
             # Navigate into related models for FK/O2O
             # OneToOneRel must be checked before ManyToOneRel (it's a subclass)
-            if isinstance(field_obj, (models.ForeignKey, models.OneToOneField, models.OneToOneRel)):
+            if is_generic_relation(field_obj):
+                field_type = "manytomany"
+                is_many = True
+                current_model = field_obj.related_model
+            elif isinstance(field_obj, (models.ForeignKey, models.OneToOneField, models.OneToOneRel)):
                 current_model = field_obj.related_model
             elif isinstance(field_obj, models.ManyToManyField):
                 is_many = True
@@ -165,21 +455,77 @@ def resolve_property(instance: models.Model, config: PropertyConfig, view=None)
                 is_many = True
                 current_model = field_obj.related_model
 
-    # Apply config overrides
+    return PropertyMeta(
+        segments=segments,
+        fields=tuple(fields),
+        verbose_name=verbose_name,
+        help_text=help_text,
+        fallback_label=fallback_label,
+        type=field_type,
+        is_many=is_many,
+    )
+
+
+# Translated (label, detail) per config id, then per (model, language); entries go with their config
+_headers: dict[int, dict[tuple[type[models.Model], str | None], tuple[str, str | None]]] = {}
+
+
+def _header(model: type[models.Model], config: PropertyConfig) -> tuple[str, str | None]:
+    """Return the label and detail of ``config`` on ``model``, translated once per active language."""
+    cached = _headers.get(id(config))
+    if cached is None:
+        cached = _headers[id(config)] = {}
+        weakref.finalize(config, _headers.pop, id(config), None)
+    key = (model, translation.get_language())
+    header = cached.get(key)
+    if header is not None:
+        return header
+
+    meta = get_property_meta(model, config.path)
     if config.title:
-        label = config.title
-    if config.detail is not None:
-        detail = config.detail
+        label = str(config.title)
+    elif meta.verbose_name:
+        v = str(meta.verbose_name)
+        label = v[0].upper() + v[1:]
+    else:
+        label = meta.fallback_label
+    detail = config.detail if config.detail is not None else meta.help_text
+    header = cached[key] = (label, str(detail) if detail else None)
+    return header
+
+
+def _walk_meta(model: type[models.Model], config: PropertyConfig) -> tuple[list[str], Any, Any, str, bool]:
+    """Return segments, label, detail, type and is_many, with config overrides applied."""
+    meta = get_property_meta(model, config.path)
+    label, detail = _header(model, config)
+
+    field_type = meta.type
     if config.type:
         field_type = config.type
+    elif config.stream:
+        field_type = "stream"
+    elif config.nested:
+        field_type = "nested"
 
-    # Resolve the runtime value
-    value = _resolve_value(instance, segments, is_many)
+    return list(meta.segments), label, detail, field_type, meta.is_many
 
-    if value is _MISSING:
-        view_method = getattr(view, config.path, None) if view is not None else None
-        value = view_method(instance) if callable(view_method) else None
 
+def resolve_header(model: type[models.Model], config: PropertyConfig) -> tuple[Any, Any]:
+    """Return the label and detail of a property without resolving a value."""
+    _, label, detail, _, _ = _walk_meta(model, config)
+    return label, detail or None
+
+
+def _get_view_method(view, config: PropertyConfig):
+    """Return the view callable used as fallback for ``config.path``, if any."""
+    view_method = getattr(view, config.path, None) if view is not None else None
+    return view_method if callable(view_method) else None
+
+
+def _build_property(
+    config: PropertyConfig, label: Any, detail: Any, field_type: str, is_many: bool, value: Any, view=None
+) -> ResolvedProperty:
+    """Build the ResolvedProperty for a resolved value, including link, badge and nested properties."""
     # Resolve link URL
     link_url = _resolve_link_url(value, config.link, is_many)
 
@@ -190,6 +536,8 @@ def resolve_property(instance: models.Model, config: PropertyConfig, view=None)
         badge_css = _resolve_badge_css(value, config.badge)
         badge_label = _resolve_badge_label(value, config.badge)
 
+    nested = _resolve_nested(value, config, view) if config.nested else None
+
     return ResolvedProperty(
         path=config.path,
         label=label,
@@ -201,14 +549,44 @@ def resolve_property(instance: models.Model, config: PropertyConfig, view=None)
         link_url=link_url,
         badge_css=badge_css,
         badge_label=badge_label,
+        nested=nested,
     )
 
 
-def _resolve_value(instance: models.Model, segments: list[str], is_many: bool) -> Any:
+def _resolve_nested(value: Any, config: PropertyConfig, view=None) -> list[list[ResolvedProperty]]:
+    """Resolve ``config.nested`` for every related object in ``value``, in bulk."""
+    if value is None:
+        return []
+    items = value if isinstance(value, list) else [value]
+    items = [item for item in items if isinstance(item, models.Model)]
+    if not items:
+        return []
+    from django_object_detail.config import PropertyGroupConfig
+
+    group = PropertyGroupConfig.model_construct(title="", properties=config.nested)
+
+    # Generic foreign keys may point to several models; resolve each model's objects together
+    by_model: dict[type[models.Model], list[int]] = {}
+    for index, item in enumerate(items):
+        by_model.setdefault(type(item), []).append(index)
+    nested: list[list[ResolvedProperty]] = [[] for _ in items]
+    for indexes in by_model.values():
+        resolved = resolve_many([items[i] for i in indexes], [group], view=view)
+        for index, groups in zip(indexes, resolved):
+            shown = drop_empty(groups, [group])
+            nested[index] = shown[0].properties if shown else []
+    return nested
+
+
+def _resolve_value(
+    instance: models.Model, segments: list[str], is_many: bool, query: RelationQuery | None = None
+) -> Any:
     """Walk the instance to resolve the runtime value.
 
     Tracks a list of current objects to handle M2M fan-out.
     Returns _MISSING if the first segment is not found on the instance.
+    At the hop of ``query``, reads its prefetched objects or runs the
+    filtered, ordered and sliced query.
     """
     current: list[Any] = [instance]
     first_resolved = False
@@ -229,7 +607,10 @@ def _resolve_value(instance: models.Model, segments: list[str], is_many: bool) -
                 first_resolved = True
 
             # Check if it's a manager (M2M or reverse FK)
-            if hasattr(attr, "all"):
+            if query is not None and i == query.index:
+                prefetched = obj.__dict__.get(query.attr)
+                next_objects.extend(prefetched if prefetched is not None else query.apply(attr.all()))
+            elif hasattr(attr, "all"):
                 next_objects.extend(attr.all())
             elif callable(attr):
                 next_objects.append(attr())
@@ -249,18 +630,416 @@ def _resolve_value(instance: models.Model, segments: list[str], is_many: bool) -
         return current
 
 
-def resolve_group(instance: models.Model, config: PropertyGroupConfig, view=None) -> ResolvedGroup:
-    """Resolve all properties in a group."""
+def _get_executor() -> ThreadPoolExecutor:
+    """Return the shared, bounded pool for concurrent view-method properties.
+
+    The pool is replaced when ``OBJECT_DETAIL_CONCURRENT_MAX_WORKERS`` changes;
+    calls already submitted to the old pool still finish.
+    """
+    global _executor, _executor_workers
+    max_workers = get_concurrent_max_workers()
+    with _executor_lock:
+        if _executor is None or _executor_workers != max_workers:
+            if _executor is not None:
+                _executor.shutdown(wait=False)
+            _executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="object-detail")
+            _executor_workers = max_workers
+        return _executor
+
+
+def _call_in_thread(call, language: str | None) -> Any:
+    try:
+        with translation.override(language):
+            return call()
+    finally:
+        connections.close_all()
+
+
+def _resolve_groups(
+    instance: models.Model, configs: list[PropertyGroupConfig], view=None
+) -> list[ResolvedGroup]:
+    """Resolve groups, dispatching concurrent view-method properties to the pool.
+
+    Concurrent properties are submitted as they are encountered and joined
+    once every other property has been resolved, so slow view callables
+    overlap with each other and with the rest of the resolution.
+    """
+    model = type(instance)
+    default_concurrent = get_concurrent_view_methods()
+    default_timeout = get_concurrent_timeout()
+    pending: list[
+        tuple[ResolvedGroup, int, PropertyConfig, tuple, Future, float | None, tuple[float, int] | None]
+    ] = []
+    groups = []
+
+    recording = current_recording()
+
+    for group_config in configs:
+        group_start = recording.mark() if recording is not None else None
+        group = ResolvedGroup(
+            title=group_config.title,
+            description=group_config.description,
+            icon=group_config.icon,
+        )
+        for prop in group_config.properties:
+            start = recording.mark() if recording is not None else None
+            segments, label, detail, field_type, is_many = _walk_meta(model, prop)
+            concurrent = prop.concurrent if prop.concurrent is not None else default_concurrent
+            view_method = None
+            if concurrent and not _has_attribute(instance, segments[0]):
+                view_method = _get_view_method(view, prop)
+
+            if view_method is not None:
+                call = partial(view_method, instance)
+                if prop.cache is not None:
+                    call = partial(get_or_compute, instance, prop, call, view=view)
+                timeout = prop.timeout if prop.timeout is not None else default_timeout
+                deadline = time.monotonic() + timeout if timeout is not None else None
+                # Carry the caller's context and active language over to the worker thread
+                future = _get_executor().submit(
+                    contextvars.copy_context().run, _call_in_thread, call, translation.get_language()
+                )
+                pending.append(
+                    (group, len(group.properties), prop, (label, detail, field_type, is_many), future, deadline, start)
+                )
+                group.properties.append(None)
+                continue
+
+            value = _resolve_runtime_value(instance, prop, segments, is_many, view)
+            resolved = _build_property(prop, label, detail, field_type, is_many, value, view=view)
+            group.properties.append(resolved)
+            if recording is not None:
+                recording.property_resolved(instance, resolved, start)
+        groups.append(group)
+        if recording is not None:
+            recording.group_resolved(group, group_start)
+
+    for group, index, prop, meta, future, deadline, start in pending:
+        try:
+            timeout = max(deadline - time.monotonic(), 0) if deadline is not None else None
+            value = future.result(timeout=timeout)
+        except FutureTimeoutError:
+            # Frees the worker if the call has not started; a running call cannot be stopped
+            future.cancel()
+            value = prop.fallback
+        group.properties[index] = _build_property(prop, *meta, value, view=view)
+        if recording is not None:
+            recording.property_resolved(instance, group.properties[index], start)
+
+    return groups
+
+
+def is_empty(value: Any) -> bool:
+    """Whether a resolved value counts as empty: None, an empty string or an empty collection."""
+    if isinstance(value, StreamedValue):
+        return not value
+    return value is None or (isinstance(value, (str, list, tuple, set, frozenset, dict)) and not value)
+
+
+def drop_empty(groups: list[ResolvedGroup], configs: list[PropertyGroupConfig]) -> list[ResolvedGroup]:
+    """Drop empty properties whose ``hide_empty`` is on, then groups left without properties.
+
+    ``hide_empty`` is taken from the property, else its group, else
+    ``OBJECT_DETAIL_HIDE_EMPTY``. ``groups`` must be aligned with ``configs``;
+    lazy placeholders are kept as they are.
+    """
+    default = get_hide_empty()
+    result = []
+    for group, config in zip(groups, configs):
+        if group.lazy:
+            result.append(group)
+            continue
+        group_default = config.hide_empty if config.hide_empty is not None else default
+        properties = [
+            prop
+            for prop, prop_config in zip(group.properties, config.properties)
+            if not (
+                (prop_config.hide_empty if prop_config.hide_empty is not None else group_default)
+                and is_empty(prop.value)
+            )
+        ]
+        if len(properties) == len(group.properties):
+            result.append(group)
+        elif properties:
+            group.properties = properties
+            result.append(group)
+    return result
+
+
+def is_visible(config: PropertyConfig | PropertyGroupConfig, request, obj) -> bool:
+    """Whether every ``visible_if`` check of ``config`` passes for ``request`` and ``obj``.
+
+    Permission strings are checked with ``request.user.has_perm()``, globally
+    or for ``obj``; callables are called as ``check(request, obj)``. Without a
+    request, permission checks fail.
+    """
+    if not config.visible_if:
+        return True
+    for check in config.visible_if:
+        if isinstance(check, str):
+            user = getattr(request, "user", None)
+            if user is None or not (user.has_perm(check) or user.has_perm(check, obj)):
+                return False
+        elif not check(request, obj):
+            return False
+    return True
+
+
+def visible_group(config: PropertyGroupConfig, request, obj) -> PropertyGroupConfig | None:
+    """Return ``config`` without its hidden properties, or None when nothing of it is visible."""
+    if not is_visible(config, request, obj):
+        return None
+    if not any(prop.visible_if for prop in config.properties):
+        return config
+    properties = [prop for prop in config.properties if is_visible(prop, request, obj)]
+    if not properties:
+        return None
+    return config.model_copy(update={"properties": properties})
+
+
+def visible_groups(groups: list[PropertyGroupConfig], request, obj) -> list[PropertyGroupConfig]:
+    """Filter ``groups`` by their ``visible_if`` checks and those of their properties.
+
+    The configs themselves are not changed, so parsed configs and lookup
+    plans stay shared between users. With ``obj=None`` the configs are
+    filtered once for several objects, as ``ObjectListMixin``,
+    ``{% render_object_compare %}`` and the export helpers do.
+    """
+    return [visible for config in groups if (visible := visible_group(config, request, obj)) is not None]
+
+
+def resolve_group(instance: models.Model, config: PropertyGroupConfig, view=None, request=None) -> ResolvedGroup:
+    """Resolve the visible properties of a group, without those hidden by ``hide_empty``.
+
+    A group that is hidden or left empty comes back without properties.
+    """
+    shown = resolve_all(instance, [config], view=view, request=request)
+    return shown[0] if shown else ResolvedGroup(title=config.title, description=config.description, icon=config.icon)
+
+
+def placeholder_group(config: PropertyGroupConfig, fragment_url: str) -> ResolvedGroup:
+    """Build an unresolved placeholder for a lazy group.
+
+    No property is resolved; the group is loaded later from ``fragment_url``.
+    """
     return ResolvedGroup(
         title=config.title,
         description=config.description,
         icon=config.icon,
-        properties=[resolve_property(instance, prop, view=view) for prop in config.properties],
+        lazy=True,
+        fragment_url=fragment_url,
     )
 
 
 def resolve_all(
-    instance: models.Model, groups: list[PropertyGroupConfig], view=None
+    instance: models.Model, groups: list[PropertyGroupConfig], view=None, request=None, aligned: bool = False
 ) -> list[ResolvedGroup]:
-    """Resolve all groups for an instance."""
-    return [resolve_group(instance, group, view=view) for group in groups]
+    """Resolve all groups for an instance.
+
+    Groups and properties whose ``visible_if`` fails for ``request`` (by
+    default ``view.request``) are skipped before anything is resolved. Empty
+    properties and groups are then dropped according to ``hide_empty`` (see
+    ``drop_empty``). Pass ``aligned=True`` to resolve every configured
+    property, keeping the result aligned with ``groups``.
+    """
+    if aligned:
+        return _resolve_groups(instance, groups, view=view)
+    if request is None:
+        request = getattr(view, "request", None)
+    groups = visible_groups(groups, request, instance)
+    return drop_empty(_resolve_groups(instance, groups, view=view), groups)
+
+
+def resolve_many(
+    objects: models.QuerySet | list[models.Model], groups: list[PropertyGroupConfig], view=None
+) -> list[list[ResolvedGroup]]:
+    """Resolve all groups for several instances of the same model.
+
+    Related objects needed by ``groups`` are loaded in bulk first (one query
+    per relation for all instances), so resolving adds no per-object queries
+    for plain relation paths.
+
+    When ``objects`` is a queryset and every property is a plain column
+    (possibly across foreign keys), the values are read with a single
+    ``values_list()`` query and no model instances are created. When only
+    some are, and reading them apart saves work (joins and related instances
+    for columns across foreign keys, or columns left out with ``only()``),
+    they are read with ``values_list()`` and instances are loaded in a second
+    query with the lookups of the other properties only. Sliced querysets
+    cannot be read twice and always load instances for every property.
+
+    Every result is aligned with ``groups``; ``visible_if`` and ``hide_empty``
+    are not applied.
+    """
+    from django_object_detail.plan import is_flat, plan_lookups
+
+    if isinstance(objects, models.QuerySet):
+        model = objects.model
+        flat = {id(prop) for group in groups for prop in group.properties if is_flat(model, prop)}
+        if all(id(prop) in flat for group in groups for prop in group.properties):
+            return _resolve_flat(objects, groups)
+        if flat and not objects.query.is_sliced:
+            rest = [
+                group.model_copy(update={"properties": [p for p in group.properties if id(p) not in flat]})
+                for group in groups
+            ]
+            plan = plan_lookups(model, rest)
+            joins = any(
+                len(get_property_meta(model, p.path).fields) > 1
+                for group in groups
+                for p in group.properties
+                if id(p) in flat
+            )
+            if joins or plan.only is not None:
+                return _resolve_split(objects, groups, flat, rest, plan, view)
+        instances = list(plan_lookups(model, groups).apply(objects))
+    else:
+        instances = list(objects)
+        if instances:
+            plan = plan_lookups(_common_model(instances), groups)
+            models.prefetch_related_objects(instances, *plan.select_related, *plan.prefetch_related)
+
+    return [resolve_all(instance, groups, view=view, aligned=True) for instance in instances]
+
+
+def _resolve_flat(queryset: models.QuerySet, groups: list[PropertyGroupConfig]) -> list[list[ResolvedGroup]]:
+    """Resolve column-only groups from one ``values_list()`` query."""
+    model = queryset.model
+    columns: dict[str, int] = {}
+    props = []
+    for group in groups:
+        for prop in group.properties:
+            columns.setdefault(prop.path, len(columns))
+            _, label, detail, field_type, is_many = _walk_meta(model, prop)
+            props.append((prop, columns[prop.path], label, detail, field_type, is_many))
+
+    result = []
+    for row in queryset.values_list(*columns):
+        values = iter(props)
+        resolved = []
+        for group in groups:
+            properties = []
+            for _ in group.properties:
+                prop, column, label, detail, field_type, is_many = next(values)
+                properties.append(_build_property(prop, label, detail, field_type, is_many, row[column]))
+            resolved.append(
+                ResolvedGroup(
+                    title=group.title, description=group.description, icon=group.icon, properties=properties
+                )
+            )
+        result.append(resolved)
+    return result
+
+
+def _resolve_split(
+    queryset: models.QuerySet,
+    groups: list[PropertyGroupConfig],
+    flat: set[int],
+    rest: list[PropertyGroupConfig],
+    plan,
+    view=None,
+) -> list[list[ResolvedGroup]]:
+    """Resolve the ``flat`` properties from ``values_list()`` and ``rest`` against instances loaded with ``plan``."""
+    model = queryset.model
+    columns: dict[str, int] = {"pk": 0}
+    metas = {}
+    for group in groups:
+        for prop in group.properties:
+            if id(prop) in flat:
+                columns.setdefault(prop.path, len(columns))
+                metas[id(prop)] = _walk_meta(model, prop)[1:]
+
+    rows = list(queryset.values_list(*columns))
+    # Both queries read the same unsliced queryset; rows deleted in between are skipped
+    instances = {obj.pk: obj for obj in plan.apply(queryset)}
+
+    result = []
+    for row in rows:
+        instance = instances.get(row[0])
+        if instance is None:
+            continue
+        resolved = []
+        for group, rest_group in zip(groups, resolve_all(instance, rest, view=view, aligned=True)):
+            others = iter(rest_group.properties)
+            properties = []
+            for prop in group.properties:
+                if id(prop) in flat:
+                    label, detail, field_type, is_many = metas[id(prop)]
+                    value = row[columns[prop.path]]
+                    properties.append(_build_property(prop, label, detail, field_type, is_many, value, view=view))
+                else:
+                    properties.append(next(others))
+            resolved.append(
+                ResolvedGroup(
+                    title=group.title, description=group.description, icon=group.icon, properties=properties
+                )
+            )
+        result.append(resolved)
+    return result
+
+
+def _common_model(instances: list[models.Model]) -> type[models.Model]:
+    model = type(instances[0])
+    for instance in instances[1:]:
+        if type(instance) is not model:
+            raise ValueError(f"Expected instances of {model.__name__}, got {type(instance).__name__}")
+    return model
+
+
+def resolve_compare(
+    objects: models.QuerySet | list[models.Model], groups: list[PropertyGroupConfig], view=None
+) -> list[ComparedGroup]:
+    """Resolve groups for several instances side by side.
+
+    Returns one ``ComparedGroup`` per group whose properties hold the resolved
+    value of every instance, in order, and whether those values differ.
+    """
+    per_object = resolve_many(objects, groups, view=view)
+    if not per_object:
+        return []
+
+    compared = []
+    for i, group in enumerate(per_object[0]):
+        properties = []
+        for j, prop in enumerate(group.properties):
+            values = [resolved[i].properties[j] for resolved in per_object]
+            properties.append(
+                ComparedProperty(
+                    path=prop.path,
+                    label=prop.label,
+                    detail=prop.detail,
+                    values=values,
+                    differs=any(v.value != prop.value for v in values[1:]),
+                )
+            )
+        compared.append(
+            ComparedGroup(title=group.title, description=group.description, icon=group.icon, properties=properties)
+        )
+    return compared
+
+
+def resolve_table(
+    objects: models.QuerySet | list[models.Model], groups: list[PropertyGroupConfig], view=None
+) -> ResolvedTable:
+    """Resolve several instances as table rows, one column per property.
+
+    Rows are resolved in bulk with ``resolve_many``; group boundaries are
+    flattened away.
+    """
+    model = objects.model if isinstance(objects, models.QuerySet) else None
+    per_object = resolve_many(objects, groups, view=view)
+    if model is None and per_object:
+        model = type(objects[0])
+
+    columns = []
+    if model is not None:
+        for group in groups:
+            for prop in group.properties:
+                label, detail = resolve_header(model, prop)
+                columns.append(ResolvedColumn(path=prop.path, label=label, detail=detail))
+
+    rows = [
+        ResolvedRow(properties=[prop for group in resolved for prop in group.properties])
+        for resolved in per_object
+    ]
+    return ResolvedTable(columns=columns, rows=rows)
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.db import DEFAULT_DB_ALIAS
+
+from django_object_detail.conf import get_read_after_write_seconds, get_read_database
+
+WRITE_SESSION_KEY = "object_detail_last_write"
+
+_read_database: ContextVar[str | None] = ContextVar("object_detail_read_database", default=None)
+
+
+@contextmanager
+def read_from(alias: str | None):
+    """Route reads made inside the block to ``alias`` (with ``ReadReplicaRouter`` installed)."""
+    token = _read_database.set(alias)
+    try:
+        yield
+    finally:
+        _read_database.reset(token)
+
+
+def current_read_database() -> str | None:
+    """Return the alias reads are routed to in the current context, if any."""
+    return _read_database.get()
+
+
+class ReadReplicaRouter:
+    """Database router sending reads made during detail resolution to the read alias.
+
+    Detail views load their object from the read alias themselves, and
+    related objects follow the database of the instance they are reached
+    from. The router also catches queries that are not tied to the object,
+    e.g. ``Model.objects`` calls in model methods or view callables. Writes
+    of instances loaded from the read alias go to the default database.
+    """
+
+    def db_for_read(self, model, **hints):
+        return _read_database.get()
+
+    def db_for_write(self, model, **hints):
+        instance = hints.get("instance")
+        if instance is not None and instance._state.db in {_read_database.get(), get_read_database()} - {None}:
+            return DEFAULT_DB_ALIAS
+        return None
+
+
+def mark_write(request) -> None:
+    """Read the primary database for this request and, with sessions, for the next few seconds.
+
+    Call this after handling a write so that the following detail page shows it
+    even if the replica lags behind (``OBJECT_DETAIL_READ_AFTER_WRITE_SECONDS``).
+    """
+    request._object_detail_wrote = True
+    session = getattr(request, "session", None)
+    if session is not None:
+        session[WRITE_SESSION_KEY] = time.time()
+
+
+def wrote_recently(request) -> bool:
+    """Whether ``request`` (or its session, recently) is marked with ``mark_write``."""
+    if request is None:
+        return False
+    if getattr(request, "_object_detail_wrote", False):
+        return True
+    session = getattr(request, "session", None)
+    written = session.get(WRITE_SESSION_KEY) if session is not None else None
+    return written is not None and time.time() - written < get_read_after_write_seconds()
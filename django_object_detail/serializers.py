@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import datetime
+import decimal
+import json
+import uuid
+from dataclasses import dataclass
+from typing import Any
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db import models
+from django.utils.functional import Promise
+
+from django_object_detail.resolvers import ResolvedGroup, ResolvedProperty, StreamedValue
+
+SCHEMA_VERSION = 1
+
+FORMATS = ("json", "msgpack")
+
+
+@dataclass(frozen=True)
+class DisplayObject:
+    """Stand-in for a serialized model instance: its pk and display text."""
+
+    pk: Any
+    text: str
+
+    def __str__(self) -> str:
+        return self.text
+
+
+def encode_value(value: Any) -> Any:
+    """Reduce a resolved value to JSON- and msgpack-compatible primitives.
+
+    Model instances become ``{"$": "object", "pk": ..., "text": str(obj)}``;
+    dates, times, decimals, UUIDs and dicts are tagged so ``decode_value``
+    restores their types. Anything else unknown is reduced to ``str()``.
+    """
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    if isinstance(value, (str, Promise)):
+        return str(value)
+    if isinstance(value, models.Model):
+        pk = value.pk if isinstance(value.pk, (int, str)) else str(value.pk)
+        return {"$": "object", "pk": pk, "text": str(value)}
+    if isinstance(value, DisplayObject):
+        return {"$": "object", "pk": value.pk, "text": value.text}
+    if isinstance(value, datetime.datetime):
+        return {"$": "datetime", "v": value.isoformat()}
+    if isinstance(value, datetime.date):
+        return {"$": "date", "v": value.isoformat()}
+    if isinstance(value, datetime.time):
+        return {"$": "time", "v": value.isoformat()}
+    if isinstance(value, decimal.Decimal):
+        return {"$": "decimal", "v": str(value)}
+    if isinstance(value, uuid.UUID):
+        return {"$": "uuid", "v": str(value)}
+    if isinstance(value, dict):
+        return {"$": "dict", "v": {str(k): encode_value(v) for k, v in value.items()}}
+    if isinstance(value, (list, tuple, set, frozenset, StreamedValue)):
+        return [encode_value(item) for item in value]
+    return str(value)
+
+
+_DECODERS = {
+    "datetime": datetime.datetime.fromisoformat,
+    "date": datetime.date.fromisoformat,
+    "time": datetime.time.fromisoformat,
+    "decimal": decimal.Decimal,
+    "uuid": uuid.UUID,
+}
+
+
+def decode_value(data: Any) -> Any:
+    """Inverse of ``encode_value``; model instances come back as ``DisplayObject``."""
+    if isinstance(data, list):
+        return [decode_value(item) for item in data]
+    if not isinstance(data, dict):
+        return data
+    kind = data["$"]
+    if kind == "object":
+        return DisplayObject(pk=data["pk"], text=data["text"])
+    if kind == "dict":
+        return {k: decode_value(v) for k, v in data["v"].items()}
+    return _DECODERS[kind](data["v"])
+
+
+# Fields left out of the serialized form when they hold their default
+_PROPERTY_DEFAULTS = {
+    "detail": None,
+    "type": "default",
+    "template": None,
+    "is_many": False,
+    "link_url": None,
+    "badge_css": None,
+    "badge_label": None,
+    "nested": None,
+}
+
+
+def _text(value: Any) -> str | None:
+    return str(value) if value is not None else None
+
+
+def dump_property(prop: ResolvedProperty) -> dict:
+    """Serialize a ``ResolvedProperty``; lazy strings are rendered in the active language."""
+    data = {
+        "path": prop.path,
+        "label": str(prop.label),
+        "value": encode_value(prop.value),
+        "detail": _text(prop.detail),
+        "type": prop.type,
+        "template": prop.template,
+        "is_many": prop.is_many,
+        "link_url": prop.link_url,
+        "badge_css": prop.badge_css,
+        "badge_label": _text(prop.badge_label),
+        "nested": [[dump_property(p) for p in item] for item in prop.nested] if prop.nested is not None else None,
+    }
+    return {
+        key: value
+        for key, value in data.items()
+        if key not in _PROPERTY_DEFAULTS or value != _PROPERTY_DEFAULTS[key]
+    }
+
+
+def load_property(data: dict) -> ResolvedProperty:
+    """Rebuild a ``ResolvedProperty`` from ``dump_property`` output."""
+    data = {**_PROPERTY_DEFAULTS, **data}
+    nested = data["nested"]
+    return ResolvedProperty(
+        path=data["path"],
+        label=data["label"],
+        value=decode_value(data["value"]),
+        detail=data["detail"],
+        type=data["type"],
+        template=data["template"],
+        is_many=data["is_many"],
+        link_url=data["link_url"],
+        badge_css=data["badge_css"],
+        badge_label=data["badge_label"],
+        nested=[[load_property(p) for p in item] for item in nested] if nested is not None else None,
+    )
+
+
+def dump_groups(groups: list[ResolvedGroup]) -> dict:
+    """Serialize resolved groups to a versioned, JSON-compatible dict."""
+    return {
+        "v": SCHEMA_VERSION,
+        "groups": [
+            {
+                key: value
+                for key, value in {
+                    "title": str(group.title),
+                    "description": _text(group.description),
+                    "icon": group.icon,
+                    "properties": [dump_property(prop) for prop in group.properties],
+                }.items()
+                if value is not None
+            }
+            for group in groups
+        ],
+    }
+
+
+def load_groups(data: dict) -> list[ResolvedGroup]:
+    """Rebuild resolved groups from ``dump_groups`` output.
+
+    Raises ``ValueError`` for data written with another schema version.
+    """
+    if data.get("v") != SCHEMA_VERSION:
+        raise ValueError(f"Unsupported schema version {data.get('v')!r}, expected {SCHEMA_VERSION}")
+    return [
+        ResolvedGroup(
+            title=group["title"],
+            description=group.get("description"),
+            icon=group.get("icon"),
+            properties=[load_property(prop) for prop in group["properties"]],
+        )
+        for group in data["groups"]
+    ]
+
+
+def _msgpack():
+    try:
+        import msgpack
+    except ImportError:
+        raise ImproperlyConfigured(
+            "The msgpack format requires msgpack. Install it with: pip install django-object-detail[msgpack]"
+        )
+    return msgpack
+
+
+def dumps(groups: list[ResolvedGroup], format: str = "json") -> bytes:
+    """Serialize resolved groups to compact JSON or msgpack bytes."""
+    data = dump_groups(groups)
+    if format == "json":
+        return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode()
+    if format == "msgpack":
+        return _msgpack().packb(data, use_bin_type=True)
+    raise ValueError(f"Unknown format {format!r}, expected one of {', '.join(FORMATS)}")
+
+
+def loads(payload: bytes, format: str = "json") -> list[ResolvedGroup]:
+    """Inverse of ``dumps``."""
+    if format == "json":
+        return load_groups(json.loads(payload))
+    if format == "msgpack":
+        return load_groups(_msgpack().unpackb(payload, raw=False))
+    raise ValueError(f"Unknown format {format!r}, expected one of {', '.join(FORMATS)}")
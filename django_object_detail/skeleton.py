@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+
+from django.utils import translation
+from django.utils.html import escape
+
+from django_object_detail.conf import get_layout_pack, get_skeleton_cache_size, get_types_pack
+from django_object_detail.resolvers import ResolvedGroup, ResolvedProperty
+
+# Labels and details are escaped when rendered, so the marker cannot come from content
+_SLOT = re.compile(r"<!--od-slot:(\d+)-->")
+
+
+@dataclass
+class SlotProperty(ResolvedProperty):
+    """Stand-in property whose value renders as a slot marker in a skeleton."""
+
+    slot: int = 0
+
+    @property
+    def marker(self) -> str:
+        return f"<!--od-slot:{self.slot}-->"
+
+
+@dataclass(frozen=True)
+class Skeleton:
+    """Rendered markup of a group structure, split around its value slots.
+
+    ``parts`` alternates static markup with slot indexes and always starts
+    and ends with markup.
+    """
+
+    parts: tuple[str | int, ...]
+
+    def fill(self, values: list[str]) -> str:
+        return "".join(part if isinstance(part, str) else values[part] for part in self.parts)
+
+
+_skeletons: OrderedDict[tuple, Skeleton] = OrderedDict()
+_skeletons_lock = threading.Lock()
+
+
+def skeleton_key(groups: list[ResolvedGroup]) -> tuple:
+    """Return the cache key of the static markup of ``groups``.
+
+    Everything a layout template reads besides the value cells is part of the
+    key, together with the layout and types packs and the active language.
+    """
+    return (
+        get_layout_pack(),
+        get_types_pack(),
+        translation.get_language(),
+        tuple(
+            (
+                str(group.title),
+                str(group.description) if group.description is not None else None,
+                group.icon,
+                tuple((prop.path, str(prop.label), str(prop.detail) if prop.detail else None) for prop in group.properties),
+            )
+            for group in groups
+        ),
+    )
+
+
+def slot_groups(groups: list[ResolvedGroup]) -> list[ResolvedGroup]:
+    """Return copies of ``groups`` whose properties render as numbered slots."""
+    slot = 0
+    result = []
+    for group in groups:
+        properties = []
+        for prop in group.properties:
+            properties.append(
+                SlotProperty(path=prop.path, label=prop.label, value=None, detail=prop.detail, slot=slot)
+            )
+            slot += 1
+        result.append(replace(group, properties=properties))
+    return result
+
+
+def get_skeleton(groups: list[ResolvedGroup], render: Callable[[list[ResolvedGroup]], str]) -> Skeleton:
+    """Return the cached skeleton of ``groups``, rendering it with ``render`` on a miss.
+
+    Skeletons are kept in a bounded LRU (``OBJECT_DETAIL_SKELETON_CACHE_SIZE``).
+    """
+    key = skeleton_key(groups)
+    with _skeletons_lock:
+        skeleton = _skeletons.get(key)
+        if skeleton is not None:
+            _skeletons.move_to_end(key)
+            return skeleton
+
+    pieces = _SLOT.split(render(slot_groups(groups)))
+    skeleton = Skeleton(parts=tuple(int(p) if i % 2 else p for i, p in enumerate(pieces)))
+
+    with _skeletons_lock:
+        _skeletons[key] = skeleton
+        _skeletons.move_to_end(key)
+        while len(_skeletons) > get_skeleton_cache_size():
+            _skeletons.popitem(last=False)
+    return skeleton
+
+
+def clear_skeletons() -> None:
+    """Drop all cached skeletons, e.g. after changing layout templates at runtime."""
+    with _skeletons_lock:
+        _skeletons.clear()
+
+
+def can_use_skeleton(groups: list[ResolvedGroup]) -> bool:
+    """Lazy placeholders carry per-object fragment URLs, so they are rendered in full."""
+    return bool(groups) and not any(group.lazy for group in groups)
+
+
+def render_with_skeleton(
+    groups: list[ResolvedGroup],
+    render: Callable[[list[ResolvedGroup]], str],
+    render_value: Callable[[ResolvedProperty], str],
+) -> str:
+    """Render ``groups`` by filling the cached skeleton with the value cell of each property.
+
+    The value cell is the property's value markup, wrapped in its link the
+    same way the layout templates do.
+    """
+    skeleton = get_skeleton(groups, render)
+    values = []
+    for group in groups:
+        for prop in group.properties:
+            html = render_value(prop)
+            if prop.link_url:
+                html = f'<a href="{escape(prop.link_url)}">{html}</a>'
+            values.append(html)
+    return skeleton.fill(values)
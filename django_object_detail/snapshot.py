@@ -0,0 +1,310 @@
+from __future__ import annotations
+
+import hashlib
+import weakref
+from dataclasses import dataclass, field
+from typing import Any
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import models
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.utils import translation
+from django.utils.functional import Promise
+from pydantic import BaseModel
+
+from django_object_detail.config import PropertyConfig, PropertyGroupConfig, parse_property_display_cached
+from django_object_detail.plan import plan_lookups
+from django_object_detail.resolvers import (
+    ResolvedGroup,
+    drop_empty,
+    get_property_meta,
+    resolve_all,
+    resolve_header,
+    resolve_many,
+    visible_group,
+)
+from django_object_detail.serializers import dump_property, load_property
+
+SNAPSHOT_VERSION = 2
+
+# Applied when rendering from the snapshot, so changing them keeps stored values valid
+_RENDER_OPTIONS = {"title", "detail", "visible_if", "hide_empty"}
+
+# Config digest per config id; entries go with their config
+_digests: dict[int, str] = {}
+
+
+def _stable(value: Any) -> Any:
+    """Reduce a config value to plain data that ``repr()`` renders the same in every process."""
+    if isinstance(value, BaseModel):
+        return [(name, _stable(getattr(value, name))) for name in type(value).model_fields]
+    if isinstance(value, dict):
+        return sorted((str(k), _stable(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return [_stable(v) for v in value]
+    if isinstance(value, Promise):
+        # The message id, not its translation in the active language
+        with translation.override(None):
+            return str(value)
+    if callable(value):
+        return f"{getattr(value, '__module__', '')}.{getattr(value, '__qualname__', repr(value))}"
+    return value
+
+
+def config_digest(config: PropertyConfig) -> str:
+    """Return a digest of every option of ``config`` that changes its stored value, nested ones included."""
+    digest = _digests.get(id(config))
+    if digest is None:
+        options = [
+            (name, _stable(getattr(config, name))) for name in PropertyConfig.model_fields if name not in _RENDER_OPTIONS
+        ]
+        digest = hashlib.md5(repr(options).encode(), usedforsecurity=False).hexdigest()[:8]
+        _digests[id(config)] = digest
+        weakref.finalize(config, _digests.pop, id(config), None)
+    return digest
+
+
+def snapshot_signature(groups: list[PropertyGroupConfig]) -> list[list[str]]:
+    """Return the paths and config digests of ``groups``; a snapshot is only used for the same signature."""
+    return [[f"{prop.path}:{config_digest(prop)}" for prop in group.properties] for group in groups]
+
+
+def snapshot_from_resolved(resolved: list[ResolvedGroup], groups: list[PropertyGroupConfig]) -> dict:
+    """Build the JSON-compatible snapshot of already resolved groups.
+
+    Properties use the format of ``django_object_detail.serializers``.
+    """
+    return {
+        "version": SNAPSHOT_VERSION,
+        "signature": snapshot_signature(groups),
+        "groups": [[dump_property(prop) for prop in group.properties] for group in resolved],
+    }
+
+
+def build_snapshot(instance: models.Model, groups: list[PropertyGroupConfig], view=None) -> dict:
+    """Resolve ``groups`` for ``instance`` and return the snapshot to store."""
+    return snapshot_from_resolved(resolve_all(instance, groups, view=view, aligned=True), groups)
+
+
+def snapshot_to_groups(
+    snapshot: dict | None,
+    model: type[models.Model],
+    groups: list[PropertyGroupConfig],
+    request=None,
+    obj: models.Model | None = None,
+) -> list[ResolvedGroup] | None:
+    """Rebuild resolved groups from a stored snapshot without touching relations.
+
+    Returns None when the snapshot is missing or was built for another
+    configuration (``snapshot_signature()``).
+    Snapshots hold every property; ``visible_if`` (for ``request`` and
+    ``obj``) and ``hide_empty`` are applied here.
+    Group titles and top-level labels come from ``groups`` and the model, so
+    they follow the active language; nested labels are stored as built.
+    """
+    if not snapshot or snapshot.get("version") != SNAPSHOT_VERSION:
+        return None
+    if snapshot.get("signature") != snapshot_signature(groups):
+        return None
+
+    result = []
+    shown = []
+    for config, stored in zip(groups, snapshot["groups"]):
+        visible = visible_group(config, request, obj)
+        if visible is None:
+            continue
+        shown_ids = {id(prop) for prop in visible.properties}
+        properties = []
+        for prop_config, data in zip(config.properties, stored):
+            if id(prop_config) not in shown_ids:
+                continue
+            prop = load_property(data)
+            prop.label, prop.detail = resolve_header(model, prop_config)
+            properties.append(prop)
+        result.append(
+            ResolvedGroup(title=config.title, description=config.description, icon=config.icon, properties=properties)
+        )
+        shown.append(visible)
+    return drop_empty(result, shown)
+
+
+@dataclass
+class SnapshotSpec:
+    """A model whose ``field_name`` stores the snapshot of ``groups``, with its dependent relations."""
+
+    model: type[models.Model]
+    groups: list[PropertyGroupConfig]
+    field_name: str
+    # (related model, lookup from ``model`` to it)
+    dependencies: list[tuple[type[models.Model], str]] = field(default_factory=list)
+    # (through model, lookup up to and including the many-to-many segment, models on either side)
+    m2m: list[tuple[type[models.Model], str, type[models.Model], type[models.Model]]] = field(default_factory=list)
+    receivers: list[tuple[Any, Any, str]] = field(default_factory=list)
+
+
+_registry: dict[type[models.Model], SnapshotSpec] = {}
+
+
+def _collect_dependencies(
+    model: type[models.Model], props: list[PropertyConfig], prefix: str, spec: SnapshotSpec
+) -> None:
+    for prop in props:
+        meta = get_property_meta(model, prop.path)
+        if not hasattr(model, meta.segments[0]):
+            # Snapshots are refreshed from signals, where there is no view to fall back to
+            raise ImproperlyConfigured(
+                f"Snapshot of {spec.model._meta.label} cannot store '{prop.path}': "
+                f"{model._meta.label} has no attribute '{meta.segments[0]}' and view methods are not supported."
+            )
+        lookups = []
+        near = model
+        for segment, field_obj in zip(meta.segments, meta.fields):
+            if not field_obj.is_relation or field_obj.related_model is None:
+                break
+            lookups.append(segment)
+            lookup = "__".join([prefix, *lookups] if prefix else lookups)
+            if (field_obj.related_model, lookup) not in spec.dependencies:
+                spec.dependencies.append((field_obj.related_model, lookup))
+            if field_obj.many_to_many:
+                through = getattr(field_obj, "through", None) or field_obj.remote_field.through
+                entry = (through, lookup, near, field_obj.related_model)
+                if entry not in spec.m2m:
+                    spec.m2m.append(entry)
+            near = field_obj.related_model
+        if prop.nested and len(meta.fields) == len(meta.segments) and meta.fields[-1].related_model is not None:
+            nested_prefix = f"{prefix}__{prop.path}" if prefix else prop.path
+            _collect_dependencies(meta.fields[-1].related_model, prop.nested, nested_prefix, spec)
+
+
+def register_snapshot(
+    model: type[models.Model], property_display: list[dict] | list[PropertyGroupConfig], field: str = "detail_snapshot"
+) -> SnapshotSpec:
+    """Keep ``model.<field>`` (a ``JSONField``) filled with the snapshot of ``property_display``.
+
+    The snapshot is refreshed when an instance is saved, when related objects
+    used by a property path are saved or deleted, and when a many-to-many
+    relation on a path changes. Call this from ``AppConfig.ready()``.
+
+    Every path must start on the model: snapshots are built without a view,
+    so view-method properties raise ``ImproperlyConfigured``.
+    """
+    unregister_snapshot(model)
+    spec = SnapshotSpec(model=model, groups=parse_property_display_cached(property_display), field_name=field)
+    _collect_dependencies(model, [p for g in spec.groups for p in g.properties], "", spec)
+
+    def on_saved(sender, instance, raw=False, update_fields=None, **kwargs):
+        if raw or (update_fields is not None and set(update_fields) <= {spec.field_name}):
+            return
+        refresh_snapshots(model, pks=[instance.pk])
+
+    _connect(spec, post_save, on_saved, model, "root")
+
+    for related_model, lookup in spec.dependencies:
+        _connect_related(spec, related_model, lookup)
+    for through, lookup, near, far in spec.m2m:
+        _connect_m2m(spec, through, lookup, near, far)
+
+    _registry[model] = spec
+    return spec
+
+
+def _connect(spec: SnapshotSpec, signal, receiver, sender, name: str) -> None:
+    uid = f"object_detail_snapshot:{spec.model._meta.label_lower}:{name}"
+    signal.connect(receiver, sender=sender, weak=False, dispatch_uid=uid)
+    spec.receivers.append((signal, sender, uid))
+
+
+def _affected(spec: SnapshotSpec, lookup: str, objects) -> set:
+    return set(spec.model._default_manager.filter(**{f"{lookup}__in": objects}).values_list("pk", flat=True))
+
+
+def _connect_related(spec: SnapshotSpec, related_model: type[models.Model], lookup: str) -> None:
+    pending_attr = f"_od_snapshot_{lookup}"
+
+    def on_saved(sender, instance, raw=False, **kwargs):
+        if not raw:
+            refresh_snapshots(spec.model, pks=_affected(spec, lookup, [instance.pk]))
+
+    def on_pre_delete(sender, instance, **kwargs):
+        setattr(instance, pending_attr, _affected(spec, lookup, [instance.pk]))
+
+    def on_deleted(sender, instance, **kwargs):
+        refresh_snapshots(spec.model, pks=getattr(instance, pending_attr, ()))
+
+    _connect(spec, post_save, on_saved, related_model, f"{lookup}:save")
+    _connect(spec, pre_delete, on_pre_delete, related_model, f"{lookup}:pre_delete")
+    _connect(spec, post_delete, on_deleted, related_model, f"{lookup}:delete")
+
+
+def _connect_m2m(
+    spec: SnapshotSpec, through: type[models.Model], lookup: str, near: type[models.Model], far: type[models.Model]
+) -> None:
+    # ``lookup`` ends at the many-to-many segment, ``owner`` at the object on the near side of it
+    owner = lookup.rpartition("__")[0]
+    pending_attr = f"_od_snapshot_m2m_{lookup}"
+
+    def roots(obj_model, pks) -> set:
+        found = set()
+        if not pks:
+            return found
+        if issubclass(obj_model, far):
+            found |= _affected(spec, lookup, pks)
+        if issubclass(obj_model, near):
+            found |= _affected(spec, owner, pks) if owner else set(pks)
+        return found
+
+    def on_changed(sender, instance, action, model, pk_set, **kwargs):
+        # Links being removed are only visible before the change, added ones only after it
+        pks = roots(type(instance), [instance.pk]) | roots(model, list(pk_set or ()))
+        if action.startswith("pre_"):
+            setattr(instance, pending_attr, pks)
+        else:
+            refresh_snapshots(spec.model, pks=pks | getattr(instance, pending_attr, set()))
+
+    _connect(spec, m2m_changed, on_changed, through, f"{lookup}:m2m")
+
+
+def unregister_snapshot(model: type[models.Model]) -> None:
+    """Disconnect the snapshot signals of ``model``."""
+    spec = _registry.pop(model, None)
+    if spec is None:
+        return
+    for signal, sender, uid in spec.receivers:
+        signal.disconnect(sender=sender, dispatch_uid=uid)
+
+
+def get_snapshot_spec(model: type[models.Model]) -> SnapshotSpec | None:
+    return _registry.get(model)
+
+
+def registered_snapshot_models() -> list[type[models.Model]]:
+    return list(_registry)
+
+
+def refresh_snapshots(model: type[models.Model], pks=None, batch_size: int = 500) -> int:
+    """Rebuild and store the snapshots of ``model`` (all rows, or only ``pks``).
+
+    Instances are resolved ``batch_size`` at a time with their relations
+    loaded in bulk and written back with ``bulk_update()``, which sends no
+    signals. Snapshots are built in ``settings.LANGUAGE_CODE``. Returns the
+    number of updated rows.
+    """
+    spec = _registry[model]
+    manager = model._default_manager
+    if pks is None:
+        pks = list(manager.order_by("pk").values_list("pk", flat=True))
+    else:
+        pks = sorted(pks)
+
+    plan = plan_lookups(model, spec.groups)
+    updated = 0
+    with translation.override(settings.LANGUAGE_CODE):
+        for start in range(0, len(pks), batch_size):
+            queryset = manager.filter(pk__in=pks[start : start + batch_size])
+            queryset = queryset.select_related(*plan.select_related).prefetch_related(*plan.prefetch_related)
+            instances = list(queryset)
+            for instance, resolved in zip(instances, resolve_many(instances, spec.groups)):
+                setattr(instance, spec.field_name, snapshot_from_resolved(resolved, spec.groups))
+            updated += manager.bulk_update(instances, [spec.field_name])
+    return updated
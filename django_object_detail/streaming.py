@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.template.loader import select_template
+
+from django_object_detail.conf import get_property_text_newline, get_types_pack
+from django_object_detail.resolvers import ResolvedProperty, StreamedValue
+
+# Values are escaped when rendered, so the marker cannot come from content
+_STREAM = re.compile(r"<!--od-stream:(\d+)-->")
+
+_streams: ContextVar[list[ResolvedProperty] | None] = ContextVar("object_detail_streams", default=None)
+
+
+@contextmanager
+def collect_streams():
+    """Render streamed properties inside the block as markers, collecting them in the yielded list."""
+    streams: list[ResolvedProperty] = []
+    token = _streams.set(streams)
+    try:
+        yield streams
+    finally:
+        _streams.reset(token)
+
+
+def stream_marker(prop: ResolvedProperty) -> str | None:
+    """Return the marker for ``prop`` when it is streamed inside ``collect_streams()``, else None."""
+    streams = _streams.get()
+    if streams is None or not isinstance(prop.value, StreamedValue):
+        return None
+    streams.append(prop)
+    return f"<!--od-stream:{len(streams) - 1}-->"
+
+
+def render_stream(prop: ResolvedProperty, request=None) -> Iterator[str]:
+    """Render the value of a streamed property one chunk at a time.
+
+    Each chunk is rendered with the property's type template as a list of its
+    own; an empty relation renders the template once with an empty list.
+    """
+    types_pack = get_types_pack()
+    if prop.template:
+        template_names = [prop.template]
+    else:
+        template_names = [
+            f"django_object_detail/types/{types_pack}/{prop.type}.html",
+            f"django_object_detail/types/{types_pack}/stream.html",
+            "django_object_detail/types/default/stream.html",
+        ]
+    tpl = select_template(template_names)
+    od_settings = {
+        "property_text_newline": get_property_text_newline(),
+    }
+    empty = True
+    for chunk in prop.value.chunks():
+        empty = False
+        yield tpl.render({"prop": prop, "value": chunk, "od_settings": od_settings}, request)
+    if empty:
+        yield tpl.render({"prop": prop, "value": [], "od_settings": od_settings}, request)
+
+
+def stream_html(html: str, streams: list[ResolvedProperty], request=None) -> Iterator[str]:
+    """Yield ``html`` with the markers of ``streams`` replaced by their values, rendered incrementally."""
+    for i, part in enumerate(_STREAM.split(html)):
+        if i % 2:
+            yield from render_stream(streams[int(part)], request)
+        elif part:
+            yield part
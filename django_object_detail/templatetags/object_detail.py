@@ -1,3 +1,5 @@
+import time
+
 from django import template
 from django.template.loader import select_template
 from django.utils.safestring import mark_safe
@@ -6,43 +8,144 @@ from django_object_detail.conf import (
     build_icon_class,
     build_named_icon_class,
     get_layout_pack,
+    get_list_layout_pack,
+    get_metrics_enabled,
     get_property_text_newline,
+    get_skeleton_render,
     get_types_pack,
 )
-from django_object_detail.config import parse_property_display
-from django_object_detail.resolvers import ResolvedGroup, resolve_all
+from django_object_detail.instrumentation import current_recording
+from django_object_detail.metrics import observe_render
+from django_object_detail.resolvers import ResolvedGroup, resolve_all, resolve_compare, visible_groups
+from django_object_detail.skeleton import SlotProperty, can_use_skeleton, render_with_skeleton
+from django_object_detail.streaming import stream_marker
 
 register = template.Library()
 
 
 @register.simple_tag(takes_context=True)
-def render_object_detail(context, obj, groups=None, property_display=None):
+def render_object_detail(context, obj, groups=None, property_display=None, skeleton=None):
     """Render all property groups for an object.
 
     ``groups`` can be pre-resolved ``ResolvedGroup`` instances (from the mixin)
     or a raw ``property_display`` list that will be parsed and resolved here.
+    Parsed configs are cached per list, so rendering the same config in a
+    loop parses it once.
+
+    With ``skeleton=True`` (default: ``OBJECT_DETAIL_SKELETON_RENDER``) the
+    markup around the values is rendered once per structure and cached, and
+    only the values are rendered per object.
     """
+    recording = current_recording()
+    start = recording.mark() if recording is not None else None
+    started = time.perf_counter()
+    view = context.get("view")
     if groups is None and property_display is not None:
-        configs = parse_property_display(property_display)
-        view = context.get("view")
-        groups = resolve_all(obj, configs, view=view)
+        from django_object_detail.config import parse_property_display_cached
+
+        configs = parse_property_display_cached(property_display)
+        groups = resolve_all(obj, configs, view=view, request=context.get("request"))
 
     pack = get_layout_pack()
     tpl = select_template([
         f"django_object_detail/layouts/{pack}/object_detail.html",
         "django_object_detail/object_detail.html",
     ])
-    return mark_safe(tpl.render({"groups": groups or []}, context.get("request")))
+    request = context.get("request")
+    if skeleton is None:
+        skeleton = get_skeleton_render()
+    skeleton = skeleton and can_use_skeleton(groups)
+    if skeleton:
+        html = render_with_skeleton(
+            groups,
+            render=lambda slots: tpl.render({"groups": slots}, request),
+            render_value=lambda prop: render_property_value(context, prop),
+        )
+    else:
+        html = tpl.render({"groups": groups or []}, request)
+    if recording is not None:
+        recording.call_rendered(view, groups, start, skeleton=skeleton)
+    if get_metrics_enabled():
+        observe_render(view, (time.perf_counter() - started) * 1000)
+    return mark_safe(html)
 
 
 @register.simple_tag(takes_context=True)
-def render_group(context, group):
-    """Render a single property group using the configured layout pack."""
+def render_object_compare(context, objects, groups=None, property_display=None):
+    """Render several objects side by side, one column per object.
+
+    ``groups`` can be pre-resolved ``ComparedGroup`` instances (from
+    ``resolve_compare``) or a raw ``property_display`` list that will be
+    parsed and resolved here for all ``objects`` at once, without the
+    groups and properties whose ``visible_if`` fails for the request.
+    """
+    objects = list(objects)
+    if groups is None and property_display is not None:
+        from django_object_detail.config import parse_property_display_cached
+
+        configs = visible_groups(parse_property_display_cached(property_display), context.get("request"), None)
+        view = context.get("view")
+        groups = resolve_compare(objects, configs, view=view)
+
     pack = get_layout_pack()
     tpl = select_template([
-        f"django_object_detail/layouts/{pack}/group.html",
+        f"django_object_detail/layouts/{pack}/compare.html",
+        "django_object_detail/compare.html",
     ])
-    return mark_safe(tpl.render({"group": group}, context.get("request")))
+    return mark_safe(tpl.render({"objects": objects, "groups": groups or []}, context.get("request")))
+
+
+@register.simple_tag(takes_context=True)
+def render_object_list(
+    context, table, next_cursor=None, previous_cursor=None, cursor_param="cursor", next_url=None, previous_url=None
+):
+    """Render a ``ResolvedTable`` (from ``ObjectListMixin``) with keyset pagination links.
+
+    Pass ``next_url`` and ``previous_url`` from ``ObjectListMixin`` to keep the
+    other query parameters; links built from the cursors alone drop them.
+    """
+    if next_url is None and next_cursor:
+        next_url = f"?{cursor_param}={next_cursor}"
+    if previous_url is None and previous_cursor:
+        previous_url = f"?{cursor_param}={previous_cursor}"
+    pack = get_list_layout_pack()
+    tpl = select_template([
+        f"django_object_detail/layouts/{pack}/object_list.html",
+        "django_object_detail/layouts/table-list/object_list.html",
+    ])
+    return mark_safe(tpl.render({
+        "table": table,
+        "next_cursor": next_cursor,
+        "previous_cursor": previous_cursor,
+        "cursor_param": cursor_param,
+        "next_url": next_url,
+        "previous_url": previous_url,
+    }, context.get("request")))
+
+
+@register.simple_tag(takes_context=True)
+def render_group(context, group):
+    """Render a single property group using the configured layout pack.
+
+    Lazy groups render as a lightweight placeholder that loads the group
+    from its fragment URL.
+    """
+    recording = current_recording()
+    start = recording.mark() if recording is not None else None
+    pack = get_layout_pack()
+    if group.lazy:
+        tpl = select_template([
+            f"django_object_detail/layouts/{pack}/group_placeholder.html",
+            "django_object_detail/group_placeholder.html",
+        ])
+    else:
+        tpl = select_template([
+            f"django_object_detail/layouts/{pack}/group.html",
+        ])
+    html = tpl.render({"group": group}, context.get("request"))
+    if recording is not None:
+        recording.group_rendered(group, start)
+    return mark_safe(html)
 
 
 @register.simple_tag(takes_context=True)
@@ -59,8 +162,16 @@ def render_property(context, prop):
 def render_property_value(context, prop):
     """Render the value of a property using its type-specific template.
 
-    Returns the rendered HTML string.
+    Returns the rendered HTML string. Streamed values render as a marker
+    while a streaming response is being prepared (see ``StreamingObjectDetailMixin``).
     """
+    if isinstance(prop, SlotProperty):
+        return mark_safe(prop.marker)
+    marker = stream_marker(prop)
+    if marker is not None:
+        return mark_safe(marker)
+    recording = current_recording()
+    start = recording.mark() if recording is not None else None
     types_pack = get_types_pack()
     if prop.badge_css:
         template_names = [
@@ -80,7 +191,11 @@ def render_property_value(context, prop):
     od_settings = {
         "property_text_newline": get_property_text_newline(),
     }
-    return tpl.render({"prop": prop, "value": prop.value, "od_settings": od_settings}, context.get("request"))
+    html = tpl.render({"prop": prop, "value": prop.value, "od_settings": od_settings}, context.get("request"))
+    if recording is not None:
+        origin = getattr(tpl, "origin", None)
+        recording.property_rendered(prop, origin.template_name if origin is not None else None, start)
+    return html
 
 
 @register.filter
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass, field
+
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+
+from django_object_detail.explain import explain, normalize_sql
+from django_object_detail.templatetags.object_detail import render_group
+
+
+@dataclass
+class DetailQueries:
+    """Queries issued while resolving and rendering a view's detail block."""
+
+    queries: list[str] = field(default_factory=list)
+    html: str = ""
+
+    @property
+    def repeated(self) -> list[tuple[str, int]]:
+        """Query patterns issued more than once, with their counts."""
+        counts = Counter(normalize_sql(sql) for sql in self.queries)
+        return [(pattern, n) for pattern, n in counts.items() if n > 1]
+
+
+def _setup_view(view_class, obj, request=None, **kwargs):
+    if not kwargs:
+        kwargs = {getattr(view_class, "pk_url_kwarg", "pk"): obj.pk}
+    view = view_class()
+    view.setup(request or RequestFactory().get("/"), **kwargs)
+    view.object = view.get_object()
+    return view
+
+
+def capture_detail_queries(view_class, obj, request=None, using: str = DEFAULT_DB_ALIAS, **kwargs) -> DetailQueries:
+    """Resolve and render the detail block of ``view_class`` for ``obj`` under query capture.
+
+    The object is loaded with the view's own ``get_object()`` before capturing,
+    so only the queries of the property groups are counted. ``kwargs`` are
+    the URL keyword arguments passed to ``view.setup()``; they default to
+    ``obj.pk`` under the view's ``pk_url_kwarg``.
+    """
+    view = _setup_view(view_class, obj, request, **kwargs)
+    with CaptureQueriesContext(connections[using]) as captured:
+        context = view.get_context_data()
+        html = "".join(
+            render_group({"request": view.request}, group) for group in context.get("object_detail_groups", [])
+        )
+    return DetailQueries(queries=[q["sql"] for q in captured.captured_queries], html=html)
+
+
+def assert_detail_queries(
+    view_class,
+    obj,
+    max_queries: int,
+    allow_repeated: bool = False,
+    request=None,
+    using: str = DEFAULT_DB_ALIAS,
+    **kwargs,
+) -> str:
+    """Fail if the detail block of ``view_class`` for ``obj`` exceeds its query budget.
+
+    Fails when more than ``max_queries`` queries are issued or, unless
+    ``allow_repeated``, when the same query pattern runs more than once (the
+    usual sign of one query per related row). The failure message attributes
+    queries to property paths. Returns the rendered HTML.
+    """
+    result = capture_detail_queries(view_class, obj, request=request, using=using, **kwargs)
+    problems = []
+    if len(result.queries) > max_queries:
+        problems.append(f"{len(result.queries)} queries, expected at most {max_queries}")
+    if result.repeated and not allow_repeated:
+        problems.append(f"{len(result.repeated)} query patterns repeated")
+    if problems:
+        view = _setup_view(view_class, obj, request, **kwargs)
+        raise AssertionError(_failure_message(view, problems, result, using))
+    return result.html
+
+
+def _failure_message(view, problems: list[str], result: DetailQueries, using: str) -> str:
+    instance = view.get_object_for_detail()
+    report = explain(type(instance), instance.pk, view.get_property_display(), view=view, using=using)
+
+    lines = [f"{type(view).__name__} for pk={instance.pk}: {', '.join(problems)}.", "Queries per property path:"]
+    for prop in report.properties:
+        if not prop.queries:
+            continue
+        line = f"  {prop.path}: {len(prop.queries)} queries"
+        if prop.repeated:
+            line += f", repeated {max(n for _, n in prop.repeated)}x"
+        lines.append(line)
+    for pattern, count in result.repeated:
+        paths = [p.path for p in report.properties if pattern in {normalize_sql(sql) for sql in p.queries}]
+        lines.append(f"Repeated {count}x from {', '.join(paths) or 'unknown property'}: {pattern}")
+    lines.append("Captured queries:")
+    lines.extend(f"  {i}. {sql}" for i, sql in enumerate(result.queries, start=1))
+    return "\n".join(lines)
+
+
+class DetailQueryAssertionsMixin:
+    """``TestCase`` mixin adding ``assertDetailQueries``.
+
+    ::
+
+        class BookDetailTests(DetailQueryAssertionsMixin, TestCase):
+            def test_queries(self):
+                self.assertDetailQueries(BookDetailView, self.book, 3)
+    """
+
+    def assertDetailQueries(self, view_class, obj, max_queries: int, allow_repeated: bool = False, **kwargs) -> str:
+        try:
+            return assert_detail_queries(view_class, obj, max_queries, allow_repeated=allow_repeated, **kwargs)
+        except AssertionError as e:
+            raise self.failureException(str(e)) from None
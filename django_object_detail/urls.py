@@ -0,0 +1,12 @@
+from django.urls import path
+
+from django_object_detail.views import ObjectDetailGroupView
+
+
+def group_fragment_path(route: str, detail_view, name: str | None = None):
+    """Return a URL pattern serving single-group fragments of ``detail_view``.
+
+    ``route`` must capture the detail view's lookup kwargs and an integer
+    ``group``, e.g. ``"books/<int:pk>/groups/<int:group>/"``.
+    """
+    return path(route, ObjectDetailGroupView.as_view(detail_view=detail_view), name=name)
@@ -1,7 +1,35 @@
 from __future__ import annotations
 
-from django_object_detail.config import PropertyGroupConfig, parse_property_display
-from django_object_detail.resolvers import resolve_all
+import base64
+import binascii
+import json
+import time
+
+from django.core.exceptions import PermissionDenied, ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from django.http import Http404, HttpResponse, JsonResponse, StreamingHttpResponse
+from django.urls import reverse
+from django.views import View
+
+from django_object_detail.conf import get_lazy_groups, get_metrics_enabled, get_read_database
+from django_object_detail.config import PropertyGroupConfig, parse_property_display_cached
+from django_object_detail.instrumentation import record
+from django_object_detail.metrics import collect_published, observe_resolution, registry, summarize
+from django_object_detail.resolvers import (
+    ResolvedGroup,
+    drop_empty,
+    placeholder_group,
+    resolve_all,
+    resolve_group,
+    resolve_table,
+    visible_group,
+    visible_groups,
+)
+from django_object_detail.routers import read_from, wrote_recently
+from django_object_detail.snapshot import snapshot_to_groups
+from django_object_detail.streaming import collect_streams, stream_html
+from django_object_detail.templatetags.object_detail import render_group
 
 
 class ObjectDetailMixin:
@@ -12,25 +40,319 @@ class ObjectDetailMixin:
 
     The resolved groups are added to the template context as
     ``object_detail_groups``.
+
+    Groups marked ``lazy=True`` are rendered as placeholders that load
+    from ``group_fragment_url_name`` (see ``ObjectDetailGroupView``).
+    Without a fragment URL name, lazy groups are resolved eagerly.
+
+    With ``snapshot_field`` set, groups are rendered from the snapshot stored
+    in that field (see ``django_object_detail.snapshot``) when it matches the
+    current ``property_display``, without resolving any relation.
+
+    With ``read_database`` (or ``OBJECT_DETAIL_READ_DATABASE``) set, the object
+    is loaded from that alias and resolution runs under ``read_from()``, unless
+    the request was marked with ``mark_write()``.
     """
 
     property_display: list[dict] | list[PropertyGroupConfig] | None = None
+    group_fragment_url_name: str | None = None
+    snapshot_field: str | None = None
+    read_database: str | None = None
+    fragment_group: int | None = None
 
     def get_property_display(self) -> list[PropertyGroupConfig]:
         raw = self.property_display
         if raw is None:
             return []
-        if raw and isinstance(raw[0], PropertyGroupConfig):
-            return raw
-        return parse_property_display(raw)
+        return parse_property_display_cached(raw)
+
+    def get(self, request, *args, **kwargs):
+        if self.fragment_group is None:
+            return super().get(request, *args, **kwargs)
+        self.object = self.get_object()
+        return self.render_group_fragment(self.fragment_group)
+
+    def render_group_fragment(self, index: int) -> HttpResponse:
+        """Render group ``index`` of ``property_display`` as an HTML fragment."""
+        configs = self.get_property_display()
+        if not 0 <= index < len(configs):
+            raise Http404("No such property group.")
+        with read_from(self.get_read_database()):
+            group = resolve_group(self.get_object_for_detail(), configs[index], view=self)
+        return HttpResponse(render_group({"request": self.request}, group))
+
+    def get_read_database(self) -> str | None:
+        alias = self.read_database or get_read_database()
+        if alias is None or wrote_recently(getattr(self, "request", None)):
+            return None
+        return alias
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        alias = self.get_read_database()
+        return queryset.using(alias) if alias else queryset
 
     def get_object_for_detail(self):
         return self.object
 
+    def get_group_fragment_url(self, index: int) -> str:
+        kwargs = {**self.kwargs, "group": index}
+        return reverse(self.group_fragment_url_name, kwargs=kwargs)
+
+    def get_snapshot_groups(self, instance, groups: list[PropertyGroupConfig]) -> list[ResolvedGroup] | None:
+        if self.snapshot_field is None:
+            return None
+        return snapshot_to_groups(
+            getattr(instance, self.snapshot_field, None),
+            type(instance),
+            groups,
+            request=getattr(self, "request", None),
+            obj=instance,
+        )
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         groups = self.get_property_display()
         if groups:
-            instance = self.get_object_for_detail()
-            context["object_detail_groups"] = resolve_all(instance, groups, view=self)
+            with read_from(self.get_read_database()):
+                if get_metrics_enabled():
+                    context["object_detail_groups"] = self._get_detail_groups_measured(groups)
+                else:
+                    context["object_detail_groups"] = self.get_detail_groups(groups)
+        return context
+
+    def _get_detail_groups_measured(self, groups: list[PropertyGroupConfig]) -> list[ResolvedGroup]:
+        with record() as recording:
+            start = recording.mark()
+            resolved = self.get_detail_groups(groups)
+            elapsed_ms = (time.perf_counter() - start[0]) * 1000
+            observe_resolution(self, resolved, recording, elapsed_ms, recording.queries - start[1])
+        return resolved
+
+    def get_detail_groups(self, groups: list[PropertyGroupConfig]) -> list[ResolvedGroup]:
+        instance = self.get_object_for_detail()
+        snapshot = self.get_snapshot_groups(instance, groups)
+        if snapshot is not None:
+            return snapshot
+        if self.group_fragment_url_name and get_lazy_groups() and any(g.lazy for g in groups):
+            # Fragment URLs keep the index into the full property_display
+            request = getattr(self, "request", None)
+            shown = [
+                (i, visible) for i, group in enumerate(groups)
+                if (visible := visible_group(group, request, instance)) is not None
+            ]
+            eager = [visible for _, visible in shown if not visible.lazy]
+            resolved = iter(resolve_all(instance, eager, view=self, aligned=True))
+            return drop_empty(
+                [
+                    placeholder_group(visible, self.get_group_fragment_url(i)) if visible.lazy else next(resolved)
+                    for i, visible in shown
+                ],
+                [visible for _, visible in shown],
+            )
+        return resolve_all(instance, groups, view=self)
+
+
+class StreamingObjectDetailMixin(ObjectDetailMixin):
+    """``ObjectDetailMixin`` that sends the page as a ``StreamingHttpResponse``.
+
+    The template is rendered with a marker in place of every ``stream``
+    property. The page is then streamed, and each streamed relation is read
+    and rendered chunk by chunk at its marker, so memory use does not grow
+    with the size of the relation.
+    """
+
+    def render_to_response(self, context, **response_kwargs):
+        response = super().render_to_response(context, **response_kwargs)
+        with collect_streams() as streams:
+            html = response.rendered_content
+        return StreamingHttpResponse(
+            stream_html(html, streams, self.request),
+            content_type=response["Content-Type"],
+            status=response.status_code,
+        )
+
+
+class ObjectDetailGroupView(View):
+    """Render a single property group of ``detail_view`` as an HTML fragment.
+
+    The URL must capture the detail view's own kwargs (e.g. ``pk``) plus a
+    ``group`` index into its ``property_display``. Use
+    ``django_object_detail.urls.group_fragment_path`` to build the route.
+
+    The request is dispatched through the detail view, so its ``dispatch()``
+    checks apply to fragments too; its ``get()`` then renders the group
+    instead of the page (see ``ObjectDetailMixin.render_group_fragment``).
+    """
+
+    detail_view = None
+
+    def get(self, request, *args, **kwargs):
+        index = kwargs.pop("group")
+        view = self.detail_view(fragment_group=index)
+        view.setup(request, *args, **kwargs)
+        # Dispatching through the detail view runs its access checks (login, permissions, ...)
+        return view.dispatch(request, *args, **kwargs)
+
+
+class ObjectDetailMetricsView(View):
+    """Return the metrics of this process (``OBJECT_DETAIL_METRICS``) as JSON, to staff users only.
+
+    ``?published=1`` returns the metrics published to the cache by every
+    process instead.
+    """
+
+    def get(self, request, *args, **kwargs):
+        if not getattr(request.user, "is_staff", False):
+            raise PermissionDenied
+        if request.GET.get("published"):
+            histograms, processes = collect_published()
+        else:
+            histograms, processes = registry.histograms(), [registry.process]
+        return JsonResponse({"processes": processes, "series": summarize(histograms)})
+
+
+class ObjectListMixin:
+    """Mixin for list views that renders the queryset as a table of properties.
+
+    ``property_display`` uses the same DSL as ``ObjectDetailMixin``; every
+    property becomes a column. Rows are paginated by keyset (seek) pagination
+    on ``keyset_ordering`` with the primary key as tie-breaker, so each page is
+    an indexed range scan instead of an ``OFFSET``.
+
+    The context gets ``object_list_table`` (a ``ResolvedTable``) plus
+    ``next_cursor`` and ``previous_cursor`` for the ``cursor_param`` query
+    parameter, and ``next_url`` and ``previous_url`` linking to those pages
+    with the other query parameters kept. The ordering column should be non-null. Columns whose
+    ``visible_if`` fails for the request are left out; checks run once per
+    page, with ``obj=None``.
+    """
+
+    property_display: list[dict] | list[PropertyGroupConfig] | None = None
+    keyset_ordering: str = "pk"
+    keyset_page_size: int = 25
+    cursor_param: str = "cursor"
+    row_url_name: str | None = None
+
+    def get_property_display(self) -> list[PropertyGroupConfig]:
+        raw = self.property_display
+        if raw is None:
+            return []
+        return parse_property_display_cached(raw)
+
+    def get_row_url(self, pk) -> str | None:
+        if self.row_url_name is None:
+            return None
+        return reverse(self.row_url_name, kwargs={"pk": pk})
+
+    def _ordering(self) -> tuple[str, bool]:
+        ordering = self.keyset_ordering
+        if ordering.startswith("-"):
+            return ordering[1:], True
+        return ordering, False
+
+    def _order_by(self, reverse: bool = False) -> list[str]:
+        field, descending = self._ordering()
+        if descending != reverse:
+            return [f"-{field}", "-pk"]
+        return [field, "pk"]
+
+    def encode_cursor(self, value, pk, direction: str) -> str:
+        data = json.dumps([value, pk, direction], cls=DjangoJSONEncoder)
+        return base64.urlsafe_b64encode(data.encode()).decode().rstrip("=")
+
+    def decode_cursor(self, cursor: str, model=None) -> tuple:
+        """Return ``(value, pk, direction)`` of ``cursor``, raising ``Http404`` for invalid cursors.
+
+        With ``model``, ``value`` and ``pk`` are converted by the ordering and
+        primary key fields, so a tampered cursor cannot reach the query.
+        """
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            value, pk, direction = json.loads(base64.urlsafe_b64decode(padded))
+        except (ValueError, TypeError, binascii.Error):
+            raise Http404("Invalid cursor.")
+        if direction not in ("next", "previous"):
+            raise Http404("Invalid cursor.")
+        if model is not None:
+            try:
+                pk = model._meta.pk.to_python(pk)
+                value = pk if self._ordering()[0] == "pk" else self._ordering_field(model).to_python(value)
+            except (ValidationError, ValueError, TypeError):
+                raise Http404("Invalid cursor.")
+            if value is None or pk is None:
+                raise Http404("Invalid cursor.")
+        return value, pk, direction
+
+    def _ordering_field(self, model):
+        """Return the model field behind ``keyset_ordering``, following relations."""
+        *relations, name = self._ordering()[0].split("__")
+        for relation in relations:
+            model = model._meta.get_field(relation).related_model
+        return model._meta.get_field(name)
+
+    def _seek(self, queryset, value, pk, forward: bool):
+        """Filter ``queryset`` to rows after (or before) the given key."""
+        field, descending = self._ordering()
+        op = "lt" if descending == forward else "gt"
+        if field == "pk":
+            return queryset.filter(**{f"pk__{op}": pk})
+        return queryset.filter(Q(**{f"{field}__{op}": value}) | Q(**{field: value, f"pk__{op}": pk}))
+
+    def get_cursor_url(self, cursor: str | None) -> str | None:
+        """Return the query string for the page at ``cursor``, keeping the other query parameters."""
+        if cursor is None:
+            return None
+        query = self.request.GET.copy()
+        query[self.cursor_param] = cursor
+        return f"?{query.urlencode()}"
+
+    def paginate_keyset(self, queryset):
+        """Return ``(page_pks, next_cursor, previous_cursor)`` for the current request."""
+        field, _ = self._ordering()
+        size = self.keyset_page_size
+
+        cursor = self.request.GET.get(self.cursor_param)
+        direction = "next"
+        if cursor:
+            value, pk, direction = self.decode_cursor(cursor, queryset.model)
+            if direction == "next":
+                queryset = self._seek(queryset, value, pk, forward=True).order_by(*self._order_by())
+            else:
+                queryset = self._seek(queryset, value, pk, forward=False).order_by(*self._order_by(reverse=True))
+        else:
+            queryset = queryset.order_by(*self._order_by())
+
+        keys = list(queryset.values_list(field, "pk")[: size + 1])
+        has_more = len(keys) > size
+        keys = keys[:size]
+        if direction == "previous":
+            keys.reverse()
+
+        next_cursor = previous_cursor = None
+        if keys:
+            if has_more or direction == "previous":
+                next_cursor = self.encode_cursor(*keys[-1], "next")
+            if cursor and (has_more or direction == "next"):
+                previous_cursor = self.encode_cursor(*keys[0], "previous")
+        return [pk for _, pk in keys], next_cursor, previous_cursor
+
+    def get_context_data(self, **kwargs):
+        queryset = kwargs.pop("object_list", self.object_list)
+        pks, next_cursor, previous_cursor = self.paginate_keyset(queryset)
+
+        page = queryset.filter(pk__in=pks).order_by(*self._order_by())
+        groups = visible_groups(self.get_property_display(), self.request, None)
+        table = resolve_table(page, groups, view=self)
+        for row, pk in zip(table.rows, pks):
+            row.pk = pk
+            row.url = self.get_row_url(pk)
+
+        context = super().get_context_data(object_list=page, **kwargs)
+        context["object_list_table"] = table
+        context["next_cursor"] = next_cursor
+        context["previous_cursor"] = previous_cursor
+        context["cursor_param"] = self.cursor_param
+        context["next_url"] = self.get_cursor_url(next_cursor)
+        context["previous_url"] = self.get_cursor_url(previous_cursor)
         return context
@@ -0,0 +1,89 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.urls import reverse
+
+from catalog.models import Book
+
+# Runs in a fresh interpreter; prints the end time of every phase and where Pydantic got imported
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+phases = {}
+pydantic = None
+
+def mark(name):
+    global pydantic
+    phases[name] = (time.perf_counter() - start) * 1000
+    if pydantic is None and "pydantic" in sys.modules:
+        pydantic = name
+
+import django
+django.setup()
+mark("setup")
+from django.template import engines
+engines["django"].engine.template_libraries
+mark("templatetags")
+from django.urls import get_resolver
+get_resolver().url_patterns
+mark("urlconf")
+status = None
+if sys.argv[1]:
+    from django.test import Client
+    status = Client(HTTP_HOST="localhost").get(sys.argv[1]).status_code
+    mark("first request")
+print(json.dumps({"phases": phases, "pydantic": pydantic, "status": status}))
+"""
+
+
+class Command(BaseCommand):
+    help = (
+        "Start fresh worker processes and report how long Django setup, loading the template tags, "
+        "importing the URLconf and views, and the first book detail request take."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--runs", type=int, default=10, help="Processes to start.")
+        parser.add_argument("--no-request", action="store_true", help="Skip the first request.")
+        parser.add_argument("--json", action="store_true", help="Print the raw timings of every run as JSON.")
+
+    def handle(self, *args, **options):
+        url = ""
+        if not options["no_request"]:
+            pk = Book.objects.values_list("pk", flat=True).first()
+            if pk is None:
+                raise CommandError("No books; run generate_catalog or pass --no-request.")
+            url = reverse("book-detail", kwargs={"pk": pk})
+
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join([str(settings.BASE_DIR), *sys.path])}
+        runs = []
+        for _ in range(options["runs"]):
+            result = subprocess.run(
+                [sys.executable, "-c", PROBE, url], capture_output=True, text=True, env=env, cwd=settings.BASE_DIR
+            )
+            if result.returncode != 0:
+                raise CommandError(result.stderr)
+            runs.append(json.loads(result.stdout.splitlines()[-1]))
+
+        if options["json"]:
+            self.stdout.write(json.dumps(runs, indent=2))
+            return
+
+        self.stdout.write(f"{'phase':<14} {'p50 ms':>8} {'min ms':>8} {'max ms':>8}")
+        names = list(runs[0]["phases"])
+        for i, phase in enumerate(names):
+            # Phases are cumulative; report the time spent in each
+            spent = [run["phases"][phase] - (run["phases"][names[i - 1]] if i else 0) for run in runs]
+            self.stdout.write(
+                f"{phase:<14} {statistics.median(spent):>8.1f} {min(spent):>8.1f} {max(spent):>8.1f}"
+            )
+        total = [run["phases"][names[-1]] for run in runs]
+        self.stdout.write(f"{'total':<14} {statistics.median(total):>8.1f} {min(total):>8.1f} {max(total):>8.1f}")
+        self.stdout.write(f"Pydantic imported during: {runs[0]['pydantic'] or 'never'}")
+        if runs[0]["status"] not in (None, 200):
+            self.stdout.write(self.style.WARNING(f"First request returned {runs[0]['status']}"))
@@ -0,0 +1,140 @@
+import random
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from catalog.models import Author, Book, Genre, Publisher, PublisherAddress
+
+WORDS = (
+    "shadow river night glass empire winter garden silent stone crown ember hollow iron "
+    "salt paper storm lantern orchard harbor echo copper meadow thorn signal atlas"
+).split()
+FIRST_NAMES = "Ada Ben Chloe Dmitri Elena Farid Greta Hiro Iris Jonas Kemi Luca Mara Nils Olga Pia Quinn Rosa".split()
+LAST_NAMES = "Adler Brook Castro Dahl Eriksen Fischer Gray Haas Ito Jensen Klein Lopez Moreau Novak Okafor Petrov".split()
+CITIES = ["Berlin", "Lisbon", "Toronto", "Osaka", "Nairobi", "Lima", "Oslo", "Perth"]
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate a synthetic catalog to see how detail pages scale: thousands of publishers, "
+        "authors with hundreds of books and books with dozens of genres. Rows are inserted with bulk_create."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--publishers", type=int, default=2000)
+        parser.add_argument("--authors", type=int, default=200)
+        parser.add_argument("--books-per-author", type=int, default=200)
+        parser.add_argument("--genres", type=int, default=60)
+        parser.add_argument("--genres-per-book", type=int, default=24)
+        parser.add_argument("--co-authors", type=int, default=2, help="Maximum extra authors per book.")
+        parser.add_argument("--batch-size", type=int, default=2000)
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--clear", action="store_true", help="Delete the existing catalog first.")
+
+    def handle(self, *args, **options):
+        rng = random.Random(options["seed"])
+        batch_size = options["batch_size"]
+
+        with transaction.atomic():
+            if options["clear"]:
+                Book.objects.all().delete()
+                Author.objects.all().delete()
+                Genre.objects.all().delete()
+                Publisher.objects.all().delete()
+
+            publishers = Publisher.objects.bulk_create(
+                [
+                    Publisher(
+                        name=f"{self._title(rng)} Press {i}",
+                        website=f"https://publisher{i}.example.com",
+                        founded_year=rng.randint(1850, 2020),
+                        is_active=rng.random() > 0.1,
+                        description=self._sentence(rng, 30),
+                    )
+                    for i in range(options["publishers"])
+                ],
+                batch_size=batch_size,
+            )
+            PublisherAddress.objects.bulk_create(
+                [
+                    PublisherAddress(
+                        publisher=publisher,
+                        street=f"{rng.randint(1, 300)} {rng.choice(WORDS).title()} Street",
+                        city=rng.choice(CITIES),
+                        country="Exampleland",
+                    )
+                    for publisher in publishers
+                ],
+                batch_size=batch_size,
+            )
+            self.stdout.write(f"{len(publishers)} publishers")
+
+            genre_offset = Genre.objects.count()
+            genres = Genre.objects.bulk_create(
+                [
+                    Genre(name=f"Genre {genre_offset + i}", slug=f"genre-{genre_offset + i}")
+                    for i in range(options["genres"])
+                ],
+                batch_size=batch_size,
+            )
+            self.stdout.write(f"{len(genres)} genres")
+
+            authors = Author.objects.bulk_create(
+                [
+                    Author(
+                        first_name=rng.choice(FIRST_NAMES),
+                        last_name=f"{rng.choice(LAST_NAMES)} {i}",
+                        date_of_birth=date(1940, 1, 1) + timedelta(days=rng.randint(0, 60 * 365)),
+                        biography=self._sentence(rng, 60),
+                        is_featured=rng.random() > 0.95,
+                        website=f"https://author{i}.example.com",
+                    )
+                    for i in range(options["authors"])
+                ],
+                batch_size=batch_size,
+            )
+            self.stdout.write(f"{len(authors)} authors")
+
+            books = 0
+            for author in authors:
+                books += self._create_books(rng, author, authors, publishers, genres, options)
+            self.stdout.write(f"{books} books")
+
+    def _create_books(self, rng, author, authors, publishers, genres, options):
+        batch_size = options["batch_size"]
+        books = Book.objects.bulk_create(
+            [
+                Book(
+                    title=f"The {self._title(rng)} {i}",
+                    summary=self._sentence(rng, 40),
+                    price=Decimal(rng.randint(499, 4999)) / 100,
+                    rating=round(rng.uniform(0, 5), 1),
+                    pages=rng.randint(80, 900),
+                    is_available=rng.random() > 0.2,
+                    publication_date=date(1950, 1, 1) + timedelta(days=rng.randint(0, 70 * 365)),
+                    publisher=rng.choice(publishers),
+                )
+                for i in range(options["books_per_author"])
+            ],
+            batch_size=batch_size,
+        )
+
+        book_authors = []
+        book_genres = []
+        for book in books:
+            co_authors = rng.sample(authors, min(rng.randint(0, options["co_authors"]), len(authors)))
+            for book_author in {author, *co_authors}:
+                book_authors.append(Book.authors.through(book_id=book.pk, author_id=book_author.pk))
+            for genre in rng.sample(genres, min(options["genres_per_book"], len(genres))):
+                book_genres.append(Book.genres.through(book_id=book.pk, genre_id=genre.pk))
+        Book.authors.through.objects.bulk_create(book_authors, batch_size=batch_size)
+        Book.genres.through.objects.bulk_create(book_genres, batch_size=batch_size)
+        return len(books)
+
+    def _title(self, rng):
+        return " ".join(rng.choice(WORDS).title() for _ in range(2))
+
+    def _sentence(self, rng, words):
+        return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + "."
@@ -0,0 +1,84 @@
+import random
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from catalog.models import Author, Book, Publisher
+
+VIEWS = {
+    "book": ("book-detail", Book),
+    "author": ("author-detail", Author),
+    "publisher": ("publisher-detail", Publisher),
+}
+
+
+def _percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+class Command(BaseCommand):
+    help = (
+        "Request the book, author and publisher detail pages concurrently with the test client "
+        "and report latency percentiles and query counts per view."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--views", default="book,author,publisher", help="Comma-separated views to load.")
+        parser.add_argument("--requests", type=int, default=200, help="Requests per view.")
+        parser.add_argument("--concurrency", type=int, default=8, help="Worker threads.")
+        parser.add_argument("--warmup", type=int, default=10, help="Untimed requests per view first.")
+        parser.add_argument("--seed", type=int, default=0)
+
+    def handle(self, *args, **options):
+        names = [name.strip() for name in options["views"].split(",") if name.strip()]
+        unknown = set(names) - set(VIEWS)
+        if unknown:
+            raise CommandError(f"Unknown views: {', '.join(sorted(unknown))}. Choose from {', '.join(VIEWS)}.")
+
+        rng = random.Random(options["seed"])
+        self._local = threading.local()
+        self.stdout.write(
+            f"{'view':<10} {'requests':>8} {'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8} {'max ms':>8} "
+            f"{'queries':>8} {'max q':>6} {'errors':>6} {'req/s':>7}"
+        )
+        for name in names:
+            url_name, model = VIEWS[name]
+            pks = list(model.objects.values_list("pk", flat=True))
+            if not pks:
+                raise CommandError(f"No {model._meta.verbose_name_plural}; run generate_catalog first.")
+            urls = [reverse(url_name, kwargs={"pk": rng.choice(pks)}) for _ in range(options["requests"])]
+
+            with ThreadPoolExecutor(max_workers=options["concurrency"]) as pool:
+                list(pool.map(self._request, urls[: options["warmup"]]))
+                start = time.perf_counter()
+                results = list(pool.map(self._request, urls))
+                elapsed = time.perf_counter() - start
+
+            latencies = [ms for ms, _, _ in results]
+            queries = [n for _, n, _ in results]
+            errors = sum(1 for _, _, status in results if status != 200)
+            self.stdout.write(
+                f"{name:<10} {len(results):>8} {_percentile(latencies, 50):>8.1f} {_percentile(latencies, 90):>8.1f} "
+                f"{_percentile(latencies, 99):>8.1f} {max(latencies):>8.1f} {statistics.mean(queries):>8.1f} "
+                f"{max(queries):>6} {errors:>6} {len(results) / elapsed:>7.1f}"
+            )
+
+    def _request(self, url):
+        # Each worker thread has its own client and database connection
+        client = getattr(self._local, "client", None)
+        if client is None:
+            client = self._local.client = Client(raise_request_exception=False, HTTP_HOST="localhost")
+        with CaptureQueriesContext(connection) as captured:
+            start = time.perf_counter()
+            response = client.get(url)
+            ms = (time.perf_counter() - start) * 1000
+        return ms, len(captured.captured_queries), response.status_code
@@ -5,6 +5,8 @@ from django.conf import settings
 
 TESTS_DIR = Path(__file__).resolve().parent
 
+pytest_plugins = ["django_object_detail.pytest_plugin"]
+
 
 def pytest_configure():
     settings.configure(
@@ -12,7 +14,12 @@ def pytest_configure():
             "default": {
                 "ENGINE": "django.db.backends.sqlite3",
                 "NAME": ":memory:",
-            }
+            },
+            "replica": {
+                "ENGINE": "django.db.backends.sqlite3",
+                "NAME": ":memory:",
+                "TEST": {"MIRROR": "default"},
+            },
         },
         INSTALLED_APPS=[
             "django.contrib.contenttypes",
@@ -1,4 +1,6 @@
 from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.fields import GenericForeignKey, GenericRelation
+from django.contrib.contenttypes.models import ContentType
 from django.db import models
 
 User = get_user_model()
@@ -22,6 +24,8 @@ class Report(models.Model):
     access_users = models.ManyToManyField(User, blank=True, related_name="accessible_reports")
     info = models.OneToOneField(Info, on_delete=models.CASCADE, null=True, blank=True)
     owner = models.ForeignKey(User, on_delete=models.CASCADE, null=True, blank=True, related_name="owned_reports")
+    attachments = GenericRelation("tests.Attachment", related_query_name="report")
+    detail_snapshot = models.JSONField(null=True, blank=True, editable=False)
 
     class Meta:
         app_label = "tests"
@@ -31,3 +35,16 @@ class Report(models.Model):
 
     def title_upper(self):
         return self.title.upper()
+
+
+class Attachment(models.Model):
+    name = models.CharField(max_length=255, verbose_name="File name")
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    object_id = models.PositiveIntegerField()
+    target = GenericForeignKey("content_type", "object_id")
+
+    class Meta:
+        app_label = "tests"
+
+    def __str__(self):
+        return self.name
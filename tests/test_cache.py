@@ -0,0 +1,170 @@
+import threading
+import time
+
+import pytest
+from django.core.cache import cache
+from django.utils import timezone
+
+from django_object_detail.cache import cache_key, get_or_compute
+from django_object_detail.config import CacheConfig, PropertyGroupConfig, x
+from django_object_detail.resolvers import resolve_group, resolve_property
+from tests.models import Info, Report
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def report(db):
+    now = timezone.now()
+    info = Info.objects.create(text="body", is_public=True, create_dt=now, update_dt=now)
+    return Report.objects.create(title="Cached", info=info)
+
+
+class CountingView:
+    def __init__(self):
+        self.calls = 0
+
+    def stats(self, instance):
+        self.calls += 1
+        return self.calls
+
+
+class TestCacheConfig:
+    def test_int_shorthand(self):
+        cfg = x("title", cache=60)
+        assert isinstance(cfg.cache, CacheConfig)
+        assert cfg.cache.timeout == 60
+
+    def test_true_shorthand(self):
+        cfg = x("title", cache=True)
+        assert cfg.cache.timeout == 300
+
+    def test_no_cache_default(self):
+        assert x("title").cache is None
+
+
+class TestCacheKey:
+    def test_default_key(self, report):
+        assert cache_key(report, x("title", cache=60)) == f"object_detail:tests.report:{report.pk}:title"
+
+    def test_key_fn(self, report):
+        cfg = x("title", cache=CacheConfig(key_fn=lambda obj: f"v2-{obj.pk}"))
+        assert cache_key(report, cfg) == f"object_detail:tests.report:v2-{report.pk}:title"
+        info = report.info
+        assert cache_key(info, x("title", cache=CacheConfig(key_fn=lambda obj: f"v2-{obj.pk}"))) != cache_key(report, cfg)
+
+    def test_relation_options_in_key(self, report):
+        plain = cache_key(report, x("access_users", cache=60))
+        first = cache_key(report, x("access_users", cache=60, order_by="username", limit=3))
+        second = cache_key(report, x("access_users", cache=60, order_by="username", limit=5))
+        assert plain == f"object_detail:tests.report:{report.pk}:access_users"
+        assert first.startswith(f"{plain}:")
+        assert len({plain, first, second}) == 3
+
+    def test_view_class_in_key_for_view_methods(self, report):
+        class OtherView(CountingView):
+            pass
+
+        cfg = x("stats", cache=60)
+        assert cache_key(report, cfg, CountingView()) != cache_key(report, cfg, OtherView())
+        # Model attributes do not depend on the view
+        cfg = x("title", cache=60)
+        assert cache_key(report, cfg, CountingView()) == cache_key(report, cfg)
+
+    def test_unsaved_instance(self):
+        assert cache_key(Report(title="new"), x("title", cache=60)) is None
+
+
+class TestResolveCached:
+    def test_views_do_not_share_view_methods(self, report):
+        class OtherView:
+            def stats(self, instance):
+                return "other"
+
+        cfg = x("stats", cache=60)
+        assert resolve_property(report, cfg, view=CountingView()).value == 1
+        assert resolve_property(report, cfg, view=OtherView()).value == "other"
+
+    def test_view_method_computed_once(self, report):
+        view = CountingView()
+        cfg = x("stats", cache=60)
+        assert resolve_property(report, cfg, view=view).value == 1
+        assert resolve_property(report, cfg, view=view).value == 1
+        assert view.calls == 1
+
+    def test_model_method_cached(self, report):
+        cfg = x("title_upper", cache=60)
+        assert resolve_property(report, cfg).value == "CACHED"
+        Report.objects.filter(pk=report.pk).update(title="changed")
+        report.refresh_from_db()
+        assert resolve_property(report, cfg).value == "CACHED"
+
+    def test_none_value_is_cached(self, report):
+        calls = []
+
+        class NoneView:
+            def nothing(self, instance):
+                calls.append(1)
+                return None
+
+        cfg = x("nothing", cache=60)
+        resolve_property(report, cfg, view=NoneView())
+        assert resolve_property(report, cfg, view=NoneView()).value is None
+        assert len(calls) == 1
+
+    def test_cached_concurrent_view_method(self, report):
+        view = CountingView()
+        cfg = PropertyGroupConfig(title="G", properties=[x("stats", cache=60, concurrent=True)])
+        assert resolve_group(report, cfg, view=view).properties[0].value == 1
+        assert resolve_group(report, cfg, view=view).properties[0].value == 1
+        assert view.calls == 1
+
+    def test_uncached_property_recomputed(self, report):
+        view = CountingView()
+        resolve_property(report, x("stats"), view=view)
+        assert resolve_property(report, x("stats"), view=view).value == 2
+
+
+class TestStampedeProtection:
+    def test_cold_key_computed_once(self, report):
+        calls = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.1)
+            return "value"
+
+        cfg = x("stats", cache=60)
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(get_or_compute(report, cfg, compute)))
+            for _ in range(5)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert results == ["value"] * 5
+        assert len(calls) == 1
+
+    def test_waits_for_other_process(self, report):
+        cfg = x("stats", cache=CacheConfig(timeout=60, lock_timeout=1))
+        key = cache_key(report, cfg)
+        cache.add(f"{key}:lock", True)
+
+        def other_process():
+            time.sleep(0.1)
+            cache.set(key, ("from-other",))
+
+        threading.Thread(target=other_process).start()
+        assert get_or_compute(report, cfg, lambda: "mine") == "from-other"
+
+    def test_gives_up_after_lock_timeout(self, report):
+        cfg = x("stats", cache=CacheConfig(timeout=60, lock_timeout=0.1))
+        cache.add(f"{cache_key(report, cfg)}:lock", True)
+        assert get_or_compute(report, cfg, lambda: "mine") == "mine"
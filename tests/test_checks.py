@@ -0,0 +1,60 @@
+import subprocess
+import sys
+from pathlib import Path
+
+from django.core import checks
+
+from django_object_detail.checks import check_property_configs
+from django_object_detail.config import x
+
+
+def test_valid_configs():
+    x("title", limit=3)
+    assert check_property_configs() == []
+
+
+def test_invalid_config_reported():
+    cfg = x("title", limit="many")
+    errors = check_property_configs()
+    assert [error.id for error in errors] == ["django_object_detail.E001"]
+    assert "'title'" in errors[0].msg
+    assert "limit" in errors[0].msg
+    cfg.limit = None
+    assert check_property_configs() == []
+
+
+def test_registered():
+    assert check_property_configs in checks.registry.registry.get_checks()
+
+
+def test_app_and_templatetags_import_without_pydantic():
+    code = """
+import sys
+import django
+from django.conf import settings
+
+settings.configure(
+    INSTALLED_APPS=["django_object_detail"],
+    TEMPLATES=[{"BACKEND": "django.template.backends.django.DjangoTemplates", "APP_DIRS": True}],
+)
+django.setup()
+from django.template import engines
+
+engines["django"].engine.template_libraries
+assert "pydantic" not in sys.modules, "pydantic imported"
+import django_object_detail
+django_object_detail.x
+assert "pydantic" in sys.modules
+"""
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, cwd=Path(__file__).resolve().parent.parent
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_negative_limit_reported():
+    cfg = x("access_users", limit=-1)
+    errors = check_property_configs()
+    assert [error.id for error in errors] == ["django_object_detail.E001"]
+    assert "limit" in errors[0].msg
+    cfg.limit = None
@@ -0,0 +1,90 @@
+import json
+from io import StringIO
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import CommandError, call_command
+
+from tests.models import Report
+
+
+@pytest.fixture
+def report(db):
+    User = get_user_model()
+    owner = User.objects.create_user(username="owner")
+    report = Report.objects.create(title="Explained", owner=owner)
+    report.access_users.add(
+        User.objects.create_user(username="a"),
+        User.objects.create_user(username="b"),
+    )
+    return report
+
+
+class TestObjectDetailExplain:
+    def test_model_and_config(self, report):
+        out = StringIO()
+        call_command(
+            "object_detail_explain", "tests.Report", str(report.pk),
+            config="tests.views.REPORT_PROPERTY_DISPLAY", stdout=out,
+        )
+        output = out.getvalue()
+        assert "title: 0 queries" in output
+        assert "owner__username: 1 queries" in output
+        assert "access_users: 1 queries" in output
+        # Every query is covered by the suggested lookups
+        assert "N+1 on lists" not in output
+        assert "select_related('owner')" in output
+        assert "prefetch_related('access_users')" in output
+
+    def test_view_path(self, report):
+        out = StringIO()
+        call_command("object_detail_explain", "tests.views.LazyReportDetailView", str(report.pk), stdout=out)
+        assert "access_users: 1 queries" in out.getvalue()
+
+    def test_view_pk_url_kwarg(self, report):
+        out = StringIO()
+        call_command("object_detail_explain", "tests.views.ReportIdDetailView", str(report.pk), stdout=out)
+        assert f"tests.Report pk={report.pk}" in out.getvalue()
+
+    def test_view_kwarg_option(self, report):
+        out = StringIO()
+        call_command(
+            "object_detail_explain", "tests.views.ReportIdDetailView", kwarg=[f"report_id={report.pk}"], stdout=out
+        )
+        assert f"tests.Report pk={report.pk}" in out.getvalue()
+        assert "access_users: 1 queries" in out.getvalue()
+
+    def test_invalid_kwarg(self, report):
+        with pytest.raises(CommandError, match="NAME=VALUE"):
+            call_command("object_detail_explain", "tests.views.ReportIdDetailView", kwarg=["report_id"])
+        with pytest.raises(CommandError):
+            call_command("object_detail_explain", "tests.views.ReportIdDetailView")
+
+    def test_json(self, report):
+        out = StringIO()
+        call_command(
+            "object_detail_explain", "tests.Report", str(report.pk),
+            config="tests.views.REPORT_PROPERTY_DISPLAY", json=True, stdout=out,
+        )
+        data = json.loads(out.getvalue())
+        props = {p["path"]: p for p in data["properties"]}
+        assert props["title"]["queries"] == []
+        assert props["access_users"]["items"] == 2
+        assert props["owner__username"]["planned_queries"] == 0
+        assert data["plan"]["select_related"] == ["owner"]
+
+    def test_verbose_prints_sql(self, report):
+        out = StringIO()
+        call_command(
+            "object_detail_explain", "tests.Report", str(report.pk),
+            config="tests.views.REPORT_PROPERTY_DISPLAY", verbosity=2, stdout=out,
+        )
+        assert "SELECT" in out.getvalue()
+
+    def test_unknown_model(self, db):
+        with pytest.raises(CommandError):
+            call_command("object_detail_explain", "tests.Nope", "1", config="tests.views.REPORT_PROPERTY_DISPLAY")
+
+    def test_not_a_detail_view(self, db):
+        with pytest.raises(CommandError):
+            call_command("object_detail_explain", "django.views.generic.DetailView", "1")
@@ -1,14 +1,18 @@
 import pytest
+from django.test import override_settings
 from django.utils.functional import Promise
 from django.utils.translation import gettext_lazy as _
 from pydantic import ValidationError
 
 from django_object_detail.config import (
     BadgeConfig,
+    CacheConfig,
     LinkConfig,
     PropertyConfig,
     PropertyGroupConfig,
     parse_property_display,
+    parse_property_display_cached,
+    validate_pending,
     x,
 )
 
@@ -35,6 +39,23 @@ class TestPropertyConfig:
         assert cfg.type == "timestamp"
 
 
+class TestVisibleIf:
+    def test_negative_limit_rejected(self):
+        assert PropertyConfig(path="access_users", limit=0).limit == 0
+        with pytest.raises(ValidationError, match="limit"):
+            PropertyConfig(path="access_users", limit=-1)
+
+    def test_single_check_becomes_list(self):
+        check = lambda request, obj: True  # noqa: E731
+        assert PropertyConfig(path="title", visible_if="tests.view_report").visible_if == ["tests.view_report"]
+        assert PropertyConfig(path="title", visible_if=check).visible_if == [check]
+        assert PropertyGroupConfig(title="G", visible_if=["a.b", check], properties=[]).visible_if == ["a.b", check]
+
+    def test_invalid_check(self):
+        with pytest.raises(ValidationError):
+            PropertyConfig(path="title", visible_if=3)
+
+
 class TestX:
     def test_simple(self):
         cfg = x("title")
@@ -50,6 +71,46 @@ class TestX:
         cfg = x("info__owner", template="foo/bar.html")
         assert cfg.template == "foo/bar.html"
 
+    def test_shorthands_expanded_without_validation(self):
+        cfg = x(
+            "books",
+            link="book-list",
+            badge={"color": "info", "pill": True},
+            cache=60,
+            order_by="-title",
+            visible_if="catalog.view_book",
+            nested=["title", {"path": "pages", "title": "Pages"}],
+        )
+        assert cfg.link == LinkConfig(url="book-list")
+        assert cfg.badge == BadgeConfig(color="info", pill=True)
+        assert cfg.cache.timeout == 60
+        assert cfg.order_by == ["-title"]
+        assert cfg.visible_if == ["catalog.view_book"]
+        assert [(p.path, p.title) for p in cfg.nested] == [("title", None), ("pages", "Pages")]
+        assert x("title", cache=True).cache == CacheConfig()
+        assert x("title", cache=False).cache is None
+
+    def test_same_result_as_validated(self):
+        kwargs = {"link": "report-detail", "cache": 5, "order_by": "title", "nested": ["title"], "limit": 3}
+        cfg = x("access_users", **kwargs)
+        assert all(prop is not cfg for prop, _ in validate_pending())
+        assert cfg == PropertyConfig(path="access_users", **kwargs)
+
+    def test_invalid_reported_on_first_parse(self):
+        cfg = x("title", limit="many")
+        assert cfg.limit == "many"
+        with pytest.raises(ValidationError, match="limit"):
+            parse_property_display([{"title": "G", "properties": [cfg]}])
+        errors = [(prop, e) for prop, e in validate_pending() if prop is cfg]
+        assert [e.errors()[0]["loc"] for _, e in errors] == [("limit",)]
+        cfg.limit = None
+        assert validate_pending() == []
+
+    def test_validated_in_place(self):
+        cfg = x("title", timeout="1.5")
+        parse_property_display([{"title": "G", "properties": [cfg]}])
+        assert cfg.timeout == 1.5
+
 
 class TestPropertyGroupConfig:
     def test_string_normalization(self):
@@ -280,3 +341,28 @@ class TestBadgeConfig:
     def test_no_badge_default(self):
         cfg = PropertyConfig(path="title")
         assert cfg.badge is None
+
+
+class TestParsePropertyDisplayCached:
+    def test_same_list_parsed_once(self):
+        raw = [{"title": "Report", "properties": ["title"]}]
+        first = parse_property_display_cached(raw)
+        assert parse_property_display_cached(raw) is first
+        assert first[0].properties[0].path == "title"
+
+    def test_equal_lists_are_distinct_entries(self):
+        raw1 = [{"title": "Report", "properties": ["title"]}]
+        raw2 = [{"title": "Report", "properties": ["title"]}]
+        assert parse_property_display_cached(raw1) is not parse_property_display_cached(raw2)
+
+    def test_parsed_configs_pass_through(self):
+        groups = [PropertyGroupConfig(title="G", properties=["title"])]
+        assert parse_property_display_cached(groups) is groups
+
+    @override_settings(OBJECT_DETAIL_CONFIG_CACHE_SIZE=2)
+    def test_bounded(self):
+        raws = [[{"title": f"G{i}", "properties": ["title"]}] for i in range(3)]
+        first = parse_property_display_cached(raws[0])
+        parse_property_display_cached(raws[1])
+        parse_property_display_cached(raws[2])
+        assert parse_property_display_cached(raws[0]) is not first
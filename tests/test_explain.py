@@ -0,0 +1,51 @@
+import pytest
+from django.contrib.auth import get_user_model
+
+from django_object_detail.config import PropertyGroupConfig
+from django_object_detail.explain import explain, normalize_sql
+from tests.models import Report
+
+
+def test_normalize_sql():
+    assert normalize_sql("SELECT * FROM t WHERE id = 12 AND name = 'it''s'") == (
+        "SELECT * FROM t WHERE id = ? AND name = ?"
+    )
+
+
+@pytest.mark.django_db
+def test_repeated_queries_in_fanout():
+    User = get_user_model()
+    report = Report.objects.create(title="R")
+    for name in ("a", "b", "c"):
+        user = User.objects.create_user(username=name)
+        report.access_users.add(user)
+        Report.objects.create(title=f"owned by {name}", owner=user)
+
+    groups = [PropertyGroupConfig(title="G", properties=["access_users__owned_reports"])]
+    result = explain(Report, report.pk, groups)
+    prop = result.properties[0]
+    assert len(prop.queries) == 4
+    assert prop.items == 3
+    assert len(prop.repeated) == 1
+    assert prop.repeated[0][1] == 3
+    assert prop.planned_queries == 0
+
+
+class ReaderCountView:
+    def reader_count(self, instance):
+        return instance.access_users.count()
+
+
+@pytest.mark.django_db
+def test_n_plus_one_compares_against_plan():
+    report = Report.objects.create(title="R", owner=get_user_model().objects.create_user(username="owner"))
+    groups = [PropertyGroupConfig(title="G", properties=["title", "owner__username", "access_users", "reader_count"])]
+    props = {p.path: p for p in explain(Report, report.pk, groups, view=ReaderCountView()).properties}
+    assert not props["title"].n_plus_one
+    # Joined or prefetched once for the whole list
+    assert len(props["owner__username"].queries) == 1
+    assert not props["owner__username"].n_plus_one
+    assert not props["access_users"].n_plus_one
+    # The planner cannot see into view methods, so they still query per row
+    assert props["reader_count"].planned_queries == 1
+    assert props["reader_count"].n_plus_one
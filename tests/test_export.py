@@ -0,0 +1,141 @@
+import csv
+import io
+import json
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.test import RequestFactory
+from django.utils import timezone
+
+from django_object_detail.config import BadgeConfig, x
+from django_object_detail.export import export_columns, export_response, iter_export_rows
+from tests.models import Info, Report
+
+GROUPS = [
+    {
+        "title": "Report",
+        "properties": [
+            "title",
+            x("owner", title="Owner"),
+            "access_users",
+            x("info__is_public", badge=BadgeConfig(color="info", label_map={True: "Yes", False: "No"})),
+        ],
+    },
+]
+
+
+@pytest.fixture
+def reports(db):
+    User = get_user_model()
+    now = timezone.now()
+    alice = User.objects.create_user(username="alice")
+    bob = User.objects.create_user(username="bob")
+    result = []
+    for i in range(5):
+        info = Info.objects.create(text="t", is_public=i % 2 == 0, create_dt=now, update_dt=now)
+        report = Report.objects.create(title=f"Report {i}", owner=alice, info=info)
+        report.access_users.add(alice, bob)
+        result.append(report)
+    return result
+
+
+def _content(response):
+    return b"".join(response.streaming_content).decode()
+
+
+class TestExportColumns:
+    def test_labels(self, db):
+        from django_object_detail.config import parse_property_display
+
+        columns = export_columns(Report, parse_property_display(GROUPS))
+        assert columns == [
+            ("title", "Report title"),
+            ("owner", "Owner"),
+            ("access_users", "Access users"),
+            ("info__is_public", "Public"),
+        ]
+
+
+class TestIterExportRows:
+    def test_rows(self, reports):
+        rows = list(iter_export_rows(Report.objects.order_by("pk"), GROUPS))
+        assert rows[0] == ["Report 0", "alice", ["alice", "bob"], "Yes"]
+        assert rows[1][3] == "No"
+        assert len(rows) == 5
+
+    def test_queries_per_chunk(self, reports, django_assert_num_queries):
+        # one query (owner and info joined) + one access_users prefetch per chunk
+        with django_assert_num_queries(2):
+            list(iter_export_rows(Report.objects.all(), GROUPS, chunk_size=10))
+        with django_assert_num_queries(4):
+            list(iter_export_rows(Report.objects.all(), GROUPS, chunk_size=2))
+
+
+class TestExportResponse:
+    def test_csv(self, reports):
+        response = export_response(Report.objects.order_by("pk"), GROUPS)
+        assert response["Content-Type"] == "text/csv"
+        assert response["Content-Disposition"] == 'attachment; filename="report.csv"'
+        rows = list(csv.reader(io.StringIO(_content(response))))
+        assert rows[0] == ["Report title", "Owner", "Access users", "Public"]
+        assert rows[1] == ["Report 0", "alice", "alice, bob", "Yes"]
+        assert len(rows) == 6
+
+    @pytest.mark.parametrize(
+        "filename, header",
+        [
+            ('q1 "final".csv', r'attachment; filename="q1 \"final\".csv"'),
+            ("bericht-ü.csv", "attachment; filename*=utf-8''bericht-%C3%BC.csv"),
+        ],
+    )
+    def test_filename_encoded(self, reports, filename, header):
+        response = export_response(Report.objects.all(), GROUPS, filename=filename)
+        assert response["Content-Disposition"] == header
+
+    def test_jsonl(self, reports):
+        response = export_response(Report.objects.order_by("pk"), GROUPS, format="jsonl", filename="r.jsonl")
+        lines = _content(response).splitlines()
+        assert len(lines) == 5
+        assert json.loads(lines[0]) == {
+            "title": "Report 0",
+            "owner": "alice",
+            "access_users": ["alice", "bob"],
+            "info__is_public": "Yes",
+        }
+
+    def test_xlsx(self, reports):
+        openpyxl = pytest.importorskip("openpyxl")
+        response = export_response(Report.objects.order_by("pk"), GROUPS, format="xlsx")
+        workbook = openpyxl.load_workbook(io.BytesIO(b"".join(response.streaming_content)))
+        rows = list(workbook.active.values)
+        assert rows[0] == ("Report title", "Owner", "Access users", "Public")
+        assert rows[1] == ("Report 0", "alice", "alice, bob", "Yes")
+
+    def test_visible_if(self, reports):
+        groups = [{"title": "Report", "properties": ["title", x("owner", visible_if="tests.view_report")]}]
+        request = RequestFactory().get("/")
+        request.user = get_user_model().objects.get(username="alice")
+        for format in ("csv", "jsonl"):
+            content = _content(export_response(Report.objects.order_by("pk"), groups, format=format, request=request))
+            assert "Report 0" in content
+            assert "alice" not in content
+
+        request.user = get_user_model().objects.create_superuser(username="admin")
+        response = export_response(Report.objects.order_by("pk"), groups, request=request)
+        rows = list(csv.reader(io.StringIO(_content(response))))
+        assert rows[:2] == [["Report title", "Owner"], ["Report 0", "alice"]]
+
+    def test_visible_if_callable(self, reports):
+        groups = [{"title": "Report", "properties": ["title", x("owner", visible_if=lambda request, obj: False)]}]
+        assert list(iter_export_rows(Report.objects.order_by("pk"), groups))[0] == ["Report 0"]
+
+    def test_xlsx_visible_if(self, reports):
+        openpyxl = pytest.importorskip("openpyxl")
+        groups = [{"title": "Report", "properties": ["title", x("owner", visible_if="tests.view_report")]}]
+        response = export_response(Report.objects.order_by("pk"), groups, format="xlsx")
+        workbook = openpyxl.load_workbook(io.BytesIO(b"".join(response.streaming_content)))
+        assert list(workbook.active.values)[0] == ("Report title",)
+
+    def test_unknown_format(self, db):
+        with pytest.raises(ValueError):
+            export_response(Report.objects.all(), GROUPS, format="pdf")
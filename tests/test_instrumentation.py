@@ -0,0 +1,92 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.template import Context, Template
+from django.test import RequestFactory, override_settings
+
+from django_object_detail.config import x
+from django_object_detail.instrumentation import current_recording, record
+from tests.models import Report
+
+DISPLAY = [
+    {"title": "Report", "properties": ["title", "owner__username", x("access_users", cache=60)]},
+]
+
+
+@pytest.fixture
+def report(db):
+    owner = get_user_model().objects.create_user(username="owner")
+    return Report.objects.get(pk=Report.objects.create(title="Recorded", owner=owner).pk)
+
+
+def _render(report):
+    template = Template("{% load object_detail %}{% render_object_detail obj property_display=display %}")
+    return template.render(Context({"obj": report, "display": DISPLAY}))
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+class TestRecording:
+    def test_inactive_by_default(self):
+        assert current_recording() is None
+
+    def test_render_call(self, report):
+        with record() as recording:
+            _render(report)
+        assert current_recording() is None
+
+        [call] = recording.calls
+        assert call.config == [("Report", ["title", "owner__username", "access_users"])]
+        assert call.total_ms > 0
+        [group] = call.groups
+        assert group.title == "Report"
+        assert group.render_ms > 0
+        title, owner, users = group.properties
+        assert (title.queries, owner.queries, users.queries) == (0, 1, 1)
+        assert title.template == "django_object_detail/types/default/char.html"
+        assert users.template == "django_object_detail/types/default/manytomany.html"
+        assert users.cache == "miss"
+        assert title.cache is None
+
+    def test_cache_hit(self, report):
+        _render(report)
+        with record() as recording:
+            _render(report)
+        users = recording.calls[0].groups[0].properties[2]
+        assert users.cache == "hit"
+        assert users.queries == 0
+
+    def test_skeleton_call(self, report):
+        with override_settings(OBJECT_DETAIL_SKELETON_RENDER=True), record() as recording:
+            _render(report)
+        [call] = recording.calls
+        assert call.skeleton
+        assert call.groups[0].properties[0].template == "django_object_detail/types/default/char.html"
+
+
+class TestPanel:
+    def test_stats(self, report):
+        pytest.importorskip("debug_toolbar")
+        from debug_toolbar.toolbar import DebugToolbar
+
+        from django_object_detail.panels import ObjectDetailPanel
+
+        request = RequestFactory().get("/")
+
+        def get_response(request):
+            from django.http import HttpResponse
+
+            return HttpResponse(_render(report))
+
+        toolbar = DebugToolbar(request, get_response)
+        panel = ObjectDetailPanel(toolbar, get_response)
+        response = panel.process_request(request)
+        panel.generate_stats(request, response)
+        [call] = panel.get_stats()["calls"]
+        assert call["groups"][0]["queries"] == 2
+        assert "1 call" in panel.nav_subtitle
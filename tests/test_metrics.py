@@ -0,0 +1,149 @@
+import json
+from io import StringIO
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.core.exceptions import PermissionDenied
+from django.core.management import call_command
+from django.template import Context, Template
+from django.test import RequestFactory, override_settings
+from django.views.generic import DetailView
+
+from django_object_detail.metrics import (
+    Histogram,
+    RollingHistogram,
+    collect_published,
+    publish,
+    registry,
+    summarize,
+)
+from django_object_detail.views import ObjectDetailMetricsView, ObjectDetailMixin
+from tests.models import Report
+
+
+class MeasuredView(ObjectDetailMixin, DetailView):
+    model = Report
+    template_name = "django_object_detail/object_detail.html"
+    property_display = [{"title": "Report", "properties": ["title", "owner__username"]}]
+
+
+VIEW = f"{MeasuredView.__module__}.{MeasuredView.__qualname__}"
+
+
+@pytest.fixture(autouse=True)
+def clean():
+    registry.reset()
+    cache.clear()
+    yield
+    registry.reset()
+    cache.clear()
+
+
+@pytest.fixture
+def report(db):
+    owner = get_user_model().objects.create_user(username="owner")
+    return Report.objects.create(title="Measured", owner=owner)
+
+
+def _show(report):
+    view = MeasuredView()
+    view.setup(RequestFactory().get("/"), pk=report.pk)
+    view.object = view.get_object()
+    context = view.get_context_data()
+    Template("{% load object_detail %}{% render_object_detail object object_detail_groups %}").render(
+        Context({"view": view, "object": report, "object_detail_groups": context["object_detail_groups"]})
+    )
+
+
+class TestHistogram:
+    def test_quantiles(self):
+        histogram = Histogram()
+        for value in range(1, 1001):
+            histogram.add(value)
+        assert histogram.quantile(0.5) == pytest.approx(500, rel=0.1)
+        assert histogram.quantile(0.99) == pytest.approx(990, rel=0.1)
+        assert histogram.max == 1000
+        assert len(histogram.counts) < 50
+
+    def test_zero_and_merge_round_trip(self):
+        a, b = Histogram(), Histogram()
+        a.add(0)
+        b.add(2.5)
+        a.merge(Histogram.from_dict(json.loads(json.dumps(b.to_dict()))))
+        assert a.count == 2
+        assert a.quantile(0.5) == 0
+        assert a.quantile(1) == pytest.approx(2.5, rel=0.1)
+
+    def test_rolling_window(self):
+        rolling = RollingHistogram(window=100)
+        rolling.add(1, now=1000)
+        rolling.add(2, now=1050)
+        assert rolling.snapshot(now=1060).count == 2
+        assert rolling.snapshot(now=1105).count == 1
+        assert rolling.snapshot(now=1200).count == 0
+
+    @override_settings(OBJECT_DETAIL_METRICS_MAX_SERIES=2)
+    def test_bounded_series(self):
+        for path in ["a", "b", "c"]:
+            registry.observe("view", path, "queries", 1)
+        assert len(registry.histograms()) == 2
+
+
+class TestCollection:
+    def test_disabled_by_default(self, report):
+        _show(report)
+        assert registry.histograms() == {}
+
+    @override_settings(OBJECT_DETAIL_METRICS=True)
+    def test_view_and_paths(self, report):
+        _show(report)
+        _show(report)
+        rows = {(row["path"], row["metric"]): row for row in summarize(registry.histograms())}
+        assert rows[(None, "resolve_ms")]["count"] == 2
+        assert rows[(None, "render_ms")]["count"] == 2
+        assert rows[(None, "queries")]["max"] == 1
+        assert rows[("owner__username", "queries")]["max"] == 1
+        assert rows[("title", "queries")]["max"] == 0
+        assert {row["view"] for row in rows.values()} == {VIEW}
+
+
+class TestPublishing:
+    @pytest.fixture(autouse=True)
+    def enabled(self, settings):
+        settings.OBJECT_DETAIL_METRICS = True
+
+    def test_publish_and_command(self, report):
+        _show(report)
+        publish()
+        histograms, processes = collect_published()
+        assert processes == [registry.process]
+        assert histograms[(VIEW, None, "resolve_ms")].count == 1
+
+        out = StringIO()
+        call_command("object_detail_metrics", "--paths", stdout=out)
+        assert VIEW in out.getvalue()
+        assert "owner__username" in out.getvalue()
+
+        out = StringIO()
+        call_command("object_detail_metrics", "--json", stdout=out)
+        data = json.loads(out.getvalue())
+        assert all(row["path"] is None for row in data["series"])
+
+    def test_command_without_data(self, db):
+        out = StringIO()
+        call_command("object_detail_metrics", stdout=out)
+        assert "No metrics published" in out.getvalue()
+
+    def test_json_view(self, report):
+        _show(report)
+        request = RequestFactory().get("/")
+        request.user = AnonymousUser()
+        with pytest.raises(PermissionDenied):
+            ObjectDetailMetricsView.as_view()(request)
+
+        request.user = get_user_model()(username="staff", is_staff=True)
+        data = json.loads(ObjectDetailMetricsView.as_view()(request).content)
+        assert data["processes"] == [registry.process]
+        assert {row["metric"] for row in data["series"]} == {"resolve_ms", "render_ms", "queries"}
@@ -0,0 +1,109 @@
+from django_object_detail.config import PropertyGroupConfig, x
+from django_object_detail.plan import plan_lookups, plan_path
+from tests.models import Attachment, Info, Report
+
+
+class TestPlanPath:
+    def test_concrete_column(self):
+        plan = plan_path(Report, "title")
+        assert plan.select_related == []
+        assert plan.prefetch_related == []
+        assert plan.only == ["title"]
+
+    def test_fk_column(self):
+        plan = plan_path(Report, "owner__username")
+        assert plan.select_related == ["owner"]
+        assert plan.only == ["owner__username"]
+
+    def test_fk_object(self):
+        plan = plan_path(Report, "owner")
+        assert plan.select_related == ["owner"]
+        assert plan.only == ["owner"]
+
+    def test_many(self):
+        plan = plan_path(Report, "access_users__get_full_name")
+        assert plan.prefetch_related == ["access_users"]
+        assert plan.only is None
+
+    def test_fk_then_many(self):
+        plan = plan_path(Report, "owner__accessible_reports")
+        assert plan.select_related == ["owner"]
+        assert plan.prefetch_related == ["owner__accessible_reports"]
+
+    def test_reverse_o2o(self):
+        plan = plan_path(Info, "report__title")
+        assert plan.select_related == ["report"]
+        assert plan.only == ["report__title"]
+
+    def test_method(self):
+        plan = plan_path(Report, "title_upper")
+        assert plan.select_related == []
+        assert plan.only is None
+
+    def test_generic_foreign_key_prefetched(self):
+        plan = plan_path(Attachment, "target__title")
+        assert plan.select_related == []
+        assert plan.prefetch_related == ["target"]
+        assert plan.only is None
+
+    def test_generic_relation_prefetched(self):
+        plan = plan_path(Report, "attachments__name")
+        assert plan.prefetch_related == ["attachments"]
+        assert plan.only is None
+
+
+class TestPlanLookups:
+    def test_merged(self):
+        groups = [
+            PropertyGroupConfig(title="A", properties=["title", "owner__username", "info__text"]),
+            PropertyGroupConfig(title="B", properties=["owner", "access_users"]),
+        ]
+        plan = plan_lookups(Report, groups)
+        assert plan.select_related == ["owner", "info"]
+        assert plan.prefetch_related == ["access_users"]
+        assert plan.only is None
+
+    def test_whole_object_wins_over_columns(self):
+        groups = [PropertyGroupConfig(title="A", properties=["owner__username", "owner", "title"])]
+        plan = plan_lookups(Report, groups)
+        assert plan.only == ["owner", "title"]
+
+    def test_covered_prefixes_dropped(self):
+        groups = [PropertyGroupConfig(title="A", properties=["info__text", "info__report__title"])]
+        plan = plan_lookups(Report, groups)
+        assert plan.select_related == ["info__report"]
+
+    def test_apply_loads_without_extra_queries(self, db, django_assert_num_queries):
+        from django.contrib.auth import get_user_model
+
+        user = get_user_model().objects.create_user(username="u")
+        report = Report.objects.create(title="T", owner=user)
+        groups = [PropertyGroupConfig(title="A", properties=["title", "owner__username"])]
+        plan = plan_lookups(Report, groups)
+        with django_assert_num_queries(1):
+            obj = plan.apply(Report.objects.filter(pk=report.pk)).get()
+            assert obj.owner.username == "u"
+            assert obj.title == "T"
+
+    def test_nested_prefixed_and_prefetched(self):
+        groups = [PropertyGroupConfig(title="A", properties=[
+            "title",
+            x("owner", nested=["username", x("owned_reports", nested=["info__text"])]),
+        ])]
+        plan = plan_lookups(Report, groups)
+        assert plan.select_related == ["owner"]
+        assert plan.prefetch_related == ["owner__owned_reports__info"]
+        assert plan.only is None
+
+    def test_relation_query_becomes_prefetch(self):
+        from django.db.models import Prefetch
+
+        groups = [PropertyGroupConfig(title="A", properties=[
+            x("access_users__owned_reports__title", filter={"is_active": True}, limit=5),
+        ])]
+        plan = plan_lookups(Report, groups)
+        prefetch, rest = plan.prefetch_related
+        assert isinstance(prefetch, Prefetch)
+        assert prefetch.prefetch_through == "access_users"
+        assert prefetch.to_attr.startswith("_od_access_users_")
+        assert rest == f"{prefetch.to_attr}__owned_reports"
@@ -1,17 +1,29 @@
+import gc
+import time
+
 import pytest
-from django.utils import timezone
+from django.test import RequestFactory, override_settings
+from django.utils import timezone, translation
 from django.utils.functional import Promise
 from django.utils.translation import gettext_lazy as _
 
+from django_object_detail import resolvers
 from django_object_detail.config import BadgeConfig, LinkConfig, PropertyConfig, PropertyGroupConfig, x
+from django_object_detail.plan import is_flat
 from django_object_detail.resolvers import (
     ResolvedGroup,
     ResolvedProperty,
+    get_property_meta,
+    is_empty,
     resolve_all,
+    resolve_compare,
     resolve_group,
+    resolve_many,
     resolve_property,
+    visible_groups,
+    _get_executor,
 )
-from tests.models import Info, Report
+from tests.models import Attachment, Info, Report
 
 
 @pytest.fixture
@@ -282,20 +294,148 @@ class TestResolveAll:
         assert groups[1].title == "G2"
 
 
-class TestLazyStringResolution:
-    """Lazy translation strings should pass through config into resolved objects."""
+@pytest.fixture
+def sparse_report(db):
+    return Report.objects.create(title="", owner=None, info=None)
 
-    def test_title_override_stays_lazy(self, report):
-        cfg = x("title", title=_("Custom Title"))
-        rp = resolve_property(report, cfg)
-        assert isinstance(rp.label, Promise)
-        assert str(rp.label) == "Custom Title"
 
-    def test_detail_override_stays_lazy(self, report):
+class TestHideEmpty:
+    def test_is_empty(self):
+        assert is_empty(None) and is_empty("") and is_empty([])
+        assert not is_empty(0) and not is_empty(False) and not is_empty(" ")
+
+    def test_property_option(self, sparse_report):
+        cfg = PropertyGroupConfig(
+            title="G", properties=[x("title", hide_empty=True), x("owner", hide_empty=True), "access_users"]
+        )
+        [group] = resolve_all(sparse_report, [cfg])
+        assert [p.path for p in group.properties] == ["access_users"]
+
+    def test_group_option_and_property_override(self, sparse_report):
+        cfg = PropertyGroupConfig(
+            title="G", hide_empty=True, properties=["title", x("owner", hide_empty=False), "access_users"]
+        )
+        [group] = resolve_all(sparse_report, [cfg])
+        assert [p.path for p in group.properties] == ["owner"]
+
+    @override_settings(OBJECT_DETAIL_HIDE_EMPTY=True)
+    def test_setting_drops_empty_groups(self, sparse_report):
+        configs = [
+            PropertyGroupConfig(title="Empty", properties=["owner", "info__text"]),
+            PropertyGroupConfig(title="Shown", properties=["pk", "title"]),
+        ]
+        groups = resolve_all(sparse_report, configs)
+        assert [g.title for g in groups] == ["Shown"]
+        assert [p.path for p in groups[0].properties] == ["pk"]
+
+    @override_settings(OBJECT_DETAIL_HIDE_EMPTY=True)
+    def test_resolve_many_stays_aligned(self, sparse_report, report):
+        configs = [PropertyGroupConfig(title="G", properties=["title", "owner"])]
+        resolved = resolve_many([sparse_report, report], configs)
+        assert [len(r[0].properties) for r in resolved] == [2, 2]
+        assert len(resolve_all(sparse_report, configs, aligned=True)[0].properties) == 2
+
+    @override_settings(OBJECT_DETAIL_HIDE_EMPTY=True)
+    def test_resolve_group_left_empty(self, sparse_report):
+        group = resolve_group(sparse_report, PropertyGroupConfig(title="G", properties=["owner"]))
+        assert group.title == "G"
+        assert group.properties == []
+
+    def test_nested(self, report, user2):
+        user2.first_name = ""
+        user2.save()
+        report.access_users.add(user2)
+        cfg = x("access_users", nested=["username", x("first_name", hide_empty=True)])
+        rp = resolve_property(report, cfg)
+        assert [[p.path for p in item] for item in rp.nested] == [["username"]]
+
+
+class TestVisibleIf:
+    def _request(self, user):
+        request = RequestFactory().get("/")
+        request.user = user
+        return request
+
+    def test_permission(self, report, user):
+        configs = [PropertyGroupConfig(title="G", properties=["title", x("owner", visible_if="auth.view_user")])]
+        assert [p.path for p in resolve_all(report, configs, request=self._request(user))[0].properties] == ["title"]
+        user.is_superuser = True
+        assert len(resolve_all(report, configs, request=self._request(user))[0].properties) == 2
+
+    def test_without_request_permission_fails(self, report):
+        configs = [PropertyGroupConfig(title="G", properties=["title", x("owner", visible_if="auth.view_user")])]
+        assert len(resolve_all(report, configs)[0].properties) == 1
+
+    def test_callable_and_group(self, report, user):
+        seen = []
+
+        def check(request, obj):
+            seen.append((request, obj))
+            return obj.title == "Other"
+
+        request = self._request(user)
+        configs = [
+            PropertyGroupConfig(title="Hidden", visible_if=check, properties=["title"]),
+            PropertyGroupConfig(title="Shown", properties=["title"]),
+        ]
+        assert [g.title for g in resolve_all(report, configs, request=request)] == ["Shown"]
+        assert seen == [(request, report)]
+
+    def test_hidden_costs_no_queries(self, report, user, django_assert_num_queries):
+        cfg = PropertyGroupConfig(
+            title="G", properties=["title", x("access_users", visible_if=lambda request, obj: False)]
+        )
+        with django_assert_num_queries(0):
+            group = resolve_group(report, cfg, request=self._request(user))
+        assert [p.path for p in group.properties] == ["title"]
+
+    def test_configs_unchanged(self, report, user):
+        cfg = PropertyGroupConfig(title="G", properties=["title", x("owner", visible_if="auth.view_user")])
+        resolve_all(report, [cfg], request=self._request(user))
+        assert len(cfg.properties) == 2
+        assert visible_groups([cfg], None, report)[0] is not cfg
+        plain = PropertyGroupConfig(title="G", properties=["title"])
+        assert visible_groups([plain], None, report)[0] is plain
+
+    def test_all_properties_hidden_drops_group(self, report):
+        cfg = PropertyGroupConfig(title="G", properties=[x("owner", visible_if="auth.view_user")])
+        assert resolve_all(report, [cfg]) == []
+        assert resolve_group(report, cfg).properties == []
+
+
+class TestLazyStringResolution:
+    """Lazy translation strings in configs are translated once per active language."""
+
+    def test_title_override_translated(self, report):
+        cfg = x("title", title=_("username"))
+        with translation.override("de"):
+            german = resolve_property(report, cfg).label
+        english = resolve_property(report, cfg).label
+        assert german == "Benutzername"
+        assert english == "username"
+        assert isinstance(english, str) and not isinstance(english, Promise)
+
+    def test_detail_override_translated(self, report):
         cfg = x("title", detail=_("Custom detail"))
         rp = resolve_property(report, cfg)
-        assert isinstance(rp.detail, Promise)
-        assert str(rp.detail) == "Custom detail"
+        assert rp.detail == "Custom detail"
+        assert not isinstance(rp.detail, Promise)
+
+    def test_header_cached_per_language(self, report):
+        cfg = x("owner__username")
+        with translation.override("de"):
+            first = resolve_property(report, cfg).label
+            assert resolve_property(report, cfg).label is first
+        assert resolve_property(report, cfg).label == "Username"
+
+    def test_header_cache_dropped_with_config(self, report):
+        cfg = x("title")
+        resolve_property(report, cfg)
+        key = id(cfg)
+        assert key in resolvers._headers
+        del cfg
+        gc.collect()
+        assert key not in resolvers._headers
 
     def test_group_title_stays_lazy(self, report):
         cfg = PropertyGroupConfig(
@@ -431,3 +571,421 @@ class TestResolvePropertyViewFallback:
         cfg = x("my_method")
         resolve_property(report, cfg, view=MockView())
         assert received == [report]
+
+
+class SlowView:
+    """Stand-in for a view whose methods call a slow service."""
+
+    delay = 0.2
+
+    def slow_a(self, instance):
+        time.sleep(self.delay)
+        return f"a:{instance.title}"
+
+    def slow_b(self, instance):
+        time.sleep(self.delay)
+        return "b"
+
+    def __init__(self):
+        self.called = []
+
+    def very_slow(self, instance):
+        time.sleep(1)
+        return "late"
+
+    def queued(self, instance):
+        self.called.append("queued")
+        return "queued"
+
+    def language(self, instance):
+        return translation.get_language()
+
+    def broken(self, instance):
+        raise RuntimeError("service down")
+
+
+class TestResolveConcurrentViewMethods:
+    def test_concurrent_calls_overlap(self, report):
+        configs = [
+            PropertyGroupConfig(title="G1", properties=[x("slow_a", concurrent=True), "title"]),
+            PropertyGroupConfig(title="G2", properties=[x("slow_b", concurrent=True)]),
+        ]
+        start = time.monotonic()
+        groups = resolve_all(report, configs, view=SlowView())
+        elapsed = time.monotonic() - start
+        assert groups[0].properties[0].value == "a:Test Report"
+        assert groups[0].properties[1].value == "Test Report"
+        assert groups[1].properties[0].value == "b"
+        assert elapsed < 2 * SlowView.delay
+
+    def test_timeout_uses_fallback(self, report):
+        cfg = PropertyGroupConfig(
+            title="G", properties=[x("very_slow", concurrent=True, timeout=0.05, fallback="n/a")],
+        )
+        rg = resolve_group(report, cfg, view=SlowView())
+        assert rg.properties[0].value == "n/a"
+
+    @override_settings(OBJECT_DETAIL_CONCURRENT_MAX_WORKERS=1)
+    def test_timeout_cancels_queued_call(self, report):
+        view = SlowView()
+        cfg = PropertyGroupConfig(
+            title="G",
+            properties=[
+                x("very_slow", concurrent=True, timeout=0.05, fallback="n/a"),
+                x("queued", concurrent=True, timeout=0.05, fallback="n/a"),
+            ],
+        )
+        rg = resolve_group(report, cfg, view=view)
+        assert [p.value for p in rg.properties] == ["n/a", "n/a"]
+        time.sleep(1.1)
+        assert view.called == []
+
+    def test_max_workers_setting_followed(self):
+        with override_settings(OBJECT_DETAIL_CONCURRENT_MAX_WORKERS=2):
+            pool = _get_executor()
+            assert pool._max_workers == 2
+            assert _get_executor() is pool
+        with override_settings(OBJECT_DETAIL_CONCURRENT_MAX_WORKERS=3):
+            assert _get_executor()._max_workers == 3
+
+    def test_model_path_not_dispatched(self, report):
+        cfg = PropertyGroupConfig(title="G", properties=[x("title_upper", concurrent=True)])
+        rg = resolve_group(report, cfg, view=SlowView())
+        assert rg.properties[0].value == "TEST REPORT"
+
+    def test_active_language_propagates(self, report):
+        cfg = PropertyGroupConfig(title="G", properties=[x("language", concurrent=True)])
+        with translation.override("de"):
+            rg = resolve_group(report, cfg, view=SlowView())
+        assert rg.properties[0].value == "de"
+
+    def test_exception_propagates(self, report):
+        cfg = PropertyGroupConfig(title="G", properties=[x("broken", concurrent=True)])
+        with pytest.raises(RuntimeError):
+            resolve_group(report, cfg, view=SlowView())
+
+    @override_settings(OBJECT_DETAIL_CONCURRENT_VIEW_METHODS=True, OBJECT_DETAIL_CONCURRENT_TIMEOUT=0.05)
+    def test_global_settings(self, report):
+        cfg = PropertyGroupConfig(title="G", properties=["slow_a", x("very_slow", fallback="n/a")])
+        rg = resolve_group(report, cfg, view=SlowView())
+        assert rg.properties[0].value is None
+        assert rg.properties[1].value == "n/a"
+
+    @override_settings(OBJECT_DETAIL_CONCURRENT_VIEW_METHODS=True)
+    def test_per_property_opt_out(self, report):
+        cfg = PropertyGroupConfig(title="G", properties=[x("slow_b", concurrent=False)])
+        rg = resolve_group(report, cfg, view=SlowView())
+        assert rg.properties[0].value == "b"
+
+
+class TestPropertyMeta:
+    def test_meta_shared_per_model_and_path(self):
+        assert get_property_meta(Report, "info__text") is get_property_meta(Report, "info__text")
+
+    def test_meta_fields(self):
+        meta = get_property_meta(Report, "owner__get_full_name")
+        assert meta.segments == ("owner", "get_full_name")
+        assert [f.name for f in meta.fields] == ["owner"]
+        assert meta.fallback_label == "Get Full Name"
+        assert meta.verbose_name is None
+
+    def test_meta_keeps_lazy_verbose_name(self):
+        meta = get_property_meta(Info, "text")
+        assert meta.verbose_name == "Info text"
+        assert meta.help_text == "The info body text"
+        assert meta.type == "text"
+
+    def test_label_follows_active_language(self, report):
+        """Cached metadata must not freeze the label in the first language used."""
+        cfg = PropertyConfig(path="owner__username")
+        with translation.override("de"):
+            german = resolve_property(report, cfg).label
+        with translation.override("en"):
+            english = resolve_property(report, cfg).label
+        assert english == "Username"
+        assert german == "Benutzername"
+
+
+@pytest.fixture
+def reports(db, user, user2, now):
+    result = []
+    for i, owner in enumerate([user, user2, user]):
+        info = Info.objects.create(text=f"text {i}", is_public=True, create_dt=now, update_dt=now)
+        report = Report.objects.create(title=f"Report {i}", info=info, owner=owner)
+        report.access_users.add(user2)
+        result.append(report)
+    return result
+
+
+MANY_GROUPS = [
+    PropertyGroupConfig(title="G", properties=["title", "owner__username", "info__is_public", "access_users"]),
+]
+
+
+class TestResolveMany:
+    def test_instances_batched(self, reports, django_assert_num_queries):
+        instances = list(Report.objects.order_by("pk"))
+        # owner, info and access_users are each loaded once for all instances
+        with django_assert_num_queries(3):
+            resolved = resolve_many(instances, MANY_GROUPS)
+        assert [r[0].properties[0].value for r in resolved] == ["Report 0", "Report 1", "Report 2"]
+        assert [r[0].properties[1].value for r in resolved] == ["testuser", "otheruser", "testuser"]
+
+    def test_queryset(self, reports, django_assert_num_queries):
+        # Columns across owner and info from values_list(), then the reports and their access_users
+        with django_assert_num_queries(3):
+            resolved = resolve_many(Report.objects.order_by("pk"), MANY_GROUPS)
+        assert len(resolved) == 3
+        assert [u.username for u in resolved[0][0].properties[3].value] == ["otheruser"]
+
+    def test_empty(self, db):
+        assert resolve_many([], MANY_GROUPS) == []
+
+    def test_mixed_models_rejected(self, reports, info):
+        with pytest.raises(ValueError):
+            resolve_many([reports[0], info], MANY_GROUPS)
+
+
+class TestResolveCompare:
+    def test_differs(self, reports):
+        compared = resolve_compare(reports, MANY_GROUPS)
+        assert len(compared) == 1
+        rows = {row.path: row for row in compared[0].properties}
+        assert rows["title"].differs is True
+        assert rows["info__is_public"].differs is False
+        assert rows["access_users"].differs is False
+        assert [p.value for p in rows["owner__username"].values] == ["testuser", "otheruser", "testuser"]
+        assert rows["title"].label == "Report title"
+
+    def test_empty(self, db):
+        assert resolve_compare([], MANY_GROUPS) == []
+
+
+class TestResolveManyFlat:
+    GROUPS = [
+        PropertyGroupConfig(title="A", properties=["title", x("owner__username", badge="info")]),
+        PropertyGroupConfig(title="B", properties=["info__create_dt", "title"]),
+    ]
+
+    def test_single_values_query(self, reports, now, django_assert_num_queries):
+        with django_assert_num_queries(1) as captured:
+            resolved = resolve_many(Report.objects.order_by("pk"), self.GROUPS)
+        assert "JOIN" in captured.captured_queries[0]["sql"]
+        assert [r[0].properties[0].value for r in resolved] == ["Report 0", "Report 1", "Report 2"]
+        assert resolved[1][0].properties[1].value == "otheruser"
+        assert resolved[1][0].properties[1].badge_css == "text-bg-info"
+        assert resolved[0][1].properties[0].value == now
+        assert resolved[0][1].properties[1].value == "Report 0"
+
+    def test_metadata_matches_instance_path(self, reports):
+        flat = resolve_many(Report.objects.order_by("pk"), self.GROUPS)
+        full = resolve_many(list(Report.objects.order_by("pk")), self.GROUPS)
+        assert flat == full
+
+    def test_no_instances_created(self, reports, monkeypatch):
+        def fail(*args, **kwargs):
+            raise AssertionError("model instantiated")
+
+        monkeypatch.setattr(Report, "from_db", classmethod(fail))
+        resolve_many(Report.objects.all(), self.GROUPS)
+
+    def test_null_fk_column(self, db):
+        Report.objects.create(title="Orphan")
+        resolved = resolve_many(Report.objects.all(), self.GROUPS)
+        assert resolved[0][0].properties[1].value is None
+        assert resolved[0][0].properties[1].badge_css is None
+
+    def test_non_flat_loads_instances(self, reports, django_assert_num_queries):
+        # Nothing to save on local columns when the method needs the full instance anyway
+        groups = [PropertyGroupConfig(title="A", properties=["title", "title_upper"])]
+        with django_assert_num_queries(1):
+            resolved = resolve_many(Report.objects.order_by("pk"), groups)
+        assert resolved[0][0].properties[1].value == "REPORT 0"
+
+    def test_only_non_flat_paths_load_instances(self, reports, monkeypatch, django_assert_num_queries):
+        from django.contrib.auth import get_user_model
+
+        def fail(*args, **kwargs):
+            raise AssertionError("related instance created")
+
+        monkeypatch.setattr(get_user_model(), "from_db", classmethod(fail))
+        groups = [PropertyGroupConfig(title="A", properties=["title", "owner__username", "title_upper"])]
+        with django_assert_num_queries(2) as captured:
+            resolved = resolve_many(Report.objects.order_by("-pk"), groups)
+        assert "JOIN" not in captured.captured_queries[1]["sql"]
+        assert [[p.value for p in r[0].properties] for r in resolved] == [
+            ["Report 2", "testuser", "REPORT 2"],
+            ["Report 1", "otheruser", "REPORT 1"],
+            ["Report 0", "testuser", "REPORT 0"],
+        ]
+
+    def test_sliced_queryset_not_split(self, reports, django_assert_num_queries):
+        groups = [PropertyGroupConfig(title="A", properties=["owner__username", "title_upper"])]
+        with django_assert_num_queries(1):
+            resolved = resolve_many(Report.objects.order_by("pk")[:2], groups)
+        assert [r[0].properties[1].value for r in resolved] == ["REPORT 0", "REPORT 1"]
+
+
+class TestIsFlat:
+    def test_flat(self):
+        assert is_flat(Report, x("title"))
+        assert is_flat(Report, x("owner__username"))
+        assert is_flat(Info, x("report__title"))
+
+    def test_not_flat(self):
+        assert not is_flat(Report, x("owner"))
+        assert not is_flat(Report, x("access_users__username"))
+        assert not is_flat(Report, x("title_upper"))
+        assert not is_flat(Report, x("title", cache=60))
+        assert not is_flat(Report, x("owner__username", nested=["username"]))
+
+
+class TestResolveNested:
+    def test_single_relation(self, report):
+        prop = resolve_property(report, x("info", nested=["text", "is_public"]))
+        assert prop.type == "nested"
+        assert len(prop.nested) == 1
+        assert [p.label for p in prop.nested[0]] == ["Info text", "Public"]
+        assert [p.value for p in prop.nested[0]] == ["Some info text", True]
+
+    def test_null_relation(self, db):
+        report = Report.objects.create(title="Orphan")
+        prop = resolve_property(report, x("info", nested=["text"]))
+        assert prop.nested == []
+
+    def test_explicit_type_kept(self, report):
+        assert resolve_property(report, x("info", type="foreignkey", nested=["text"])).type == "foreignkey"
+
+    def test_many_batched(self, report, user, user2, django_assert_num_queries):
+        report.access_users.add(user, user2)
+        cfg = x("access_users", nested=["username", x("owned_reports", nested=["title"])])
+        with django_assert_num_queries(2):
+            # access_users once, then owned_reports for both users at once
+            prop = resolve_property(report, cfg)
+        assert [item[0].value for item in prop.nested] == ["testuser", "otheruser"]
+        assert [[r[0].value for r in item[1].nested] for item in prop.nested] == [["Test Report"], []]
+
+    def test_resolve_many_prefetches_nested(self, reports, django_assert_num_queries):
+        groups = [PropertyGroupConfig(title="G", properties=[
+            "title",
+            x("access_users", nested=["username", x("owned_reports", nested=["info__text"])]),
+        ])]
+        with django_assert_num_queries(4):
+            resolved = resolve_many(Report.objects.order_by("pk"), groups)
+        nested = resolved[0][0].properties[1].nested
+        assert [item[0].value for item in nested] == ["otheruser"]
+        assert [r[0].value for r in nested[0][1].nested] == ["text 1"]
+
+
+class TestRelationQuery:
+    @pytest.fixture
+    def owned(self, user, now):
+        return [Report.objects.create(title=f"Owned {i}", owner=user) for i in range(4)]
+
+    def test_filter_order_limit_single_query(self, user, owned, django_assert_num_queries):
+        cfg = x("owned_reports__title", filter={"title__startswith": "Owned"}, order_by="-title", limit=2)
+        with django_assert_num_queries(1) as captured:
+            prop = resolve_property(user, cfg)
+        assert prop.value == ["Owned 3", "Owned 2"]
+        assert "LIMIT 2" in captured.captured_queries[0]["sql"]
+
+    def test_resolve_many_uses_prefetch(self, user, user2, owned, django_assert_num_queries):
+        Report.objects.create(title="Other", owner=user2)
+        groups = [PropertyGroupConfig(title="G", properties=[
+            "username",
+            x("owned_reports", order_by="-pk", limit=1),
+            x("owned_reports__title", filter={"title__startswith": "Owned"}, order_by="title"),
+        ])]
+        from django.contrib.auth import get_user_model
+
+        with django_assert_num_queries(3):
+            resolved = resolve_many(get_user_model().objects.order_by("pk"), groups)
+        assert [str(r) for r in resolved[0][0].properties[1].value] == ["Owned 3"]
+        assert [str(r) for r in resolved[1][0].properties[1].value] == ["Other"]
+        assert resolved[0][0].properties[2].value == ["Owned 0", "Owned 1", "Owned 2", "Owned 3"]
+        assert resolved[1][0].properties[2].value == []
+
+    def test_nested_through_filtered_hop(self, user, owned, info, django_assert_num_queries):
+        Report.objects.filter(pk=owned[0].pk).update(info=info)
+        groups = [PropertyGroupConfig(title="G", properties=[
+            x("owned_reports", filter={"info__isnull": False}, nested=["title", "info__text"]),
+        ])]
+        from django.contrib.auth import get_user_model
+
+        with django_assert_num_queries(3):
+            resolved = resolve_many(get_user_model().objects.filter(pk=user.pk), groups)
+        nested = resolved[0][0].properties[0].nested
+        assert [[p.value for p in item] for item in nested] == [["Owned 0", "Some info text"]]
+
+    def test_requires_many_relation(self, report):
+        from django.core.exceptions import ImproperlyConfigured
+
+        with pytest.raises(ImproperlyConfigured):
+            resolve_property(report, x("owner__username", limit=1))
+
+    def test_not_flat(self):
+        assert not is_flat(Report, x("access_users", limit=3))
+
+
+@pytest.fixture
+def attachments(reports):
+    info = reports[0].info
+    return [
+        Attachment.objects.create(name="a.pdf", target=reports[0]),
+        Attachment.objects.create(name="b.pdf", target=reports[1]),
+        Attachment.objects.create(name="c.pdf", target=info),
+    ]
+
+
+class TestGenericRelations:
+    def test_generic_foreign_key_meta(self):
+        meta = get_property_meta(Attachment, "target")
+        assert meta.type == "foreignkey"
+        assert meta.is_many is False
+        meta = get_property_meta(Attachment, "target__title")
+        assert meta.type == "default"
+        assert meta.fallback_label == "Title"
+
+    def test_generic_relation_meta(self):
+        meta = get_property_meta(Report, "attachments__name")
+        assert meta.is_many is True
+        assert meta.verbose_name == "File name"
+        assert get_property_meta(Report, "attachments").type == "manytomany"
+
+    def test_resolve_generic_foreign_key(self, attachments, reports):
+        prop = resolve_property(attachments[0], x("target"))
+        assert prop.value == reports[0]
+        assert prop.type == "foreignkey"
+        assert resolve_property(attachments[0], x("target__title")).value == "Report 0"
+
+    def test_resolve_generic_relation(self, attachments, reports):
+        prop = resolve_property(reports[0], x("attachments__name"))
+        assert prop.value == ["a.pdf"]
+        assert prop.is_many is True
+
+    def test_targets_loaded_per_content_type(self, attachments, django_assert_num_queries):
+        from django.contrib.contenttypes.models import ContentType
+
+        ContentType.objects.get_for_models(Report, Info)
+        groups = [PropertyGroupConfig(title="G", properties=["name", "target"])]
+        # attachments, then one query per target model
+        with django_assert_num_queries(3):
+            resolved = resolve_many(Attachment.objects.order_by("pk"), groups)
+        assert [str(r[0].properties[1].value) for r in resolved] == ["Report 0", "Report 1", "Info(%d)" % attachments[2].object_id]
+
+    def test_generic_relation_batched(self, attachments, django_assert_num_queries):
+        groups = [PropertyGroupConfig(title="G", properties=["title", "attachments__name"])]
+        with django_assert_num_queries(2):
+            resolved = resolve_many(Report.objects.order_by("pk"), groups)
+        assert [r[0].properties[1].value for r in resolved] == [["a.pdf"], ["b.pdf"], []]
+
+    def test_nested_mixed_targets(self, attachments):
+        from django.contrib.auth import get_user_model
+
+        user = get_user_model().objects.get(username="testuser")
+        audit = Attachment.objects.create(name="d.pdf", target=user)
+        groups = [PropertyGroupConfig(title="G", properties=[x("target", nested=["id"])])]
+        resolved = resolve_many([attachments[0], attachments[2], audit], groups)
+        assert [r[0].properties[0].nested[0][0].value for r in resolved] == [
+            attachments[0].object_id, attachments[2].object_id, user.pk,
+        ]
@@ -0,0 +1,125 @@
+import pytest
+from django.contrib.auth.models import User
+from django.db import connections
+from django.test import RequestFactory, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.views.generic import DetailView
+
+from django_object_detail.routers import (
+    ReadReplicaRouter,
+    current_read_database,
+    mark_write,
+    read_from,
+    wrote_recently,
+)
+from django_object_detail.views import ObjectDetailMixin
+from tests.models import Report
+
+pytestmark = pytest.mark.django_db(transaction=True, databases=["default", "replica"])
+
+ROUTERS = ["django_object_detail.routers.ReadReplicaRouter"]
+
+
+class ReplicaReportDetailView(ObjectDetailMixin, DetailView):
+    model = Report
+    template_name = "django_object_detail/object_detail.html"
+    read_database = "replica"
+    property_display = [
+        {
+            "title": "Report",
+            "properties": ["title", "owner__username", "access_users", "view_user_count"],
+        },
+    ]
+
+    def view_user_count(self, instance):
+        return User.objects.count()
+
+
+@pytest.fixture
+def report():
+    owner = User.objects.create(username="owner")
+    report = Report.objects.create(title="Replicated", owner=owner)
+    report.access_users.add(owner)
+    return report
+
+
+def _get(view_class, report, request=None):
+    request = request or RequestFactory().get("/")
+    with CaptureQueriesContext(connections["default"]) as primary:
+        with CaptureQueriesContext(connections["replica"]) as replica:
+            response = view_class.as_view()(request, pk=report.pk)
+            response.render()
+    return response, primary.captured_queries, replica.captured_queries
+
+
+class TestReadDatabase:
+    @override_settings(DATABASE_ROUTERS=ROUTERS)
+    def test_resolution_reads_replica(self, report):
+        response, primary, replica = _get(ReplicaReportDetailView, report)
+        values = [p.value for p in response.context_data["object_detail_groups"][0].properties]
+        assert values[1:] == ["owner", [report.owner], 1]
+        assert primary == []
+        assert len(replica) == 4
+
+    def test_related_objects_follow_instance_without_router(self, report):
+        response, primary, replica = _get(ReplicaReportDetailView, report)
+        # Only the view callable's own query is left on the default database
+        assert len(primary) == 1
+        assert len(replica) == 3
+
+    @override_settings(DATABASE_ROUTERS=ROUTERS, OBJECT_DETAIL_READ_DATABASE="replica")
+    def test_setting(self, report):
+        class View(ReplicaReportDetailView):
+            read_database = None
+
+        _, primary, replica = _get(View, report)
+        assert primary == []
+        assert replica
+
+    @override_settings(DATABASE_ROUTERS=ROUTERS)
+    def test_mark_write_reads_primary(self, report):
+        request = RequestFactory().get("/")
+        mark_write(request)
+        _, primary, replica = _get(ReplicaReportDetailView, report, request)
+        assert replica == []
+        assert len(primary) == 4
+
+
+class TestReadYourWrites:
+    def test_session_marker(self):
+        request = RequestFactory().get("/")
+        request.session = {}
+        mark_write(request)
+
+        later = RequestFactory().get("/")
+        later.session = request.session
+        assert wrote_recently(later)
+
+    @override_settings(OBJECT_DETAIL_READ_AFTER_WRITE_SECONDS=0)
+    def test_session_marker_expires(self):
+        request = RequestFactory().get("/")
+        request.session = {}
+        mark_write(request)
+
+        later = RequestFactory().get("/")
+        later.session = request.session
+        assert not wrote_recently(later)
+
+    def test_no_request(self):
+        assert not wrote_recently(None)
+
+
+class TestRouter:
+    def test_read_from(self):
+        router = ReadReplicaRouter()
+        assert router.db_for_read(Report) is None
+        with read_from("replica"):
+            assert current_read_database() == "replica"
+            assert router.db_for_read(Report) == "replica"
+        assert current_read_database() is None
+
+    @override_settings(OBJECT_DETAIL_READ_DATABASE="replica")
+    def test_writes_of_replica_instances_go_to_primary(self, report):
+        loaded = Report.objects.using("replica").get(pk=report.pk)
+        assert ReadReplicaRouter().db_for_write(Report, instance=loaded) == "default"
+        assert ReadReplicaRouter().db_for_write(Report, instance=report) is None
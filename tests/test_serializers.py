@@ -0,0 +1,107 @@
+import datetime
+import decimal
+import json
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.template import Context, Template
+from django.utils import translation
+from django.utils.translation import gettext_lazy as _
+
+from django_object_detail.config import PropertyGroupConfig, x
+from django_object_detail.resolvers import ResolvedGroup, ResolvedProperty, resolve_all
+from django_object_detail.serializers import (
+    DisplayObject,
+    decode_value,
+    dump_groups,
+    dump_property,
+    dumps,
+    encode_value,
+    load_groups,
+    loads,
+)
+from tests.models import Report
+
+
+@pytest.fixture
+def report(db):
+    User = get_user_model()
+    owner = User.objects.create_user(username="owner")
+    report = Report.objects.create(title="Serialized", owner=owner)
+    report.access_users.add(User.objects.create_user(username="reader"))
+    return report
+
+
+GROUPS = [
+    PropertyGroupConfig(
+        title=_("Report"),
+        icon="file-text",
+        properties=["title", x("owner", link="user-detail"), "access_users", x("title", badge="info")],
+    ),
+]
+
+
+class TestValues:
+    @pytest.mark.parametrize("value", [
+        None, True, 3, 1.5, "text",
+        datetime.datetime(2024, 5, 1, 12, 30, tzinfo=datetime.timezone.utc),
+        datetime.date(2024, 5, 1),
+        datetime.time(8, 15),
+        decimal.Decimal("1.10"),
+        [1, "a"],
+        {"a": datetime.date(2024, 1, 1)},
+    ])
+    def test_round_trip(self, value):
+        assert decode_value(json.loads(json.dumps(encode_value(value)))) == value
+
+    def test_model_instance(self, report):
+        decoded = decode_value(encode_value(report.owner))
+        assert decoded == DisplayObject(pk=report.owner.pk, text="owner")
+        assert str(decoded) == "owner"
+
+    def test_lazy_string(self):
+        assert encode_value(_("Report")) == "Report"
+
+
+class TestGroups:
+    def test_round_trip(self, report):
+        resolved = resolve_all(report, GROUPS)
+        loaded = loads(dumps(resolved))
+        assert loaded[0].title == "Report"
+        assert loaded[0].icon == "file-text"
+        props = loaded[0].properties
+        assert props[0].value == "Serialized"
+        assert props[1].value == DisplayObject(pk=report.owner.pk, text="owner")
+        assert props[1].link_url == f"/users/{report.owner.pk}/"
+        assert [str(v) for v in props[2].value] == ["reader"]
+        assert props[2].is_many is True
+        assert props[3].badge_css == "text-bg-info"
+
+    def test_defaults_omitted(self):
+        prop = ResolvedProperty(path="t", label="T", value=1)
+        assert dump_property(prop) == {"path": "t", "label": "T", "value": 1}
+
+    def test_renders_like_live(self, report):
+        resolved = resolve_all(report, GROUPS)
+        tpl = Template("{% load object_detail %}{% for g in groups %}{% render_group g %}{% endfor %}")
+        live = tpl.render(Context({"groups": resolved}))
+        assert tpl.render(Context({"groups": loads(dumps(resolved))})) == live
+
+    def test_lazy_title_in_active_language(self, report):
+        resolved = resolve_all(report, [PropertyGroupConfig(title=_("username"), properties=["title"])])
+        with translation.override("de"):
+            data = dump_groups(resolved)
+        assert data["groups"][0]["title"] == "Benutzername"
+
+    def test_schema_version_checked(self):
+        with pytest.raises(ValueError):
+            load_groups({"v": 999, "groups": []})
+
+    def test_unknown_format(self):
+        with pytest.raises(ValueError):
+            dumps([ResolvedGroup(title="G")], format="xml")
+
+    def test_msgpack(self, report):
+        pytest.importorskip("msgpack")
+        resolved = resolve_all(report, GROUPS)
+        assert loads(dumps(resolved, format="msgpack"), format="msgpack") == loads(dumps(resolved))
@@ -0,0 +1,103 @@
+import pytest
+from django.template import Context, Template
+from django.test import override_settings
+from django.utils import translation
+
+from django_object_detail import skeleton
+from django_object_detail.resolvers import ResolvedGroup, ResolvedProperty
+from django_object_detail.skeleton import clear_skeletons, get_skeleton, skeleton_key
+from tests.test_layout_packs import LAYOUT_PACKS
+
+
+def _groups(name="Test", link="/items/1/?a=1&b=2"):
+    return [
+        ResolvedGroup(
+            title="General",
+            description="General info",
+            icon="info-circle",
+            properties=[
+                ResolvedProperty(path="name", label="Name", value=name, type="char"),
+                ResolvedProperty(path="status", label="Status", value=None, type="char", detail="Currently active"),
+                ResolvedProperty(path="link", label="Link", value="linked", type="char", link_url=link),
+            ],
+        ),
+        ResolvedGroup(
+            title="Stats",
+            properties=[ResolvedProperty(path="count", label="Count", value=42, type="integer")],
+        ),
+    ]
+
+
+def _render(groups, skeleton):
+    template = Template("{% load object_detail %}{% render_object_detail None groups skeleton=skeleton %}")
+    return template.render(Context({"groups": groups, "skeleton": skeleton}))
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_skeletons()
+    yield
+    clear_skeletons()
+
+
+@pytest.mark.parametrize("pack", LAYOUT_PACKS)
+def test_same_output_as_full_render(pack):
+    with override_settings(OBJECT_DETAIL_TEMPLATE_PACK_LAYOUT=pack):
+        assert _render(_groups(), True) == _render(_groups(), False)
+        # Filled from the cache for another object
+        assert _render(_groups(name="<b>Other</b>", link=None), True) == _render(
+            _groups(name="<b>Other</b>", link=None), False
+        )
+
+
+def test_skeleton_rendered_once():
+    calls = []
+
+    def render(groups):
+        calls.append(groups)
+        return "<div>" + "".join(p.marker for g in groups for p in g.properties) + "</div>"
+
+    first = get_skeleton(_groups(), render)
+    second = get_skeleton(_groups(name="Other"), render)
+    assert first is second
+    assert len(calls) == 1
+    assert first.fill(["a", "b", "c", "d"]) == "<div>abcd</div>"
+
+
+def test_value_containing_marker_is_not_a_slot():
+    html = _render(_groups(name="<!--od-slot:3-->"), True)
+    assert "&lt;!--od-slot:3--&gt;" in html
+
+
+def test_key_follows_structure_and_language():
+    base = skeleton_key(_groups())
+    assert skeleton_key(_groups(name="Other")) == base
+    relabeled = _groups()
+    relabeled[0].properties[0].label = "Title"
+    assert skeleton_key(relabeled) != base
+    with translation.override("de"):
+        assert skeleton_key(_groups()) != base
+    with override_settings(OBJECT_DETAIL_TEMPLATE_PACK_LAYOUT="accordion"):
+        assert skeleton_key(_groups()) != base
+
+
+@override_settings(OBJECT_DETAIL_SKELETON_CACHE_SIZE=1)
+def test_cache_bounded():
+    _render(_groups(), True)
+    with override_settings(OBJECT_DETAIL_TEMPLATE_PACK_LAYOUT="accordion"):
+        _render(_groups(), True)
+    assert len(skeleton._skeletons) == 1
+
+
+@override_settings(OBJECT_DETAIL_SKELETON_RENDER=True)
+def test_setting_and_lazy_fallback():
+    _render(_groups(), None)
+    assert len(skeleton._skeletons) == 1
+
+    clear_skeletons()
+    groups = _groups()
+    groups[1].lazy = True
+    groups[1].fragment_url = "/groups/1/"
+    html = _render(groups, None)
+    assert "/groups/1/" in html
+    assert not skeleton._skeletons
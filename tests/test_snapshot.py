@@ -0,0 +1,213 @@
+import datetime
+from io import StringIO
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import CommandError, call_command
+from django.test import RequestFactory
+from django.utils import timezone
+from django.views.generic import DetailView
+
+from django_object_detail.config import parse_property_display, x
+from django_object_detail.snapshot import (
+    build_snapshot,
+    get_snapshot_spec,
+    register_snapshot,
+    snapshot_signature,
+    snapshot_to_groups,
+    unregister_snapshot,
+)
+from django_object_detail.views import ObjectDetailMixin
+from tests.models import Info, Report
+
+SNAPSHOT_DISPLAY = [
+    {"title": "Report", "properties": ["title", "owner__username", "info__create_dt", "access_users"]},
+]
+
+
+@pytest.fixture
+def registered(db):
+    register_snapshot(Report, SNAPSHOT_DISPLAY)
+    yield
+    unregister_snapshot(Report)
+
+
+@pytest.fixture
+def owner(db):
+    return get_user_model().objects.create_user(username="owner")
+
+
+@pytest.fixture
+def report(registered, owner):
+    now = timezone.now()
+    info = Info.objects.create(text="body", create_dt=now, update_dt=now)
+    return Report.objects.create(title="Snap", owner=owner, info=info)
+
+
+def stored(report):
+    report.refresh_from_db(fields=["detail_snapshot"])
+    return {p["path"]: p["value"] for p in report.detail_snapshot["groups"][0]}
+
+
+class TestSignals:
+    def test_built_on_save(self, report):
+        values = stored(report)
+        assert values["title"] == "Snap"
+        assert values["owner__username"] == "owner"
+
+    def test_root_update(self, report):
+        report.title = "Renamed"
+        report.save()
+        assert stored(report)["title"] == "Renamed"
+
+    def test_related_save(self, report, owner):
+        owner.username = "renamed"
+        owner.save()
+        assert stored(report)["owner__username"] == "renamed"
+
+    def test_related_delete(self, report):
+        reader = get_user_model().objects.create_user(username="reader")
+        report.access_users.add(reader)
+        assert len(stored(report)["access_users"]) == 1
+        reader.delete()
+        assert stored(report)["access_users"] == []
+
+    def test_m2m_add_remove_clear(self, report):
+        user = get_user_model().objects.create_user(username="reader")
+        report.access_users.add(user)
+        assert stored(report)["access_users"] == [{"$": "object", "pk": user.pk, "text": "reader"}]
+        report.access_users.remove(user)
+        assert stored(report)["access_users"] == []
+        user.accessible_reports.add(report)
+        assert len(stored(report)["access_users"]) == 1
+        user.accessible_reports.clear()
+        assert stored(report)["access_users"] == []
+
+    def test_unregistered_not_refreshed(self, report, owner):
+        unregister_snapshot(Report)
+        owner.username = "changed"
+        owner.save()
+        assert stored(report)["owner__username"] == "owner"
+
+
+def test_rejects_view_methods(db):
+    display = [{"title": "Report", "properties": ["title", "view_summary"]}]
+    with pytest.raises(ImproperlyConfigured, match="view_summary"):
+        register_snapshot(Report, display)
+    assert get_snapshot_spec(Report) is None
+    nested = [{"title": "Report", "properties": [x("owner", nested=["username", "view_summary"])]}]
+    with pytest.raises(ImproperlyConfigured, match="view_summary"):
+        register_snapshot(Report, nested)
+
+
+class SnapshotDetailView(ObjectDetailMixin, DetailView):
+    model = Report
+    template_name = "django_object_detail/object_detail.html"
+    property_display = SNAPSHOT_DISPLAY
+    snapshot_field = "detail_snapshot"
+
+
+class TestSnapshotRendering:
+    def get_context(self, report):
+        view = SnapshotDetailView()
+        view.setup(RequestFactory().get("/"), pk=report.pk)
+        view.object = view.get_object()
+        return view.get_context_data()
+
+    def test_no_relation_queries(self, report, django_assert_num_queries):
+        with django_assert_num_queries(1):
+            context = self.get_context(report)
+        props = context["object_detail_groups"][0].properties
+        assert props[0].label == "Report title"
+        assert props[1].value == "owner"
+        assert isinstance(props[2].value, datetime.datetime)
+
+    def test_same_as_live(self, report):
+        groups = parse_property_display(SNAPSHOT_DISPLAY)
+        rebuilt = snapshot_to_groups(build_snapshot(report, groups), Report, groups)
+        from django_object_detail.resolvers import resolve_all
+
+        live = resolve_all(report, groups)
+        assert [str(p.value) for p in rebuilt[0].properties] == [str(p.value) for p in live[0].properties]
+        assert [p.label for p in rebuilt[0].properties] == [p.label for p in live[0].properties]
+
+    def test_visible_if(self, report):
+        groups = parse_property_display(
+            [{"title": "Report", "properties": ["title", {"path": "owner__username", "visible_if": "auth.view_user"},
+                                                "info__create_dt", "access_users"]}]
+        )
+        snapshot = build_snapshot(report, groups)
+        assert len(snapshot["groups"][0]) == 4
+        rebuilt = snapshot_to_groups(snapshot, Report, groups, request=None, obj=report)
+        assert [p.path for p in rebuilt[0].properties] == ["title", "info__create_dt", "access_users"]
+
+    def test_changed_options_reject_snapshot(self, report):
+        for name in ("a", "b", "c"):
+            report.access_users.add(get_user_model().objects.create_user(username=name))
+        built = parse_property_display(
+            [{"title": "Report", "properties": [{"path": "access_users", "order_by": "username", "limit": 1}]}]
+        )
+        snapshot = build_snapshot(report, built)
+        same = parse_property_display(
+            [{"title": "Report", "properties": [{"path": "access_users", "order_by": ["username"], "limit": 1}]}]
+        )
+        assert snapshot_to_groups(snapshot, Report, same) is not None
+        wider = parse_property_display(
+            [{"title": "Report", "properties": [{"path": "access_users", "order_by": "username", "limit": 3}]}]
+        )
+        assert snapshot_to_groups(snapshot, Report, wider) is None
+
+    def test_render_options_keep_snapshot(self, report):
+        snapshot = build_snapshot(report, parse_property_display(SNAPSHOT_DISPLAY))
+        relabeled = parse_property_display(
+            [{"title": "Renamed", "properties": [
+                {"path": "title", "title": "Name", "visible_if": "tests.view_report", "hide_empty": True},
+                "owner__username", "info__create_dt", "access_users",
+            ]}]
+        )
+        assert snapshot_to_groups(snapshot, Report, relabeled) is not None
+
+    def test_nested_and_callables_in_signature(self):
+        def primary(value):
+            return "primary"
+
+        def secondary(value):
+            return "secondary"
+
+        def signature(nested, color_fn):
+            props = [x("owner", nested=nested, badge={"color_fn": color_fn})]
+            return snapshot_signature(parse_property_display([{"title": "Report", "properties": props}]))
+
+        assert signature(["username"], primary) == signature(["username"], primary)
+        assert signature(["username"], primary) != signature(["email"], primary)
+        assert signature(["username"], primary) != signature(["username"], secondary)
+
+    def test_stale_snapshot_falls_back(self, report):
+        groups = parse_property_display([{"title": "Other", "properties": ["title"]}])
+        assert snapshot_to_groups(report.detail_snapshot, Report, groups) is None
+        Report.objects.filter(pk=report.pk).update(detail_snapshot=None)
+        context = self.get_context(report)
+        assert context["object_detail_groups"][0].properties[0].value == "Snap"
+
+
+class TestSnapshotCommand:
+    def test_refresh_all(self, report):
+        Report.objects.filter(pk=report.pk).update(detail_snapshot=None)
+        out = StringIO()
+        call_command("object_detail_snapshot", stdout=out)
+        assert "tests.Report: 1 snapshots refreshed" in out.getvalue()
+        assert stored(report)["title"] == "Snap"
+
+    def test_batched(self, registered, owner, django_assert_num_queries):
+        for i in range(5):
+            Report.objects.create(title=f"R{i}", owner=owner)
+        Report.objects.update(detail_snapshot=None)
+        # pks, then per batch of 2: rows with owner and info, access users, update
+        with django_assert_num_queries(1 + 3 * 3):
+            call_command("object_detail_snapshot", "tests.Report", batch_size=2, stdout=StringIO())
+        assert Report.objects.filter(detail_snapshot=None).count() == 0
+
+    def test_unregistered_model(self, db):
+        with pytest.raises(CommandError):
+            call_command("object_detail_snapshot", "tests.Info")
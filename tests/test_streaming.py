@@ -0,0 +1,187 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ImproperlyConfigured
+from django.template import Context, Template
+from django.utils import timezone
+from pydantic import ValidationError
+
+from django_object_detail.config import PropertyConfig, parse_property_display, x
+from django_object_detail.export import export_value
+from django_object_detail.plan import is_flat, plan_property
+from django_object_detail.resolvers import StreamedValue, is_empty, resolve_all, resolve_property
+from django_object_detail.serializers import encode_value
+from django_object_detail.streaming import collect_streams, stream_html
+from tests.models import Info, Report
+
+User = get_user_model()
+
+
+@pytest.fixture
+def report(db):
+    owner = User.objects.create_user(username="owner")
+    report = Report.objects.create(title="Quarterly", owner=owner)
+    report.access_users.set(User.objects.create_user(username=f"user{i}") for i in range(5))
+    return report
+
+
+def _render(groups):
+    template = Template("{% load object_detail %}{% render_object_detail None groups %}")
+    return template.render(Context({"groups": groups}))
+
+
+class TestStreamedValue:
+    def test_value_is_lazy(self, report, django_assert_num_queries):
+        with django_assert_num_queries(0):
+            prop = resolve_property(report, x("access_users", stream=True))
+        assert isinstance(prop.value, StreamedValue)
+        assert prop.type == "stream"
+        assert prop.is_many
+
+    def test_iterates_in_chunks(self, report, django_assert_num_queries):
+        prop = resolve_property(report, x("access_users__username", stream=True, chunk_size=2))
+        # sqlite has no server-side cursors, so every chunk is fetched from the same query
+        with django_assert_num_queries(1):
+            chunks = list(prop.value.chunks())
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+        assert sorted(item for chunk in chunks for item in chunk) == [f"user{i}" for i in range(5)]
+
+    def test_rest_of_path_joined(self, report, django_assert_num_queries):
+        now = timezone.now()
+        for i in range(20):
+            info = Info.objects.create(text=f"text{i}", create_dt=now, update_dt=now)
+            Report.objects.create(title=f"Report {i}", owner=report.owner, info=info)
+        prop = resolve_property(report, x("owner__owned_reports__info__text", stream=True, chunk_size=5))
+        with django_assert_num_queries(1):
+            values = list(prop.value)
+        # The fixture's report has no info
+        assert sorted(values, key=str) == [None, *sorted(f"text{i}" for i in range(20))]
+
+    def test_rest_of_path_prefetched_per_chunk(self, report, django_assert_num_queries):
+        for i in range(4):
+            other = Report.objects.create(title=f"Report {i}", owner=report.owner)
+            other.access_users.add(report.owner)
+        prop = resolve_property(
+            report, x("owner__owned_reports__access_users__username", stream=True, chunk_size=2)
+        )
+        # One query for the 5 reports, one access_users prefetch per chunk of 2
+        with django_assert_num_queries(4):
+            values = list(prop.value)
+        assert sorted(values) == ["owner"] * 4 + [f"user{i}" for i in range(5)]
+
+    def test_relation_query_applied(self, report):
+        prop = resolve_property(
+            report, x("access_users__username", stream=True, order_by="-username", limit=2)
+        )
+        assert list(prop.value) == ["user4", "user3"]
+
+    def test_through_single_relation(self, report):
+        other = Report.objects.create(title="Other", owner=report.owner)
+        prop = resolve_property(report, x("owner__owned_reports__title", stream=True, order_by="title"))
+        assert list(prop.value) == [other.title, report.title]
+
+    def test_empty(self, db):
+        report = Report.objects.create(title="Empty")
+        prop = resolve_property(report, x("access_users", stream=True))
+        assert not prop.value
+        assert is_empty(prop.value)
+        assert resolve_property(report, x("owner__owned_reports", stream=True)).value == []
+
+    def test_hide_empty(self, db):
+        report = Report.objects.create(title="Empty")
+        groups = parse_property_display(
+            [{"title": "T", "properties": ["title", x("access_users", stream=True, hide_empty=True)]}]
+        )
+        assert [p.path for p in resolve_all(report, groups)[0].properties] == ["title"]
+
+    def test_needs_many_relation(self, report):
+        with pytest.raises(ImproperlyConfigured, match="many-valued relation"):
+            resolve_property(report, x("owner__username", stream=True))
+
+    def test_rejects_nested_and_cache(self):
+        with pytest.raises(ValidationError, match="stream cannot be combined"):
+            PropertyConfig(path="access_users", stream=True, nested=["username"])
+        with pytest.raises(ValidationError, match="stream cannot be combined"):
+            PropertyConfig(path="access_users", stream=True, cache=True)
+
+    def test_chunk_size_positive(self):
+        with pytest.raises(ValidationError, match="chunk_size"):
+            PropertyConfig(path="access_users", stream=True, chunk_size=0)
+        cfg = x("access_users", stream=True, chunk_size=0)
+        with pytest.raises(ValidationError, match="chunk_size"):
+            parse_property_display([{"title": "T", "properties": [cfg]}])
+        cfg.chunk_size = None
+
+    def test_export_and_serialize(self, report):
+        prop = resolve_property(report, x("access_users__username", stream=True, order_by="username"))
+        assert export_value(prop) == [f"user{i}" for i in range(5)]
+        assert encode_value(prop.value) == [f"user{i}" for i in range(5)]
+
+
+class TestPlan:
+    def test_streamed_hop_not_prefetched(self):
+        plan = plan_property(Report, x("access_users__username", stream=True))
+        assert plan.prefetch_related == []
+        assert plan.select_related == []
+        assert plan.only is None
+
+    def test_single_relation_before_hop_joined(self):
+        plan = plan_property(Report, x("owner__owned_reports", stream=True))
+        assert plan.select_related == ["owner"]
+        assert plan.prefetch_related == []
+
+    def test_not_flat(self):
+        assert not is_flat(Report, x("access_users", stream=True))
+
+
+class TestStreamingRender:
+    def _groups(self, report, **options):
+        configs = parse_property_display(
+            [{"title": "Report", "properties": ["title", x("access_users__username", stream=True, **options)]}]
+        )
+        return resolve_all(report, configs)
+
+    def test_full_render(self, report):
+        html = _render(self._groups(report))
+        assert html.count("<li>") == 5
+        assert "user4" in html
+
+    def test_stream_html_matches_full_render(self, report):
+        groups = self._groups(report, order_by="username")
+        with collect_streams() as streams:
+            html = _render(groups)
+        assert len(streams) == 1
+        assert "<!--od-stream:0-->" in html
+        streamed = "".join(stream_html(html, streams))
+        assert streamed == _render(groups)
+
+    def test_chunks_rendered_separately(self, report):
+        groups = self._groups(report, order_by="username", chunk_size=2)
+        with collect_streams() as streams:
+            html = _render(groups)
+        parts = list(stream_html(html, streams))
+        chunks = [part for part in parts if part.startswith("<ul")]
+        assert [chunk.count("<li>") for chunk in chunks] == [2, 2, 1]
+
+    def test_empty_relation_rendered_once(self, db):
+        report = Report.objects.create(title="Empty")
+        with collect_streams() as streams:
+            html = _render(self._groups(report))
+        assert "&mdash;" in "".join(stream_html(html, streams))
+
+
+@pytest.mark.django_db
+def test_streaming_view(report, client):
+    response = client.get(f"/streaming-reports/{report.pk}/")
+    assert response.status_code == 200
+    assert response.streaming
+    assert response["Content-Type"].startswith("text/html")
+    html = b"".join(response.streaming_content).decode()
+    assert html.startswith("<main>")
+    assert html.count("<ul") == 3
+    assert html.count("<li>") == 5
+    assert "od-stream" not in html
+
+
+@pytest.mark.django_db
+def test_streaming_view_unknown_object(client):
+    assert client.get("/streaming-reports/999/").status_code == 404
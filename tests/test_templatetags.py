@@ -204,6 +204,24 @@ class TestRenderPropertyValue:
         html = tpl.render(Context({"prop": prop}))
         assert "anything" in html
 
+    def test_nested(self):
+        sub = ResolvedProperty(path="name", label="Name", value="Alice", type="char")
+        prop = ResolvedProperty(path="t", label="T", value=["x"], type="nested", nested=[[sub]])
+        tpl = Template(
+            "{% load object_detail %}{% render_property_value prop %}"
+        )
+        html = tpl.render(Context({"prop": prop}))
+        assert "Name" in html
+        assert "Alice" in html
+
+    def test_nested_empty(self):
+        prop = ResolvedProperty(path="t", label="T", value=None, type="nested", nested=[])
+        tpl = Template(
+            "{% load object_detail %}{% render_property_value prop %}"
+        )
+        html = tpl.render(Context({"prop": prop}))
+        assert "&mdash;" in html
+
 
 class TestRenderPropertyValueText:
     def test_text_default_linebreaksbr(self):
@@ -325,3 +343,53 @@ class TestRenderPropertyBadge:
         html = tpl.render(Context({"prop": prop}))
         assert "badge" not in html
         assert "check-circle-fill" in html
+
+
+class TestRenderObjectDetailParseCache:
+    def test_config_parsed_once_in_loop(self, report, monkeypatch):
+        from django_object_detail import config
+
+        calls = []
+        original = config.parse_property_display
+
+        def counting(raw):
+            calls.append(raw)
+            return original(raw)
+
+        monkeypatch.setattr(config, "parse_property_display", counting)
+        cfg = [{"title": "Report", "properties": ["title"]}]
+        tpl = Template(
+            "{% load object_detail %}{% for obj in objects %}"
+            "{% render_object_detail obj property_display=cfg %}{% endfor %}"
+        )
+        html = tpl.render(Context({"objects": [report] * 5, "cfg": cfg}))
+        assert html.count("Test Report") == 5
+        assert len(calls) == 1
+
+
+class TestRenderObjectCompare:
+    def test_renders_columns_and_highlight(self, report, db):
+        other = Report.objects.create(title="Other Report", owner=report.owner)
+        cfg = [{"title": "Report", "properties": ["title", "owner"]}]
+        tpl = Template("{% load object_detail %}{% render_object_compare objects property_display=cfg %}")
+        html = tpl.render(Context({"objects": [report, other], "cfg": cfg}))
+        assert "<th>Test Report</th>" in html
+        assert "<th>Other Report</th>" in html
+        assert html.count('class="table-warning"') == 1
+        assert "Report title" in html
+
+    def test_visible_if(self, report, db):
+        from django.contrib.auth import get_user_model
+        from django.test import RequestFactory
+
+        cfg = [{"title": "Report", "properties": ["title", x("owner__username", visible_if="tests.view_report")]}]
+        tpl = Template("{% load object_detail %}{% render_object_compare objects property_display=cfg %}")
+        request = RequestFactory().get("/")
+        request.user = get_user_model().objects.create_user(username="viewer")
+        html = tpl.render(Context({"objects": [report], "cfg": cfg, "request": request}))
+        assert "Report title" in html
+        assert "Username" not in html
+
+        request.user = get_user_model().objects.create_superuser(username="admin")
+        html = tpl.render(Context({"objects": [report], "cfg": cfg, "request": request}))
+        assert "Username" in html
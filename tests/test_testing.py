@@ -0,0 +1,98 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.views.generic import DetailView
+
+from django_object_detail.testing import (
+    DetailQueryAssertionsMixin,
+    assert_detail_queries,
+    capture_detail_queries,
+)
+from django_object_detail.views import ObjectDetailMixin
+from tests.models import Report
+
+
+class BudgetReportView(ObjectDetailMixin, DetailView):
+    model = Report
+    property_display = [
+        {"title": "Report", "properties": ["title", "owner__username"]},
+        {"title": "Access", "properties": ["access_users__owned_reports"]},
+    ]
+
+
+class FlatReportView(ObjectDetailMixin, DetailView):
+    model = Report
+    property_display = [{"title": "Report", "properties": ["title", "owner__username"]}]
+
+
+def make_report():
+    User = get_user_model()
+    report = Report.objects.create(title="Budget", owner=User.objects.create_user(username="owner"))
+    report.access_users.add(User.objects.create_user(username="a"), User.objects.create_user(username="b"))
+    return report
+
+
+@pytest.fixture
+def report(db):
+    return make_report()
+
+
+class TestCaptureDetailQueries:
+    def test_counts_groups_only(self, report):
+        result = capture_detail_queries(FlatReportView, report)
+        # owner is loaded lazily; the report itself is loaded before capturing
+        assert len(result.queries) == 1
+        assert "Budget" in result.html
+        assert result.repeated == []
+
+    def test_repeated_patterns(self, report):
+        result = capture_detail_queries(BudgetReportView, report)
+        assert [n for _, n in result.repeated] == [2]
+
+    def test_pk_url_kwarg(self, report):
+        class View(FlatReportView):
+            pk_url_kwarg = "report_id"
+
+        assert "Budget" in capture_detail_queries(View, report).html
+
+    def test_caller_kwargs(self, report):
+        class View(FlatReportView):
+            slug_field = "title"
+
+        assert "Budget" in capture_detail_queries(View, report, slug="Budget").html
+
+
+class TestAssertDetailQueries:
+    def test_within_budget(self, report):
+        html = assert_detail_queries(FlatReportView, report, 1)
+        assert "owner" in html
+
+    def test_over_budget(self, report):
+        with pytest.raises(AssertionError) as excinfo:
+            assert_detail_queries(FlatReportView, report, 0)
+        message = str(excinfo.value)
+        assert "1 queries, expected at most 0" in message
+        assert "owner__username: 1 queries" in message
+
+    def test_repeated_names_property_path(self, report):
+        with pytest.raises(AssertionError) as excinfo:
+            assert_detail_queries(BudgetReportView, report, 10)
+        message = str(excinfo.value)
+        assert "1 query patterns repeated" in message
+        assert "Repeated 2x from access_users__owned_reports" in message
+
+    def test_allow_repeated(self, report):
+        assert_detail_queries(BudgetReportView, report, 10, allow_repeated=True)
+
+    def test_fixture(self, detail_query_budget, report):
+        detail_query_budget(FlatReportView, report, 1)
+        with pytest.raises(AssertionError):
+            detail_query_budget(BudgetReportView, report, 10)
+
+
+class DetailQueryAssertionsTests(DetailQueryAssertionsMixin, TestCase):
+    def test_assert_detail_queries(self):
+        report = make_report()
+        self.assertDetailQueries(FlatReportView, report, 1)
+        with self.assertRaises(self.failureException):
+            self.assertDetailQueries(BudgetReportView, report, 1)
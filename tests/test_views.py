@@ -1,12 +1,19 @@
 import pytest
-from django.test import RequestFactory
+from django.contrib.auth.mixins import LoginRequiredMixin, PermissionRequiredMixin
+from django.contrib.auth.models import AnonymousUser, Permission
+from django.core.exceptions import PermissionDenied
+from django.http import QueryDict
+from django.template import Context, Template
+from django.test import RequestFactory, override_settings
 from django.views.generic import DetailView
 from django.utils import timezone
+from django.utils.html import escape
 
 from django_object_detail.config import x
 from django_object_detail.resolvers import ResolvedGroup
-from django_object_detail.views import ObjectDetailMixin
+from django_object_detail.views import ObjectDetailGroupView, ObjectDetailMixin
 from tests.models import Info, Report
+from tests.views import LazyReportDetailView, ReportListView
 
 
 class ReportDetailView(ObjectDetailMixin, DetailView):
@@ -112,3 +119,189 @@ class TestObjectDetailMixinViewFallback:
         context = view.get_context_data()
         groups = context["object_detail_groups"]
         assert groups[0].properties[0].value == f"computed:{report.title}"
+
+
+class TestLazyGroups:
+    def _context(self, report, factory):
+        view = LazyReportDetailView()
+        view.setup(factory.get(f"/lazy-reports/{report.pk}/"), pk=report.pk)
+        view.object = report
+        return view.get_context_data()
+
+    def test_lazy_group_is_placeholder(self, report, factory):
+        groups = self._context(report, factory)["object_detail_groups"]
+        assert groups[0].lazy is False
+        assert groups[0].properties[0].value == "My Report"
+        assert groups[1].lazy is True
+        assert groups[1].properties == []
+        assert groups[1].fragment_url == f"/lazy-reports/{report.pk}/groups/1/"
+
+    @override_settings(OBJECT_DETAIL_HIDE_EMPTY=True)
+    def test_hide_empty_keeps_placeholders(self, report, factory):
+        report.title = ""
+        groups = self._context(report, factory)["object_detail_groups"]
+        assert len(groups) == 1
+        assert groups[0].lazy is True
+
+    def test_hidden_group_keeps_fragment_index(self, report, factory):
+        class View(LazyReportDetailView):
+            property_display = [
+                {**LazyReportDetailView.property_display[0], "visible_if": lambda request, obj: False},
+                LazyReportDetailView.property_display[1],
+            ]
+
+        view = View()
+        view.setup(factory.get("/"), pk=report.pk)
+        view.object = report
+        groups = view.get_context_data()["object_detail_groups"]
+        assert len(groups) == 1
+        assert groups[0].fragment_url == f"/lazy-reports/{report.pk}/groups/1/"
+
+    def test_placeholder_rendered(self, report, factory):
+        groups = self._context(report, factory)["object_detail_groups"]
+        tpl = Template("{% load object_detail %}{% render_object_detail obj groups %}")
+        html = tpl.render(Context({"obj": report, "groups": groups}))
+        assert f'hx-get="/lazy-reports/{report.pk}/groups/1/"' in html
+        assert "My Report" in html
+
+    @override_settings(OBJECT_DETAIL_LAZY_GROUPS=False)
+    def test_lazy_groups_disabled(self, report, factory):
+        groups = self._context(report, factory)["object_detail_groups"]
+        assert groups[1].lazy is False
+        assert groups[1].properties[1].value == "MY REPORT"
+
+    def test_fragment_view(self, report, client):
+        response = client.get(f"/lazy-reports/{report.pk}/groups/1/")
+        assert response.status_code == 200
+        html = response.content.decode()
+        assert "Access" in html
+        assert "MY REPORT" in html
+        assert "hx-get" not in html
+
+    def test_fragment_view_unknown_group(self, report, client):
+        response = client.get(f"/lazy-reports/{report.pk}/groups/5/")
+        assert response.status_code == 404
+
+    def test_fragment_view_unknown_object(self, db, client):
+        response = client.get("/lazy-reports/999/groups/1/")
+        assert response.status_code == 404
+
+    def _fragment(self, detail_view, report, user):
+        request = RequestFactory().get(f"/reports/{report.pk}/groups/1/")
+        request.user = user
+        return ObjectDetailGroupView.as_view(detail_view=detail_view)(request, pk=report.pk, group=1)
+
+    def test_fragment_view_requires_login(self, report, django_user_model):
+        class View(LoginRequiredMixin, LazyReportDetailView):
+            pass
+
+        response = self._fragment(View, report, AnonymousUser())
+        assert response.status_code == 302
+        assert response["Location"].startswith("/accounts/login/")
+        assert "MY REPORT" not in response.content.decode()
+
+        response = self._fragment(View, report, django_user_model.objects.create_user(username="reader"))
+        assert response.status_code == 200
+        assert "MY REPORT" in response.content.decode()
+
+    def test_fragment_view_requires_permission(self, report, django_user_model):
+        class View(PermissionRequiredMixin, LazyReportDetailView):
+            permission_required = "tests.view_report"
+            raise_exception = True
+
+        user = django_user_model.objects.create_user(username="reader")
+        with pytest.raises(PermissionDenied):
+            self._fragment(View, report, user)
+
+        user.user_permissions.add(Permission.objects.get(codename="view_report"))
+        user = django_user_model.objects.get(pk=user.pk)
+        assert self._fragment(View, report, user).status_code == 200
+
+
+@pytest.fixture
+def many_reports(db):
+    # Duplicate titles exercise the pk tie-breaker
+    titles = ["A", "B", "B", "C", "D"]
+    return [Report.objects.create(title=title) for title in titles]
+
+
+class TestObjectListMixin:
+    def _get(self, client, cursor=None):
+        url = "/report-list/" + (f"?cursor={cursor}" if cursor else "")
+        response = client.get(url)
+        assert response.status_code == 200
+        return response
+
+    def _titles(self, response):
+        return [(row.properties[0].value, row.pk) for row in response.context["object_list_table"].rows]
+
+    def test_first_page(self, many_reports, client):
+        response = self._get(client)
+        table = response.context["object_list_table"]
+        assert [c.label for c in table.columns] == ["Report title", "Username"]
+        assert self._titles(response) == [("D", many_reports[4].pk), ("C", many_reports[3].pk)]
+        assert response.context["previous_cursor"] is None
+        assert response.context["next_cursor"]
+        assert table.rows[0].url == f"/reports/{many_reports[4].pk}/"
+
+    def test_walk_forward_and_back(self, many_reports, client):
+        first = self._get(client)
+        second = self._get(client, first.context["next_cursor"])
+        assert self._titles(second) == [("B", many_reports[2].pk), ("B", many_reports[1].pk)]
+        third = self._get(client, second.context["next_cursor"])
+        assert self._titles(third) == [("A", many_reports[0].pk)]
+        assert third.context["next_cursor"] is None
+
+        back = self._get(client, third.context["previous_cursor"])
+        assert self._titles(back) == self._titles(second)
+        assert back.context["next_cursor"]
+        front = self._get(client, back.context["previous_cursor"])
+        assert self._titles(front) == self._titles(first)
+        assert front.context["previous_cursor"] is None
+
+    def test_page_links_keep_query_params(self, many_reports, client):
+        first = client.get("/report-list/?q=report&tag=a&tag=b")
+        next_url = first.context["next_url"]
+        assert QueryDict(next_url[1:]) == QueryDict(f"q=report&tag=a&tag=b&cursor={first.context['next_cursor']}")
+        assert f'href="{escape(next_url)}"' in first.content.decode()
+
+        second = client.get(f"/report-list/{next_url}")
+        assert self._titles(second) == [("B", many_reports[2].pk), ("B", many_reports[1].pk)]
+        previous_url = second.context["previous_url"]
+        assert QueryDict(previous_url[1:]).getlist("tag") == ["a", "b"]
+        assert QueryDict(previous_url[1:])["cursor"] == second.context["previous_cursor"]
+
+    def test_visible_if(self, many_reports, django_user_model):
+        class View(ReportListView):
+            property_display = [
+                {"title": "Report", "properties": ["title", x("owner__username", visible_if="tests.view_report")]}
+            ]
+
+        request = RequestFactory().get("/report-list/")
+        request.user = django_user_model.objects.create_user(username="viewer")
+        table = View.as_view()(request).context_data["object_list_table"]
+        assert [c.path for c in table.columns] == ["title"]
+        assert len(table.rows[0].properties) == 1
+
+        request.user = django_user_model.objects.create_superuser(username="admin")
+        table = View.as_view()(request).context_data["object_list_table"]
+        assert [c.path for c in table.columns] == ["title", "owner__username"]
+
+    def test_rendered_table(self, many_reports, client):
+        html = self._get(client).content.decode()
+        assert "<th" in html and "Report title" in html
+        assert f'<a href="/reports/{many_reports[4].pk}/">D</a>' in html
+        assert "?cursor=" in html
+
+    def test_constant_queries(self, many_reports, client, django_assert_num_queries):
+        # keys, then values for the page (flat config, no instances)
+        with django_assert_num_queries(2):
+            self._get(client)
+
+    def test_invalid_cursor(self, many_reports, client):
+        assert client.get("/report-list/?cursor=not-a-cursor").status_code == 404
+
+    @pytest.mark.parametrize("key", [["x", "abc", "next"], [None, 1, "next"], ["x", "1.5", "previous"]])
+    def test_tampered_cursor(self, many_reports, client, key):
+        cursor = ReportListView().encode_cursor(*key)
+        assert client.get(f"/report-list/?cursor={cursor}").status_code == 404
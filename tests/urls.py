@@ -1,5 +1,8 @@
 from django.urls import path
 
+from django_object_detail.urls import group_fragment_path
+from tests.views import LazyReportDetailView, ReportListView, StreamingReportDetailView
+
 # Minimal URL patterns for reverse() in tests.
 
 urlpatterns = [
@@ -7,4 +10,7 @@ urlpatterns = [
     path("reports/<int:report_id>/", lambda r, report_id: None, name="report-by-id"),
     path("users/<int:pk>/", lambda r, pk: None, name="user-detail"),
     path("info/<int:pk>/", lambda r, pk: None, name="info-detail"),
+    path("streaming-reports/<int:pk>/", StreamingReportDetailView.as_view(), name="report-stream"),
+    path("report-list/", ReportListView.as_view(), name="report-list"),
+    group_fragment_path("lazy-reports/<int:pk>/groups/<int:group>/", LazyReportDetailView, name="report-group"),
 ]
@@ -0,0 +1,57 @@
+from django.views.generic import DetailView, ListView
+
+from django_object_detail.views import ObjectDetailMixin, ObjectListMixin, StreamingObjectDetailMixin
+from tests.models import Report
+
+REPORT_PROPERTY_DISPLAY = [
+    {
+        "title": "Report",
+        "properties": ["title", "owner__username", "access_users", "title_upper"],
+    },
+]
+
+
+class LazyReportDetailView(ObjectDetailMixin, DetailView):
+    model = Report
+    template_name = "django_object_detail/object_detail.html"
+    group_fragment_url_name = "report-group"
+    property_display = [
+        {
+            "title": "Report",
+            "properties": ["title"],
+        },
+        {
+            "title": "Access",
+            "lazy": True,
+            "properties": ["access_users", "title_upper"],
+        },
+    ]
+
+
+class ReportIdDetailView(LazyReportDetailView):
+    pk_url_kwarg = "report_id"
+
+
+class StreamingReportDetailView(StreamingObjectDetailMixin, DetailView):
+    model = Report
+    template_name = "test_object_detail.html"
+    property_display = [
+        {
+            "title": "Report",
+            "properties": ["title", {"path": "access_users", "stream": True, "chunk_size": 2}],
+        },
+    ]
+
+
+class ReportListView(ObjectListMixin, ListView):
+    model = Report
+    template_name = "test_object_list.html"
+    keyset_ordering = "-title"
+    keyset_page_size = 2
+    row_url_name = "report-detail"
+    property_display = [
+        {
+            "title": "Report",
+            "properties": ["title", "owner__username"],
+        },
+    ]